@@ -0,0 +1,128 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    benchmarks/bench_fingerprint.py @brief [ FILE   ] - Benchmark of computing the fingerprint.
+## @package benchmarks.bench_fingerprint    @brief [ MODULE ] - Benchmark of computing the fingerprint.
+#
+#  Synthetic versioned packages are resolved. Wall time of the first run, which resolves the env and writes
+#  the cache, and of the warm runs, which reuse the cache, are measured along with the wall time of
+#  mMeco.libs.fingerprintLib.Fingerprint.compute method. Minimum of the repeats is reported. Another checkout
+#  can be measured by `--python-path` argument to compare the results.
+#
+# @code
+#python benchmarks/bench_fingerprint.py --packages 1000 --versions 20
+#python benchmarks/bench_fingerprint.py --packages 1000 --versions 20 --python-path /path/to/another/checkout/python
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  argparse
+import  os
+import  sys
+import  time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Code, which resolves the env and prints wall time of computing the fingerprint.
+RUNNER = '''import sys
+import time
+import mMeco.libs.fingerprintLib
+compute = mMeco.libs.fingerprintLib.Fingerprint.compute
+def timedCompute(self):
+    startTime = time.time()
+    result = compute(self)
+    sys.stdout.write('SECONDS {}\\n'.format(time.time() - startTime))
+    return result
+mMeco.libs.fingerprintLib.Fingerprint.compute = timedCompute
+''' + tests.fixtureLib.RUNNER
+
+#
+## @brief Run the request and measure it.
+#
+#  @param fixture    [ tests.fixtureLib.Fixture | None | in  ] - Fixture.
+#  @param pythonPath [ str                      | None | in  ] - Absolute path of the directory, which contains mMeco package.
+#
+#  @exception RuntimeError - If the request fails.
+#
+#  @return tuple - Wall time of the run and of computing the fingerprint in seconds.
+def run(fixture, pythonPath):
+
+    startTime           = time.time()
+    returnCode, output  = fixture.run('-p p1', RUNNER, pythonPath)
+    seconds             = time.time() - startTime
+
+    if returnCode or not 'SECONDS' in output:
+        raise RuntimeError(output)
+
+    return seconds, float(output.split('SECONDS ')[1].split()[0])
+
+#
+## @brief Main.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmark of computing the fingerprint.')
+    parser.add_argument('--packages', type=int, default=1000, help='Number of versioned packages.')
+    parser.add_argument('--versions', type=int, default=20, help='Number of versions of each package.')
+    parser.add_argument('--repeats', type=int, default=5, help='Number of repeats.')
+    parser.add_argument('--python-path', default=tests.fixtureLib.PYTHON_PATH, help='Directory, which contains mMeco package.')
+    args = parser.parse_args()
+
+    fixture = tests.fixtureLib.Fixture()
+
+    try:
+        for index in range(args.packages):
+            for version in range(args.versions):
+                fixture.addPackage('master/internal', 'package{}'.format(index), '1.0.{}'.format(version))
+
+        firstRuns   = []
+        warmRuns    = []
+
+        for _ in range(args.repeats):
+
+            for fileName in os.listdir(os.path.join(fixture.root(), 'out')):
+                if fileName.endswith('.cache') or fileName.endswith('.manifest'):
+                    os.remove(os.path.join(fixture.root(), 'out', fileName))
+
+            firstRuns.append(run(fixture, args.python_path))
+            warmRuns.append(run(fixture, args.python_path))
+
+        print('{} packages x {} versions'.format(args.packages, args.versions))
+        print('first run : {:.3f} s, fingerprint {:.3f} s'.format(min(x[0] for x in firstRuns), min(x[1] for x in firstRuns)))
+        print('warm run  : {:.3f} s, fingerprint {:.3f} s'.format(min(x[0] for x in warmRuns), min(x[1] for x in warmRuns)))
+
+    finally:
+        fixture.remove()
+
+
+if __name__ == '__main__':
+    main()
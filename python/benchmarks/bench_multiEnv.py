@@ -0,0 +1,159 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    benchmarks/bench_multiEnv.py @brief [ FILE   ] - Benchmark of sourcing multi envs.
+## @package benchmarks.bench_multiEnv    @brief [ MODULE ] - Benchmark of sourcing multi envs.
+#
+#  Env of synthetic packages, each of which adds multi envs and single envs such as `<PACKAGE>_ROOT`, is written
+#  with one assignment per variable by mMeco.responses.writeRes.Response class and with one assignment per multi
+#  env as before. Both script files are sourced by `bash --rcfile`, resulting envs are compared and minimum wall
+#  time of the repeats is reported. Values are compared after removing duplicate paths, since duplicate values of
+#  a multi env are written once. Another checkout can be measured by `--python-path` argument to compare the results.
+#
+# @code
+#python benchmarks/bench_multiEnv.py --packages 300
+#python benchmarks/bench_multiEnv.py --packages 300 --singles 0
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  argparse
+import  os
+import  shutil
+import  subprocess
+import  sys
+import  time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Code, which resolves the env by writing one assignment per multi env.
+SEPARATE_RUNNER = '''import mMeco.libs.enumLib
+import mMeco.responses.writeRes
+def addMultiEnv(self, envEntry, envType):
+    if self._renderContext.displayOnly():
+        return
+    template = self._renderContext.getEnvTemplate(mMeco.libs.enumLib.EnvEntryType.kMulti)
+    self._getEnvByEnvType(envType).append(template.format(variable=envEntry.variable(), value=envEntry.value()))
+mMeco.responses.writeRes.Response._addMultiEnv = addMultiEnv
+''' + tests.fixtureLib.RUNNER
+
+## [ str ] - Body of `setEnvironment` function of the package env modules, formatted with the number of single envs.
+PACKAGE_ENV = '''    root = envEntryContainer.getPackageRootPath()
+    name = envEntryContainer.packageName().upper()
+    for index in range({0}):
+        envEntryContainer.addSingle('{{}}_ROOT{{}}'.format(name, index or ''), root)
+    for directory in ['bin', 'python', 'plugins', 'scripts']:
+        envEntryContainer.addMulti('PATH', root + '/' + directory)
+        envEntryContainer.addMulti('PYTHONPATH', root + '/' + directory)
+        envEntryContainer.addMulti('MY_PLUGIN_PATH', root + '/' + directory)'''
+
+#
+## @brief Source given script file by `bash --rcfile`.
+#
+#  @param path    [ str  | None | in  ] - Absolute path of the script file.
+#  @param repeats [ int  | None | in  ] - Number of repeats.
+#
+#  @exception N/A
+#
+#  @return tuple - Minimum wall time in seconds and the resulting env, where duplicate paths are removed.
+def source(path, repeats):
+
+    command = ['bash', '--rcfile', path, '-i', '-c', 'env -0']
+    env     = {'PATH':'/usr/bin:/bin', 'HOME':os.path.dirname(path)}
+    seconds = []
+
+    for _ in range(repeats):
+        start = time.time()
+        output = subprocess.check_output(command, env=env, stdin=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        seconds.append(time.time() - start)
+
+    env = {}
+
+    for variable in output.decode('utf-8').split('\0'):
+
+        if not '=' in variable:
+            continue
+
+        name, value = variable.split('=', 1)
+
+        paths = []
+        for _path in value.split(':'):
+            if not _path in paths:
+                paths.append(_path)
+
+        env[name] = paths
+
+    return min(seconds), env
+
+#
+## @brief Main.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmark of sourcing multi envs.')
+    parser.add_argument('--packages', type=int, default=300, help='Number of packages.')
+    parser.add_argument('--singles', type=int, default=1, help='Number of single envs of each package.')
+    parser.add_argument('--repeats', type=int, default=20, help='Number of repeats.')
+    parser.add_argument('--python-path', default=tests.fixtureLib.PYTHON_PATH, help='Directory, which contains mMeco package.')
+    args = parser.parse_args()
+
+    fixture = tests.fixtureLib.Fixture()
+
+    try:
+        for index in range(args.packages):
+            fixture.addPackage('reserved', 'package{}'.format(index), packageEnv=PACKAGE_ENV.format(args.singles))
+
+        results = {}
+
+        for name, runner in [('separate', SEPARATE_RUNNER), ('coalesced', tests.fixtureLib.RUNNER)]:
+
+            returnCode, output = fixture.run('-p p1 -ic -so', runner, args.python_path)
+            if returnCode:
+                raise RuntimeError(output)
+
+            path = os.path.join(fixture.root(), 'out', '{}.sh'.format(name))
+            shutil.copy(os.path.join(fixture.root(), 'out', 'p1_None_None.sh'), path)
+
+            seconds, env = source(path, args.repeats)
+            results[name] = env
+
+            print('{:9}: {:.4f} s, {} bytes'.format(name, seconds, os.path.getsize(path)))
+
+        if results['separate'] != results['coalesced']:
+            print('Envs differ.')
+
+    finally:
+        fixture.remove()
+
+
+if __name__ == '__main__':
+    main()
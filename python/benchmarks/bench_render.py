@@ -0,0 +1,114 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    benchmarks/bench_render.py @brief [ FILE   ] - Benchmark of rendering env entries.
+## @package benchmarks.bench_render    @brief [ MODULE ] - Benchmark of rendering env entries.
+#
+#  Synthetic packages, which add multi, single, command and script envs, are resolved and wall time of
+#  mMeco.abstract.responseAbs.Response.respond method is measured. Minimum of the repeats is reported.
+#  Another checkout can be measured by `--python-path` argument to compare the results.
+#
+# @code
+#python benchmarks/bench_render.py --entries 20000
+#python benchmarks/bench_render.py --entries 20000 --python-path /path/to/another/checkout/python
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  argparse
+import  os
+import  sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Code, which resolves the env and prints wall time of the response.
+RUNNER = '''import sys
+import time
+import mMeco.abstract.responseAbs
+respond = mMeco.abstract.responseAbs.Response.respond
+def timedRespond(self):
+    startTime = time.time()
+    result = respond(self)
+    sys.stdout.write('SECONDS {}\\n'.format(time.time() - startTime))
+    return result
+mMeco.abstract.responseAbs.Response.respond = timedRespond
+''' + tests.fixtureLib.RUNNER
+
+## [ int ] - Number of envs of each type a package adds.
+ENVS_PER_TYPE = 10
+
+## [ str ] - Body of `setEnvironment` function of the package env modules.
+PACKAGE_ENV = '''    root = envEntryContainer.getPackageRootPath()
+    name = envEntryContainer.packageName().upper()
+    for index in range({0}):
+        envEntryContainer.addMulti('PATH', '{{}}/bin{{}}'.format(root, index))
+        envEntryContainer.addSingle('{{}}_{{}}'.format(name, index), str(index))
+        envEntryContainer.addCommand('true')
+        envEntryContainer.addScript('/dev/null')'''.format(ENVS_PER_TYPE)
+
+#
+## @brief Main.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmark of rendering env entries.')
+    parser.add_argument('--entries', type=int, default=20000, help='Number of env entries.')
+    parser.add_argument('--repeats', type=int, default=5, help='Number of repeats.')
+    parser.add_argument('--python-path', default=tests.fixtureLib.PYTHON_PATH, help='Directory, which contains mMeco package.')
+    args = parser.parse_args()
+
+    fixture = tests.fixtureLib.Fixture()
+
+    try:
+        packages = max(1, args.entries // (ENVS_PER_TYPE * 4))
+
+        for index in range(packages):
+            fixture.addPackage('reserved', 'package{}'.format(index), packageEnv=PACKAGE_ENV)
+
+        seconds = []
+
+        for _ in range(args.repeats):
+
+            returnCode, output = fixture.run('-p p1 -ic -v 4', RUNNER, args.python_path)
+            if returnCode or not 'SECONDS' in output:
+                raise RuntimeError(output)
+
+            seconds.append(float(output.split('SECONDS ')[1].split()[0]))
+
+        print('{} entries: {:.1f} ms'.format(packages * ENVS_PER_TYPE * 4, min(seconds) * 1000))
+
+    finally:
+        fixture.remove()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    benchmarks/bench_resolverLib.py @brief [ FILE   ] - Benchmark of resolving package precedence.
+## @package benchmarks.bench_resolverLib    @brief [ MODULE ] - Benchmark of resolving package precedence.
+#
+#  Packages of the default layers are resolved by the pairwise removals prioritySol did before
+#  mMeco.libs.resolverLib.Resolver class and by the resolver. Results are compared and wall time is measured.
+#
+# @code
+#python benchmarks/bench_resolverLib.py --packages 5000
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  argparse
+import  copy
+import  os
+import  sys
+import  time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import  mMeco.libs.enumLib
+import  mMeco.libs.resolverLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief Remove packages of `packagesB` from `packagesA` the way prioritySol did before the resolver.
+#
+#  @param packagesA [ list of dict        | None | in  ] - Versioned packages.
+#  @param packagesB [ list of str or dict | None | in  ] - Non-versioned or versioned packages.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def removePairwise(packagesA, packagesB):
+
+    for pa in packagesB:
+        name = pa['package'] if isinstance(pa, dict) else pa
+        for pb in packagesA:
+            if name == pb['package']:
+                packagesA.pop(packagesA.index(pb))
+
+#
+## @brief Resolve by pairwise removals.
+#
+#  @param layers [ dict | None | in  ] - Keys are layer names, values are packages.
+#
+#  @exception N/A
+#
+#  @return dict - Resolved packages.
+def resolvePairwise(layers):
+
+    for scope in ['Internal', 'External']:
+        project, master = 'project{}'.format(scope), 'master{}'.format(scope)
+        removePairwise(layers[master], layers[project])
+        for nonVersioned in ['development', 'stage']:
+            removePairwise(layers[project], layers[nonVersioned])
+            removePairwise(layers[master], layers[nonVersioned])
+
+    return layers
+
+#
+## @brief Resolve by the resolver.
+#
+#  @param layers [ dict | None | in  ] - Keys are layer names, values are packages.
+#
+#  @exception N/A
+#
+#  @return dict - Resolved packages.
+def resolveLinear(layers):
+
+    scopes   = [mMeco.libs.enumLib.PackageScope.kInternal, mMeco.libs.enumLib.PackageScope.kExternal]
+    resolver = mMeco.libs.resolverLib.Resolver()
+
+    resolver.addLayer('development', layers['development'], claimScopes=scopes)
+    resolver.addLayer('stage'      , layers['stage']      , claimScopes=scopes)
+
+    for scope in scopes:
+        resolver.addLayer('project{}'.format(scope), layers['project{}'.format(scope)], claimScopes=[scope], filterScope=scope)
+        resolver.addLayer('master{}'.format(scope) , layers['master{}'.format(scope)] , claimScopes=[scope], filterScope=scope)
+
+    return resolver.resolve()
+
+#
+## @brief Create layers, consecutive layers share half of their packages.
+#
+#  @param packages [ int | None | in  ] - Number of packages of each layer.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are layer names, values are packages.
+def createLayers(packages):
+
+    layers = {}
+
+    for index, name in enumerate(['development', 'stage', 'projectInternal', 'masterInternal', 'projectExternal', 'masterExternal']):
+
+        names = ['package{}'.format(x) for x in range(index * packages // 2, index * packages // 2 + packages)]
+
+        if name in ['development', 'stage']:
+            layers[name] = names
+        else:
+            layers[name] = [{'package':x, 'versions':['1.0.0']} for x in names]
+
+    return layers
+
+#
+## @brief Main.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmark of resolving package precedence.')
+    parser.add_argument('--packages', type=int, default=5000, help='Number of packages of each layer.')
+    args = parser.parse_args()
+
+    layers  = createLayers(args.packages)
+    results = {}
+
+    for name, function in [('pairwise', resolvePairwise), ('resolver', resolveLinear)]:
+        _layers         = copy.deepcopy(layers)
+        start           = time.time()
+        results[name]   = function(_layers)
+        print('{:9}: {:8.3f} s'.format(name, time.time() - start))
+
+    for name in sorted(layers.keys()):
+        if results['pairwise'][name] != results['resolver'][name]:
+            print('Results of "{}" layer differ.'.format(name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    benchmarks/bench_scanLib.py @brief [ FILE   ] - Benchmark of listing a versioned env path.
+## @package benchmarks.bench_scanLib    @brief [ MODULE ] - Benchmark of listing a versioned env path.
+#
+#  Synthetic versioned env path is listed by `glob.glob`, `os.path.isfile` pattern used by
+#  mMeco.libs.envPathLib.EnvPath before the scanner, by mMeco.fileSystem.scanLib.Scanner class alone with the
+#  same pattern, and by mMeco.libs.packageIndexLib.PackageIndex class, which uses the scanner. File system
+#  calls are counted and wall time is measured.
+#
+#  Scanner rows compare the scanner against glob, every version is probed by both. Index rows add probing
+#  only the newest version and the index file, which are measured separately.
+#
+# @code
+#python benchmarks/bench_scanLib.py --packages 2000 --versions 20
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  argparse
+import  glob
+import  os
+import  shutil
+import  sys
+import  tempfile
+import  time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import  mMeco.fileSystem.scanLib
+import  mMeco.libs.packageIndexLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief Create a synthetic versioned env path, every version has package info module.
+#
+#  @param path     [ str | None | in  ] - Absolute path of the env path.
+#  @param packages [ int | None | in  ] - Number of packages.
+#  @param versions [ int | None | in  ] - Number of versions of each package.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def createTree(path, packages, versions):
+
+    for i in range(packages):
+        packageName = 'package{}'.format(i)
+        for j in range(versions):
+            pythonPath = os.path.join(path, packageName, '1.{}.0'.format(j), packageName, 'python', packageName)
+            os.makedirs(pythonPath)
+            open(os.path.join(pythonPath, 'packageInfoLib.py'), 'w').close()
+
+#
+## @brief List the env path the way mMeco.libs.envPathLib.EnvPath did before the scanner.
+#
+#  @param path [ str | None | in  ] - Absolute path of the env path.
+#
+#  @exception N/A
+#
+#  @return tuple - Packages and number of file system calls.
+def listWithGlob(path):
+
+    packages    = []
+    calls       = 1
+
+    for packageRootPath in glob.glob('{}/*'.format(path)):
+
+        packageName = os.path.basename(packageRootPath)
+        versions    = []
+        calls      += 1
+
+        for versionPath in glob.glob('{}/*'.format(packageRootPath)):
+
+            calls += 1
+            if os.path.isfile(os.path.join(versionPath, packageName, 'python', packageName, 'packageInfoLib.py')):
+                versions.append(os.path.basename(versionPath))
+
+        packages.append({'package':packageName, 'versions':versions})
+
+    return packages, calls
+
+#
+## @brief List the env path by scanner alone, the same way as mMeco.libs.envPathLib.EnvPath did with glob.
+#
+#  @param path       [ str  | None | in  ] - Absolute path of the env path.
+#  @param useScandir [ bool | None | in  ] - Whether to use `os.scandir`.
+#
+#  @exception N/A
+#
+#  @return tuple - Packages and counters of the scanner.
+def listWithScanner(path, useScandir):
+
+    scanner     = mMeco.fileSystem.scanLib.Scanner(useScandir)
+    packages    = []
+
+    for packageEntry in scanner.scan(path):
+
+        packageName = packageEntry.name()
+        versions    = []
+
+        if packageEntry.isDirectory():
+            for versionEntry in scanner.scan(packageEntry.path()):
+                if scanner.isFile(os.path.join(versionEntry.path(), packageName, 'python', packageName, 'packageInfoLib.py')):
+                    versions.append(versionEntry.name())
+
+        packages.append({'package':packageName, 'versions':versions})
+
+    return packages, scanner.counters()
+
+#
+## @brief List the env path by package index.
+#
+#  @param path          [ str  | None | in  ] - Absolute path of the env path.
+#  @param indexFilePath [ str  | None | in  ] - Absolute path of the index file.
+#  @param newestOnly    [ bool | None | in  ] - Whether to probe only the newest version of each package.
+#
+#  @exception N/A
+#
+#  @return tuple - Packages and counters of the scanner.
+def listWithIndex(path, indexFilePath, newestOnly):
+
+    packageIndex    = mMeco.libs.packageIndexLib.PackageIndex(path, True, indexFilePath)
+    packages        = []
+
+    for packageName in packageIndex.listPackages():
+
+        versions = []
+
+        for version in sorted(packageIndex.getPackage(packageName)['versions'].keys(),
+                              key=lambda x: [int(y) for y in x.split('.')], reverse=True):
+            if packageIndex.hasPackageInfo(packageName, version):
+                versions.append(version)
+                if newestOnly:
+                    break
+
+        packages.append({'package':packageName, 'versions':versions})
+
+    packageIndex.flush()
+
+    return packages, packageIndex.scanner().counters()
+
+#
+## @brief Measure wall time of given function.
+#
+#  @param function [ function | None | in  ] - Function.
+#  @param args     [ list     | None | in  ] - Arguments.
+#
+#  @exception N/A
+#
+#  @return tuple - Wall time in seconds and return value of the function.
+def measure(function, *args):
+
+    start   = time.time()
+    result  = function(*args)
+
+    return time.time() - start, result
+
+#
+## @brief Main.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmark of listing a versioned env path.')
+    parser.add_argument('--packages', type=int, default=2000, help='Number of packages.')
+    parser.add_argument('--versions', type=int, default=20, help='Number of versions of each package.')
+    args = parser.parse_args()
+
+    root            = tempfile.mkdtemp(prefix='mMecoBench')
+    path            = os.path.join(root, 'envPath')
+    indexFilePath   = os.path.join(root, 'index.json')
+
+    try:
+        createTree(path, args.packages, args.versions)
+
+        seconds, (globPackages, calls) = measure(listWithGlob, path)
+        print('glob                      : {:8.3f} s, {} listDirectory and stat'.format(seconds, calls))
+
+        for name, useScandir in [('scanner, listdir', False),
+                                 ('scanner, scandir', True)]:
+            seconds, (packages, counters) = measure(listWithScanner, path, useScandir)
+            assert sorted([(x['package'], sorted(x['versions'])) for x in packages]) == \
+                   sorted([(x['package'], sorted(x['versions'])) for x in globPackages])
+            print('{:26}: {:8.3f} s, {}'.format(name, seconds, ', '.join(['{} {}'.format(v, k) for k, v in sorted(counters.items())])))
+
+        for name, newestOnly, _indexFilePath in [('index, all versions', False, None),
+                                                 ('index, newest version', True, None),
+                                                 ('index file, cold', True, indexFilePath),
+                                                 ('index file, warm', True, indexFilePath)]:
+            seconds, (_, counters) = measure(listWithIndex, path, _indexFilePath, newestOnly)
+            print('{:26}: {:8.3f} s, {}'.format(name, seconds, ', '.join(['{} {}'.format(v, k) for k, v in sorted(counters.items())])))
+
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
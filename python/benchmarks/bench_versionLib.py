@@ -0,0 +1,119 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    benchmarks/bench_versionLib.py @brief [ FILE   ] - Benchmark of sorting versions.
+## @package benchmarks.bench_versionLib    @brief [ MODULE ] - Benchmark of sorting versions.
+#
+#  Distinct release versions are sorted by the list of ints key used before mMeco.fileSystem.versionLib.SemanticVersion
+#  class and by mMeco.fileSystem.versionLib.SemanticVersion.getSortKey static method. Versions, tenth of which are
+#  pre-release versions, are sorted by the sort key, with and without cached sort keys. Minimum wall time of the
+#  repeats is reported.
+#
+# @code
+#python benchmarks/bench_versionLib.py --versions 100000
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  argparse
+import  os
+import  random
+import  sys
+import  time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import  mMeco.fileSystem.versionLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief Sort by the list of ints key.
+#
+#  @param versions [ list of str | None | in  ] - Versions.
+#
+#  @exception N/A
+#
+#  @return list of str - Sorted versions.
+def sortByInts(versions):
+
+    return sorted(versions, key=lambda x: [int(y) for y in x.split('.')])
+
+#
+## @brief Sort by semantic version sort keys.
+#
+#  @param versions [ list of str | None | in  ] - Versions.
+#
+#  @exception N/A
+#
+#  @return list of str - Sorted versions.
+def sortBySortKey(versions):
+
+    return mMeco.fileSystem.versionLib.SemanticVersion.sort(versions)
+
+#
+## @brief Main.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmark of sorting versions.')
+    parser.add_argument('--versions', type=int, default=100000, help='Number of versions.')
+    parser.add_argument('--repeats', type=int, default=7, help='Number of repeats.')
+    args = parser.parse_args()
+
+    random.seed(0)
+
+    versions = set()
+    while len(versions) < args.versions:
+        versions.add('{}.{}.{}'.format(random.randint(0, 99), random.randint(0, 99), random.randint(0, 999)))
+
+    versions    = list(versions)
+    preReleases = [x + '-rc.1' if i % 10 == 0 else x for i, x in enumerate(versions)]
+    expected    = sortByInts(versions)
+
+    for name, function, _versions, clearCache in [('list of ints'               , sortByInts   , versions   , False),
+                                                  ('sort key'                   , sortBySortKey, versions   , True),
+                                                  ('sort key, pre-release, cold', sortBySortKey, preReleases, True),
+                                                  ('sort key, pre-release, warm', sortBySortKey, preReleases, False)]:
+
+        seconds = []
+
+        for _ in range(args.repeats):
+
+            if clearCache:
+                mMeco.fileSystem.versionLib.SemanticVersion.clearCache()
+
+            start = time.time()
+            result = function(_versions)
+            seconds.append(time.time() - start)
+
+        print('{:28}: {:.3f} s{}'.format(name, min(seconds), '' if _versions is preReleases or result == expected else ', result differs'))
+
+
+if __name__ == '__main__':
+    main()
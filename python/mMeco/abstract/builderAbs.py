@@ -140,42 +140,8 @@ class Builder(object):
         ## [ mMeco.libs.allLib.All ] - All.
         self._allLib = mMeco.libs.allLib.All.getInstance(**{self.NAME:self})
 
-        #
-
-        ## [ list of mMeco.libs.entryLib.EnvEntryContainer ] - Env containers.
-        self._preBuildEnvEntryContainers                = []
-
-        ## [ list of mMeco.libs.entryLib.EnvEntryContainer ] - Env containers.
-        self._postBuildEnvEntryContainers               = []
-
-        #
-
-        ## [ list of mMeco.libs.entryLib.EnvEntryContainer ] - Env containers.
-        self._reservedEnvEntryContainers                = []
-
-        #
-
-        ## [ list of mMeco.libs.entryLib.EnvEntryContainer ] - Env containers.
-        self._developmentEnvEntryContainers             = []
-
-        ## [ list of mMeco.libs.entryLib.EnvEntryContainer ] - Env containers.
-        self._stageEnvEntryContainers                   = []
-
-        #
-
-        ## [ list of mMeco.libs.entryLib.EnvEntryContainer ] - Env containers.
-        self._projectInternalEnvEntryContainers         = []
-
-        ## [ list of mMeco.libs.entryLib.EnvEntryContainer ] - Env containers.
-        self._projectExternalEnvEntryContainers         = []
-
-        #
-
-        ## [ list of mMeco.libs.entryLib.EnvEntryContainer ] - Env containers.
-        self._masterProjectInternalEnvEntryContainers   = []
-
-        ## [ list of mMeco.libs.entryLib.EnvEntryContainer ] - Env containers.
-        self._masterProjectExternalEnvEntryContainers   = []
+        ## [ dict ] - Keys are names of the layers, values are lists of env entry containers of the layers.
+        self._envEntryContainers = {}
 
     #
     # ------------------------------------------------------------------------------------------------
@@ -246,7 +212,7 @@ class Builder(object):
     #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Value.
     def preBuildEnvEntryContainers(self):
 
-        return self._preBuildEnvEntryContainers
+        return self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kPreBuild)
 
     #
     ## @brief Property.
@@ -256,7 +222,7 @@ class Builder(object):
     #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Value.
     def postBuildEnvEntryContainers(self):
 
-        return self._postBuildEnvEntryContainers
+        return self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kPostBuild)
 
     #
     ## @brief Property.
@@ -266,7 +232,7 @@ class Builder(object):
     #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Value.
     def reservedEnvEntryContainers(self):
 
-        return self._reservedEnvEntryContainers
+        return self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kReserved)
 
     #
     ## @brief Property.
@@ -276,7 +242,7 @@ class Builder(object):
     #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Value.
     def developmentEnvEntryContainers(self):
 
-        return self._developmentEnvEntryContainers
+        return self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kDevelopment)
 
     #
     ## @brief Property.
@@ -286,7 +252,7 @@ class Builder(object):
     #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Value.
     def stageEnvEntryContainers(self):
 
-        return self._stageEnvEntryContainers
+        return self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kStage)
 
     #
     ## @brief Property.
@@ -296,7 +262,7 @@ class Builder(object):
     #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Value.
     def projectInternalEnvEntryContainers(self):
 
-        return self._projectInternalEnvEntryContainers
+        return self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kProjectInternal)
 
     #
     ## @brief Property.
@@ -306,7 +272,7 @@ class Builder(object):
     #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Value.
     def projectExternalEnvEntryContainers(self):
 
-        return self._projectExternalEnvEntryContainers
+        return self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kProjectExternal)
 
     #
     ## @brief Property.
@@ -316,7 +282,7 @@ class Builder(object):
     #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Value.
     def masterProjectInternalEnvEntryContainers(self):
 
-        return self._masterProjectInternalEnvEntryContainers
+        return self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kMasterProjectInternal)
 
     #
     ## @brief Property.
@@ -326,12 +292,48 @@ class Builder(object):
     #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Value.
     def masterProjectExternalEnvEntryContainers(self):
 
-        return self._masterProjectExternalEnvEntryContainers
+        return self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kMasterProjectExternal)
 
     #
     # ------------------------------------------------------------------------------------------------
     # PUBLIC METHODS
     # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get env entry containers of the layer by given name, which are created on first access.
+    #
+    #  @param name [ str | None | in  ] - Name of the layer, such as a value from mMeco.libs.enumLib.EnvType enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Env entry containers.
+    def getEnvEntryContainers(self, name):
+
+        return self._envEntryContainers.setdefault(name, [])
+
+    #
+    ## @brief Sort env entry containers of the layer by given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the layer, such as a value from mMeco.libs.enumLib.EnvType enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def sortEnvEntryContainers(self, name):
+
+        self.getEnvEntryContainers(name).sort(key=lambda x: x.packageName())
+
+    #
+    ## @brief Display env entry containers of the layer by given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the layer, such as a value from mMeco.libs.enumLib.EnvType enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def displayEnvEntryContainers(self, name):
+
+        self._displayEnvEntryContainers(self.getEnvEntryContainers(name))
+
     #
     ## @brief Sort env entry containers.
     #
@@ -340,8 +342,7 @@ class Builder(object):
     #  @return None - None.
     def sortReservedEnvEntryContainers(self):
 
-        if self._reservedEnvEntryContainers:
-            self._reservedEnvEntryContainers.sort(key=lambda x: x.packageName())
+        self.sortEnvEntryContainers(mMeco.libs.enumLib.EnvType.kReserved)
 
     #
     ## @brief Sort env entry containers.
@@ -351,8 +352,7 @@ class Builder(object):
     #  @return None - None.
     def sortDevelopmentEnvEntryContainers(self):
 
-        if self._developmentEnvEntryContainers:
-            self._developmentEnvEntryContainers.sort(key=lambda x: x.packageName())
+        self.sortEnvEntryContainers(mMeco.libs.enumLib.EnvType.kDevelopment)
 
     #
     ## @brief Sort env entry containers.
@@ -362,8 +362,7 @@ class Builder(object):
     #  @return None - None.
     def sortStageEnvEntryContainers(self):
 
-        if self._stageEnvEntryContainers:
-            self._stageEnvEntryContainers.sort(key=lambda x: x.packageName())
+        self.sortEnvEntryContainers(mMeco.libs.enumLib.EnvType.kStage)
 
     #
     ## @brief Sort env entry containers.
@@ -373,8 +372,7 @@ class Builder(object):
     #  @return None - None.
     def sortProjectInternalEnvEntryContainers(self):
 
-        if self._projectInternalEnvEntryContainers:
-            self._projectInternalEnvEntryContainers.sort(key=lambda x: x.packageName())
+        self.sortEnvEntryContainers(mMeco.libs.enumLib.EnvType.kProjectInternal)
 
     #
     ## @brief Sort env entry containers.
@@ -384,8 +382,7 @@ class Builder(object):
     #  @return None - None.
     def sortProjectExternalEnvEntryContainers(self):
 
-        if self._projectExternalEnvEntryContainers:
-            self._projectExternalEnvEntryContainers.sort(key=lambda x: x.packageName())
+        self.sortEnvEntryContainers(mMeco.libs.enumLib.EnvType.kProjectExternal)
 
     #
     ## @brief Sort env entry containers.
@@ -395,8 +392,7 @@ class Builder(object):
     #  @return None - None.
     def sortMasterProjectInternalEnvEntryContainers(self):
 
-        if self._masterProjectInternalEnvEntryContainers:
-            self._masterProjectInternalEnvEntryContainers.sort(key=lambda x: x.packageName())
+        self.sortEnvEntryContainers(mMeco.libs.enumLib.EnvType.kMasterProjectInternal)
 
     #
     ## @brief Sort env entry containers.
@@ -406,8 +402,7 @@ class Builder(object):
     #  @return None - None.
     def sortMasterProjectExternalEnvEntryContainers(self):
 
-        if self._masterProjectExternalEnvEntryContainers:
-            self._masterProjectExternalEnvEntryContainers.sort(key=lambda x: x.packageName())
+        self.sortEnvEntryContainers(mMeco.libs.enumLib.EnvType.kMasterProjectExternal)
 
     #
     ## @brief Display pre build env envEntry container.
@@ -417,7 +412,7 @@ class Builder(object):
     #  @return None - None.
     def displayPreBuildEnvEntryContainers(self):
 
-        self._displayEnvEntryContainers(self._preBuildEnvEntryContainers)
+        self.displayEnvEntryContainers(mMeco.libs.enumLib.EnvType.kPreBuild)
 
     #
     ## @brief Display post build env envEntry container.
@@ -427,7 +422,7 @@ class Builder(object):
     #  @return None - None.
     def displayPostBuildEnvEntryContainers(self):
 
-        self._displayEnvEntryContainers(self._postBuildEnvEntryContainers)
+        self.displayEnvEntryContainers(mMeco.libs.enumLib.EnvType.kPostBuild)
 
     #
     ## @brief Display reserved env envEntry container.
@@ -437,7 +432,7 @@ class Builder(object):
     #  @return None - None.
     def displayReservedEnvEntryContainers(self):
 
-        self._displayEnvEntryContainers(self._reservedEnvEntryContainers)
+        self.displayEnvEntryContainers(mMeco.libs.enumLib.EnvType.kReserved)
 
     #
     ## @brief Display development env envEntry container.
@@ -447,7 +442,7 @@ class Builder(object):
     #  @return None - None.
     def displayDevelopmentEnvEntryContainers(self):
 
-        self._displayEnvEntryContainers(self._developmentEnvEntryContainers)
+        self.displayEnvEntryContainers(mMeco.libs.enumLib.EnvType.kDevelopment)
 
     #
     ## @brief Display stage env envEntry container.
@@ -457,7 +452,7 @@ class Builder(object):
     #  @return None - None.
     def displayStageEnvEntryContainers(self):
 
-        self._displayEnvEntryContainers(self._stageEnvEntryContainers)
+        self.displayEnvEntryContainers(mMeco.libs.enumLib.EnvType.kStage)
 
     #
     ## @brief Display project internal env envEntry container.
@@ -467,7 +462,7 @@ class Builder(object):
     #  @return None - None.
     def displayProjectInternalEnvEntryContainers(self):
 
-        self._displayEnvEntryContainers(self._projectInternalEnvEntryContainers)
+        self.displayEnvEntryContainers(mMeco.libs.enumLib.EnvType.kProjectInternal)
 
     #
     ## @brief Display project external env envEntry container.
@@ -477,7 +472,7 @@ class Builder(object):
     #  @return None - None.
     def displayProjectExternalEnvEntryContainers(self):
 
-        self._displayEnvEntryContainers(self._projectExternalEnvEntryContainers)
+        self.displayEnvEntryContainers(mMeco.libs.enumLib.EnvType.kProjectExternal)
 
     #
     ## @brief Display master project internal env envEntry container.
@@ -487,7 +482,7 @@ class Builder(object):
     #  @return None - None.
     def displayMasterProjectInternalEnvEntryContainers(self):
 
-        self._displayEnvEntryContainers(self._masterProjectInternalEnvEntryContainers)
+        self.displayEnvEntryContainers(mMeco.libs.enumLib.EnvType.kMasterProjectInternal)
 
     #
     ## @brief Display master project external env envEntry container.
@@ -497,7 +492,7 @@ class Builder(object):
     #  @return None - None.
     def displayMasterProjectExternalEnvEntryContainers(self):
 
-        self._displayEnvEntryContainers(self._masterProjectExternalEnvEntryContainers)
+        self.displayEnvEntryContainers(mMeco.libs.enumLib.EnvType.kMasterProjectExternal)
 
     #
     ## @brief Build.
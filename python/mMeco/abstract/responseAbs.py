@@ -144,154 +144,44 @@ class Response(object):
         ## [ list of str ] - Script file start.
         self._scriptFileStartEnv            = []
 
-        ## [ list of str ] - Display member.
-        self._preBuiltDisplay               = []
-        ## [ list of str ] - Env member.
-        self._preBuiltEnv                   = []
-
-        ## [ list of str ] - Display member.
-        self._reservedDisplay               = []
-        ## [ list of str ] - Env member.
-        self._reservedEnv                   = []
-
-        ## [ list of str ] - Display member.
-        self._developmentDisplay            = []
-        ## [ list of str ] - Env member.
-        self._developmentEnv                = []
-
-        ## [ list of str ] - Display member.
-        self._stageDisplay                  = []
-        ## [ list of str ] - Env member.
-        self._stageEnv                      = []
-
-        ## [ list of str ] - Display member.
-        self._projectInternalDisplay        = []
-        ## [ list of str ] - Env member.
-        self._projectInternalEnv            = []
-
-        ## [ list of str ] - Display member.
-        self._projectExternalDisplay        = []
-        ## [ list of str ] - Env member.
-        self._projectExternalEnv            = []
-
-        ## [ list of str ] - Display member.
-        self._masterProjectInternalDisplay  = []
-        ## [ list of str ] - Env member.
-        self._masterProjectInternalEnv      = []
-
-        ## [ list of str ] - Display member.
-        self._masterProjectExternalDisplay  = []
-        ## [ list of str ] - Env member.
-        self._masterProjectExternalEnv      = []
-
-        ## [ list of str ] - Display member.
-        self._postBuiltDisplay              = []
-        ## [ list of str ] - Env member.
-        self._postBuiltEnv                  = []
-
-        ## [ list of str ] - Display member.
-        self._envDisplay                    = []
-        ## [ list of str ] - Env member.
-        self._envEnv                        = []
-
-        ## [ list of str ] - Display member.
-        self._infoDisplay                   = []
-
-        ## [ list of str ] - Display member.
-        self._productInfoDisplay            = []
-
         ## [ list of str ] - Script file end.
         self._scriptFileEndEnv              = []
-        
+
+        #
+
+        ## [ dict ] - Keys are env types or names of the layers, values are lists of env lines.
+        self._envs                          = {}
+
+        ## [ dict ] - Keys are env types or names of the layers, values are lists of display lines.
+        self._displays                      = {}
+
     #
     # ------------------------------------------------------------------------------------------------
     # PROTECTED METHODS
     # ------------------------------------------------------------------------------------------------
     #
-    ## @brief Get env member of the class by given env type.
+    ## @brief Get env lines by given env type, which are created on first access.
     #
-    #  @param envType [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class.
+    #  @param envType [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
     #
     #  @exception N/A
     #
-    #  @return list - Env member of this class that represents given `envType`.
+    #  @return list of str - Env lines of given `envType`.
     def _getEnvByEnvType(self, envType):
 
-        if envType == mMeco.libs.enumLib.EnvType.kReserved:
-            return self._reservedEnv
-
-        elif envType == mMeco.libs.enumLib.EnvType.kDevelopment:
-            return self._developmentEnv
-
-        elif envType == mMeco.libs.enumLib.EnvType.kStage:
-            return self._stageEnv
-
-        elif envType == mMeco.libs.enumLib.EnvType.kProjectInternal:
-            return self._projectInternalEnv
-
-        elif envType == mMeco.libs.enumLib.EnvType.kProjectExternal:
-            return self._projectExternalEnv
-
-        elif envType == mMeco.libs.enumLib.EnvType.kMasterProjectInternal:
-            return self._masterProjectInternalEnv
-
-        elif envType == mMeco.libs.enumLib.EnvType.kMasterProjectExternal:
-            return self._masterProjectExternalEnv
-
-        elif envType == mMeco.libs.enumLib.EnvType.kPreBuild:
-            return self._preBuiltEnv
-
-        elif envType == mMeco.libs.enumLib.EnvType.kPostBuild:
-            return self._postBuiltEnv
-
-        elif envType == mMeco.libs.enumLib.EnvType.kEnv:
-            return self._envEnv
+        return self._envs.setdefault(envType, [])
 
     #
-    ## @brief Get display member of the class by given env type.
+    ## @brief Get display lines by given env type, which are created on first access.
     #
-    #  @param envType [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class.
+    #  @param envType [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
     #
     #  @exception N/A
     #
-    #  @return list - Display member of this class that represents given `envType`.
+    #  @return list of str - Display lines of given `envType`.
     def _getDisplayByEnvType(self, envType):
 
-        if envType == mMeco.libs.enumLib.EnvType.kReserved:
-            return self._reservedDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kDevelopment:
-            return self._developmentDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kStage:
-            return self._stageDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kProjectInternal:
-            return self._projectInternalDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kProjectExternal:
-            return self._projectExternalDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kMasterProjectInternal:
-            return self._masterProjectInternalDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kMasterProjectExternal:
-            return self._masterProjectExternalDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kPreBuild:
-            return self._preBuiltDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kPostBuild:
-            return self._postBuiltDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kEnv:
-            return self._envDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kInfo:
-            return self._infoDisplay
-
-        elif envType == mMeco.libs.enumLib.EnvType.kProductInfo:
-            return self._productInfoDisplay
+        return self._displays.setdefault(envType, [])
 
     #
     ## @brief Callback which will be invoked before mMeco.abstract.responsesAbs.Response._respond method is invoked.
@@ -141,61 +141,51 @@ class Solver(object):
 
         #
 
-        if self._allLib.settingsOperator().reservedPackagesPath():
-            ## [ list of mMeco.libs.envPathLib.EnvPath ] - Reserved env path.
-            self._reservedEnvPath = mMeco.libs.envPathLib.EnvPath(self._allLib.settingsOperator().reservedPackagesPath(),
-                                                                  mMeco.libs.enumLib.EnvType.kReserved)
-        else:
-            self._reservedEnvPath = None
+        ## [ list of mMeco.libs.envPathLib.EnvPath ] - Env paths of the layers in precedence order.
+        self._envPaths = []
 
-        #
-
-        if self._allLib.settingsOperator().developmentPackagesPath():
-            ## [ list of mMeco.libs.envPathLib.EnvPath ] - Development env path.
-            self._developmentEnvPath = mMeco.libs.envPathLib.EnvPath(self._allLib.settingsOperator().developmentPackagesPath(),
-                                                                     mMeco.libs.enumLib.EnvType.kDevelopment)
-        else:
-            self._developmentEnvPath = None
+        for layer in self._allLib.layerStack().layers():
+            self._envPaths.append(mMeco.libs.envPathLib.EnvPath(layer.path(),
+                                                                layer.name(),
+                                                                layer.isVersioned()))
 
         #
 
-        if self._allLib.settingsOperator().stagePackagesPath():
-            ## [ list of mMeco.libs.envPathLib.EnvPath ] - Stage env path.
-            self._stageEnvPath = mMeco.libs.envPathLib.EnvPath(self._allLib.settingsOperator().stagePackagesPath(),
-                                                               mMeco.libs.enumLib.EnvType.kStage)
-        else:
-            self._stageEnvPath = None
+        ## [ mMeco.libs.envPathLib.EnvPath ] - Reserved env path.
+        self._reservedEnvPath               = self.getEnvPath(mMeco.libs.enumLib.EnvType.kReserved)
 
-        #
+        ## [ mMeco.libs.envPathLib.EnvPath ] - Development env path.
+        self._developmentEnvPath            = self.getEnvPath(mMeco.libs.enumLib.EnvType.kDevelopment)
 
-        if self._allLib.settingsOperator().projectInternalPackagesPath():
-            ## [ list of mMeco.libs.envPathLib.EnvPath ] - Project internal env path.
-            self._projectInternalEnvPath = mMeco.libs.envPathLib.EnvPath(self._allLib.settingsOperator().projectInternalPackagesPath(),
-                                                                         mMeco.libs.enumLib.EnvType.kProjectInternal)
-        else:
-            self._projectInternalEnvPath = None
+        ## [ mMeco.libs.envPathLib.EnvPath ] - Stage env path.
+        self._stageEnvPath                  = self.getEnvPath(mMeco.libs.enumLib.EnvType.kStage)
 
-        if self._allLib.settingsOperator().projectExternalPackagesPath():
-            ## [ list of mMeco.libs.envPathLib.EnvPath ] - Project external env path.
-            self._projectExternalEnvPath = mMeco.libs.envPathLib.EnvPath(self._allLib.settingsOperator().projectExternalPackagesPath(),
-                                                                         mMeco.libs.enumLib.EnvType.kProjectExternal)
-        else:
-            self._projectExternalEnvPath = None
+        ## [ mMeco.libs.envPathLib.EnvPath ] - Project internal env path.
+        self._projectInternalEnvPath        = self.getEnvPath(mMeco.libs.enumLib.EnvType.kProjectInternal)
 
-        #
+        ## [ mMeco.libs.envPathLib.EnvPath ] - Project external env path.
+        self._projectExternalEnvPath        = self.getEnvPath(mMeco.libs.enumLib.EnvType.kProjectExternal)
 
-        ## [ list of mMeco.libs.envPathLib.EnvPath ] - Master project internal env path.
-        self._masterProjectInternalEnvPath  = mMeco.libs.envPathLib.EnvPath(self._allLib.settingsOperator().masterProjectInternalPackagesPath(),
-                                                                            mMeco.libs.enumLib.EnvType.kMasterProjectInternal)
+        ## [ mMeco.libs.envPathLib.EnvPath ] - Master project internal env path.
+        self._masterProjectInternalEnvPath  = self.getEnvPath(mMeco.libs.enumLib.EnvType.kMasterProjectInternal)
 
-        ## [ list of mMeco.libs.envPathLib.EnvPath ] - Master project external env path.
-        self._masterProjectExternalEnvPath  = mMeco.libs.envPathLib.EnvPath(self._allLib.settingsOperator().masterProjectExternalPackagesPath(),
-                                                                            mMeco.libs.enumLib.EnvType.kMasterProjectExternal)
+        ## [ mMeco.libs.envPathLib.EnvPath ] - Master project external env path.
+        self._masterProjectExternalEnvPath  = self.getEnvPath(mMeco.libs.enumLib.EnvType.kMasterProjectExternal)
 
     #
     # ------------------------------------------------------------------------------------------------
     # PROPERTY METHODS
     # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mMeco.libs.envPathLib.EnvPath - Value.
+    def envPaths(self):
+
+        return self._envPaths
+
     #
     ## @brief Property.
     #
@@ -304,6 +294,23 @@ class Solver(object):
     # ------------------------------------------------------------------------------------------------
     # PUBLIC METHODS
     # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get env path of the layer by given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the layer, such as a value from mMeco.libs.enumLib.EnvType enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.envPathLib.EnvPath - Env path.
+    #  @return None                          - If the layer doesn't exist.
+    def getEnvPath(self, name):
+
+        for envPath in self._envPaths:
+            if envPath.envType() == name:
+                return envPath
+
+        return None
+
     #
     ## @brief Solve.
     #
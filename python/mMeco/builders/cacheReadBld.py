@@ -25,10 +25,10 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
-from    sys import stdout
-
 import  mMeco.abstract.builderAbs
 
+import  mMeco.libs.enumLib
+
 
 #
 #-----------------------------------------------------------------------------------------------------
@@ -58,14 +58,56 @@ class Builder(mMeco.abstract.builderAbs.Builder):
 
         mMeco.abstract.builderAbs.Builder.__dict__['__init__'](self)
 
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Callback which will be invoked before mMeco.abstract.buildersAbs.Builder._build method is invoked.
+    #
+    #  @exception IOError    - If cache file doesn't exist.
+    #  @exception ValueError - If cache file is not compatible with this version of meco.
+    #
+    #  @return None - None.
+    def _preBuild(self):
+
+        if self._allLib.request().ignorePre():
+            return
+
+        name = mMeco.libs.enumLib.EnvType.kPreBuild
+
+        self.getEnvEntryContainers(name).extend(self._allLib.cache().getEnvEntryContainers(name))
+
     #
     ## @brief Build.
     #
-    #  @exception N/A
+    #  Env entry containers are read from the cache file, `packageEnvLib` modules of the packages aren't invoked.
+    #
+    #  @exception IOError    - If cache file doesn't exist.
+    #  @exception ValueError - If cache file is not compatible with this version of meco.
     #
     #  @return bool - Result.
     def _build(self):
 
-        stdout.write('Builder: {}\n'.format(self.NAME))
+        cache = self._allLib.cache()
+
+        for name in self._allLib.layerStack().names():
+            self.getEnvEntryContainers(name).extend(cache.getEnvEntryContainers(name))
 
         return True
+
+    #
+    ## @brief Callback which will be invoked after mMeco.abstract.buildersAbs.Builder._build method is invoked.
+    #
+    #  @exception IOError    - If cache file doesn't exist.
+    #  @exception ValueError - If cache file is not compatible with this version of meco.
+    #
+    #  @return None - None.
+    def _postBuild(self):
+
+        if self._allLib.request().ignorePost():
+            return
+
+        name = mMeco.libs.enumLib.EnvType.kPostBuild
+
+        self.getEnvEntryContainers(name).extend(self._allLib.cache().getEnvEntryContainers(name))
@@ -25,12 +25,13 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
-import os
+import mMeco.core.threadPoolLib
 
 import mMeco.abstract.builderAbs
 
 import mMeco.libs.entryLib
 import mMeco.libs.enumLib
+import mMeco.libs.packageEnvCacheLib
 
 import mMeco.operators.packageEnvOpt
 
@@ -77,46 +78,34 @@ class Builder(mMeco.abstract.builderAbs.Builder):
         globalEnvClassName  = 'Package'
         folderName          = ''
         version             = ''
+        appFilePath         = None
 
         if appFileOperator:
             globalEnvClassName  = appFileOperator.globalEnvClassName()
             folderName          = appFileOperator.folderName()
             version             = appFileOperator.version()
-
-        packageGlobalEnvClass = self._allLib.packageGlobalEnvOperator().getClass(globalEnvClassName)
-        if not packageGlobalEnvClass:
+            appFilePath         = appFileOperator.path()
+
+        # Rules are compiled once per run, see mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnvRules
+        rules = self._allLib.packageGlobalEnvOperator().getRules(globalEnvClassName,
+                                                                 folderName,
+                                                                 version,
+                                                                 appFilePath)
+        if not rules:
             self._allLib.logger().addWarning('Package global env settings doesn\'t exist: {}'.format(globalEnvClassName))
             return
 
-        for attr in packageGlobalEnvClass.attributes():
-
-            for value in attr['value']:
-
-                if 'FOLDER_NAME' in value and not folderName:
-                    raise ValueError('App file must have "folderName" key for this configuration: {}'.format(appFileOperator.path()))
-                else:
-                    value = value.replace('FOLDER_NAME', folderName)
-
-                if 'VERSION' in value and not appFileOperator:
-                    raise ValueError('App file must have "version" key for this configuration: {}'.format(appFileOperator.path()))
-                else:
-                    value = value.replace('VERSION', version)
+        for variable, path in rules.match(packageEnvContainer.getPackageRootPath(), self._allLib.statCache()):
 
-                path = os.path.join(packageEnvContainer.getPackageRootPath(),
-                                    value)
-
-                if not os.path.isdir(path):
-                    continue
-
-                packageEnvContainer.addMulti(attr['name'],
-                                             path)
+            packageEnvContainer.addMulti(variable,
+                                         path)
 
     #
     ## @brief Build packages for given `envType`.
     #
     #  @param path     [ str                           | None | in  ] - Env path, where the packages are
     #  @param packages [ list of dicts or list of str  | None | in  ] - Versioned or non-versioned packages.
-    #  @param envType  [ enum                          | None | in  ] - Env type from mMeco.libs.enumLib.EnvType enum class.
+    #  @param envType  [ enum                          | None | in  ] - Env type from mMeco.libs.enumLib.EnvType enum class or name of a layer.
     #
     #  @exception N/A
     #
@@ -128,60 +117,107 @@ class Builder(mMeco.abstract.builderAbs.Builder):
 
         packageEnvOperator = mMeco.operators.packageEnvOpt.PackageEnvOperator()
 
-        for package in packages:
+        packageEnvCache    = self._getPackageEnvCache(path, envType)
+
+        # Packages are built in a thread pool if `--build-workers` flag is provided, containers are collected
+        # in the order of the packages regardless of the order the builds finish.
+        packageEnvEntryContainers = mMeco.core.threadPoolLib.mapInOrder(lambda x: self._buildPackage(path,
+                                                                                                     x,
+                                                                                                     packageEnvOperator,
+                                                                                                     packageEnvCache),
+                                                                        packages,
+                                                                        self._allLib.request().buildWorkers())
 
-            packageEnvEntryContainer = None
+        self.getEnvEntryContainers(envType).extend([x for x in packageEnvEntryContainers if x])
 
-            if isinstance(package, dict) and package['versions']:
-                # Versioned package
-                packageEnvEntryContainer = mMeco.libs.entryLib.EnvEntryContainer(containerType=mMeco.libs.enumLib.EnvEntryContainerType.kPackage,
-                                                                                 path=path,
-                                                                                 packageName=package['package'],
-                                                                                 version=package['versions'][0])
-            else:
-                # NonVersioned package
-                packageEnvEntryContainer = mMeco.libs.entryLib.EnvEntryContainer(containerType=mMeco.libs.enumLib.EnvEntryContainerType.kPackage,
-                                                                                 path=path,
-                                                                                 packageName=package)
+        if packageEnvCache:
+            packageEnvCache.flush()
+
+    #
+    ## @brief Build given package.
+    #
+    #  This method can be invoked from multiple threads at the same time for different packages.
+    #
+    #  @param path               [ str                                                | None | in  ] - Env path, where the package is.
+    #  @param package            [ dict or str                                        | None | in  ] - Versioned or non-versioned package.
+    #  @param packageEnvOperator [ mMeco.operators.packageEnvOpt.PackageEnvOperator   | None | in  ] - Package env operator.
+    #  @param packageEnvCache    [ mMeco.libs.packageEnvCacheLib.PackageEnvCache      | None | in  ] - Package env cache.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.entryLib.EnvEntryContainer - Env entry container of the package.
+    #  @return None                                  - If the package shouldn't be initialized.
+    def _buildPackage(self, path, package, packageEnvOperator, packageEnvCache):
+
+        packageEnvEntryContainer = None
+
+        if isinstance(package, dict) and package['versions']:
+            # Versioned package
+            packageEnvEntryContainer = mMeco.libs.entryLib.EnvEntryContainer(containerType=mMeco.libs.enumLib.EnvEntryContainerType.kPackage,
+                                                                             path=path,
+                                                                             packageName=package['package'],
+                                                                             version=package['versions'][0])
+        else:
+            # NonVersioned package
+            packageEnvEntryContainer = mMeco.libs.entryLib.EnvEntryContainer(containerType=mMeco.libs.enumLib.EnvEntryContainerType.kPackage,
+                                                                             path=path,
+                                                                             packageName=package)
 
-            #
+        #
 
-            # Build env based on package env module
-            if not packageEnvOperator.invoke(packageEnvEntryContainer):
-                continue
+        # Replay env built by a previous execution
+        if packageEnvCache and packageEnvCache.has(packageEnvEntryContainer):
+            return packageEnvCache.get(packageEnvEntryContainer)
 
-            # Build env based on package global env
-            self._buildPackageByPackageGlobalEnv(packageEnvEntryContainer)
+        # Build env based on package env module
+        if not packageEnvOperator.invoke(packageEnvEntryContainer):
+            # Timeouts aren't cached, the package is retried by the next execution
+            if packageEnvCache and not packageEnvOperator.hasTimedOut(packageEnvEntryContainer):
+                packageEnvCache.set(packageEnvEntryContainer, isInitialized=False)
+            return None
 
-            # Build env based on package global env app
-            if self._allLib.settingsOperator().appFilePath():
-                self._buildPackageByPackageGlobalEnv(packageEnvEntryContainer,
-                                                     self._allLib.appFileOperator())
+        # Build env based on package global env
+        self._buildPackageByPackageGlobalEnv(packageEnvEntryContainer)
 
-            #
+        # Build env based on package global env app
+        if self._allLib.settingsOperator().appFilePath():
+            self._buildPackageByPackageGlobalEnv(packageEnvEntryContainer,
+                                                 self._allLib.appFileOperator())
 
-            packageEnvEntryContainer.sort()
+        #
 
-            if envType == mMeco.libs.enumLib.EnvType.kReserved:
-                self._reservedEnvEntryContainers.append(packageEnvEntryContainer)
+        packageEnvEntryContainer.sort()
 
-            elif envType == mMeco.libs.enumLib.EnvType.kDevelopment:
-                self._developmentEnvEntryContainers.append(packageEnvEntryContainer)
+        if packageEnvCache:
+            packageEnvCache.set(packageEnvEntryContainer)
 
-            elif envType == mMeco.libs.enumLib.EnvType.kStage:
-                self._stageEnvEntryContainers.append(packageEnvEntryContainer)
+        return packageEnvEntryContainer
 
-            elif envType == mMeco.libs.enumLib.EnvType.kProjectInternal:
-                self._projectInternalEnvEntryContainers.append(packageEnvEntryContainer)
+    #
+    ## @brief Get package env cache for given env path.
+    #
+    #  Only env entry containers of versioned packages are cached, since non-versioned packages are edited in place.
+    #  Package env cache isn't used if `--ignore-cache` flag is provided.
+    #
+    #  @param path    [ str  | None | in  ] - Env path.
+    #  @param envType [ enum | None | in  ] - Env type from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.packageEnvCacheLib.PackageEnvCache - Package env cache.
+    #  @return None                                          - If package env cache isn't used for the env path.
+    def _getPackageEnvCache(self, path, envType):
 
-            elif envType == mMeco.libs.enumLib.EnvType.kProjectExternal:
-                self._projectExternalEnvEntryContainers.append(packageEnvEntryContainer)
+        layer = self._allLib.layerStack().getByName(envType)
+        if not layer or not layer.isVersioned():
+            return None
 
-            elif envType == mMeco.libs.enumLib.EnvType.kMasterProjectInternal:
-                self._masterProjectInternalEnvEntryContainers.append(packageEnvEntryContainer)
+        if self._allLib.request().ignoreCache() or not self._allLib.settingsOperator().cacheDirectoryPath():
+            return None
 
-            elif envType == mMeco.libs.enumLib.EnvType.kMasterProjectExternal:
-                self._masterProjectExternalEnvEntryContainers.append(packageEnvEntryContainer)
+        return mMeco.libs.packageEnvCacheLib.PackageEnvCache(path,
+                                                             mMeco.libs.packageEnvCacheLib.PackageEnvCache.getCacheFilePath(self._allLib.settingsOperator().cacheDirectoryPath(),
+                                                                                                                            path))
 
     #
     ## @brief Callback which will be invoked before mMeco.abstract.buildersAbs.Builder._build method is invoked.
@@ -196,11 +232,11 @@ class Builder(mMeco.abstract.builderAbs.Builder):
 
         preBuildContainer = mMeco.libs.entryLib.EnvEntryContainer(containerType=mMeco.libs.enumLib.EnvEntryContainerType.kPreBuild)
 
-        self._preBuildEnvEntryContainers.append(preBuildContainer)
+        self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kPreBuild).append(preBuildContainer)
 
         self._allLib.callbackOperator().invokePrePostBuild('getPreBuild', preBuildContainer)
 
-        self._preBuildEnvEntryContainers.sort()
+        self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kPreBuild).sort()
 
     #
     ## @brief Build.
@@ -210,56 +246,13 @@ class Builder(mMeco.abstract.builderAbs.Builder):
     #  @return bool - Result.
     def _build(self):
 
-        # Reserved
-        if self._allLib.solver().reservedEnvPath():
-            self._buildPackages(self._allLib.settingsOperator().reservedPackagesPath(),
-                                self._allLib.solver().reservedEnvPath().packages(),
-                                mMeco.libs.enumLib.EnvType.kReserved)
-            self.sortReservedEnvEntryContainers()
-
-        # Development
-        if self._allLib.solver().developmentEnvPath():
-            self._buildPackages(self._allLib.settingsOperator().developmentPackagesPath(),
-                                self._allLib.solver().developmentEnvPath().packages(),
-                                mMeco.libs.enumLib.EnvType.kDevelopment)
-            self.sortDevelopmentEnvEntryContainers()
-
-        # Stage
-        if self._allLib.solver().stageEnvPath():
-            self._buildPackages(self._allLib.settingsOperator().stagePackagesPath(),
-                                self._allLib.solver().stageEnvPath().packages(),
-                                mMeco.libs.enumLib.EnvType.kStage)
-            self.sortStageEnvEntryContainers()
-
-        #
-
-        # Project
-        if self._allLib.solver().projectInternalEnvPath():
-            self._buildPackages(self._allLib.settingsOperator().projectInternalPackagesPath(),
-                                self._allLib.solver().projectInternalEnvPath().packages(),
-                                mMeco.libs.enumLib.EnvType.kProjectInternal)
-            self.sortProjectInternalEnvEntryContainers()
-
-        if self._allLib.solver().projectExternalEnvPath():
-            self._buildPackages(self._allLib.settingsOperator().projectExternalPackagesPath(),
-                                self._allLib.solver().projectExternalEnvPath().packages(),
-                                mMeco.libs.enumLib.EnvType.kProjectExternal)
-            self.sortProjectExternalEnvEntryContainers()
-
-        #
+        for envPath in self._allLib.solver().envPaths():
 
-        # Master Project
-        if self._allLib.solver().masterProjectInternalEnvPath():
-            self._buildPackages(self._allLib.settingsOperator().masterProjectInternalPackagesPath(),
-                                self._allLib.solver().masterProjectInternalEnvPath().packages(),
-                                mMeco.libs.enumLib.EnvType.kMasterProjectInternal)
-            self.sortMasterProjectInternalEnvEntryContainers()
+            self._buildPackages(envPath.path(),
+                                envPath.packages(),
+                                envPath.envType())
 
-        if self._allLib.solver().masterProjectExternalEnvPath():
-            self._buildPackages(self._allLib.settingsOperator().masterProjectExternalPackagesPath(),
-                                self._allLib.solver().masterProjectExternalEnvPath().packages(),
-                                mMeco.libs.enumLib.EnvType.kMasterProjectExternal)
-            self.sortMasterProjectExternalEnvEntryContainers()
+            self.sortEnvEntryContainers(envPath.envType())
 
         return True
 
@@ -275,8 +268,8 @@ class Builder(mMeco.abstract.builderAbs.Builder):
             return
 
         postBuildContainer = mMeco.libs.entryLib.EnvEntryContainer(containerType=mMeco.libs.enumLib.EnvEntryContainerType.kPostBuild)
-        self._postBuildEnvEntryContainers.append(postBuildContainer)
+        self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kPostBuild).append(postBuildContainer)
 
         self._allLib.callbackOperator().invokePrePostBuild('getPostBuild', postBuildContainer)
 
-        self._postBuildEnvEntryContainers.sort()
+        self.getEnvEntryContainers(mMeco.libs.enumLib.EnvType.kPostBuild).sort()
@@ -26,10 +26,13 @@
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
 import os
+import threading
 
 import mMeco.core.displayLib
 import mMeco.core.dateTimeLib
 
+import mMeco.fileSystem.fileLib
+
 
 #
 #-----------------------------------------------------------------------------------------------------
@@ -155,6 +158,9 @@ class Log(LogType):
 
 #
 ## @brief [ CLASS ] - Logger.
+#
+#  Log file is append only, each write appends the logs that haven't been written yet with a single write call,
+#  so concurrent invocations sharing a log file don't truncate each other's logs.
 class Logger(mMeco.core.displayLib.Display):
     #
     # ------------------------------------------------------------------------------------------------
@@ -175,9 +181,15 @@ class Logger(mMeco.core.displayLib.Display):
 
         ## [ list of mMeco.core.loggerLib.LogType ] - Logs.
         self._logs          = []
+
+        ## [ int ] - Number of the logs written into the log file.
+        self._writtenCount  = 0
         
         ## [ bool ] - Whether a failure has been logged.
         self._hasFailure    = False
+
+        ## [ threading.RLock ] - Lock, which makes adding logs thread safe.
+        self._lock          = threading.RLock()
         
     #
     # ------------------------------------------------------------------------------------------------
@@ -206,6 +218,9 @@ class Logger(mMeco.core.displayLib.Display):
     #
     ## @brief Set log file.
     #
+    #  Existing log file is discarded by replacing it with an empty file atomically rather than removing it,
+    #  so a concurrent invocation appending to it never loses the file.
+    #
     #  @param logFile         [ str  | None | in  ] - Absolute path of a log file.
     #  @param discardExisting [ bool | None | in  ] - Discard existing log file, therefore do not append and create a new log file.
     #
@@ -217,7 +232,7 @@ class Logger(mMeco.core.displayLib.Display):
         self._file = logFile
 
         if discardExisting and os.path.isfile(self._file):
-            os.remove(self._file)
+            mMeco.fileSystem.fileLib.File.writeAtomically(self._file, '')
 
     #
     # ------------------------------------------------------------------------------------------------
@@ -233,10 +248,12 @@ class Logger(mMeco.core.displayLib.Display):
     #  @return None - None.
     def addInfo(self, message):
 
-        self._logs.append(Log(message,
-                              LogType.kInfo))
+        with self._lock:
+
+            self._logs.append(Log(message,
+                                  LogType.kInfo))
 
-        self.write()
+            self.write()
 
     #
     ## @brief Add success.
@@ -248,10 +265,12 @@ class Logger(mMeco.core.displayLib.Display):
     #  @return None - None.
     def addSuccess(self, message):
 
-        self._logs.append(Log(message,
-                              LogType.kSuccess))
+        with self._lock:
 
-        self.write()
+            self._logs.append(Log(message,
+                                  LogType.kSuccess))
+
+            self.write()
 
     #
     ## @brief Add warning.
@@ -263,10 +282,12 @@ class Logger(mMeco.core.displayLib.Display):
     #  @return None - None.
     def addWarning(self, message):
 
-        self._logs.append(Log(message,
-                              LogType.kWarning))
+        with self._lock:
+
+            self._logs.append(Log(message,
+                                  LogType.kWarning))
 
-        self.write()
+            self.write()
 
     #
     ## @brief Add failure.
@@ -278,12 +299,14 @@ class Logger(mMeco.core.displayLib.Display):
     #  @return None - None.
     def addFailure(self, message):
 
-        self._hasFailure = True
+        with self._lock:
+
+            self._hasFailure = True
 
-        self._logs.append(Log(message,
-                              LogType.kFailure))
+            self._logs.append(Log(message,
+                                  LogType.kFailure))
 
-        self.write()
+            self.write()
 
     #
     ## @brief Get last failure.
@@ -314,29 +337,34 @@ class Logger(mMeco.core.displayLib.Display):
         self.displayFailure(lastFailure.fullMessage())
 
     #
-    ## @brief Write the log into log file.
+    ## @brief Append the logs, which haven't been written yet, to the log file.
     #
-    #  @param append [ bool | False | in  ] - Append to log file.
+    #  @param append [ bool | False | in  ] - Append all logs to log file, including the ones already written.
     #
     #  @exception N/A
     #
     #  @return str  - Absolute path of the log file.
+    #  @return None - If log file is not set or no log has been added.
     def write(self, append=False):
 
         if not self._file:
-            pass
-
-        if not self._logs:
-            self.addInfo('No log has been added.')
             return None
 
-        _file = open(self._file, 'a' if append else 'w')
+        with self._lock:
+
+            if not self._logs:
+                self.addInfo('No log has been added.')
+                return None
 
-        for log in self._logs:
+            logs = self._logs if append else self._logs[self._writtenCount:]
+            if not logs:
+                return self._file
 
-            _file.write('{}\n'.format(str(log)))
+            _file = open(self._file, 'a')
+            _file.write(''.join(['{}\n'.format(str(log)) for log in logs]))
+            _file.close()
 
-        _file.close()
+            self._writtenCount = len(self._logs)
 
         return self._file
 
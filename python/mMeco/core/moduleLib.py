@@ -27,9 +27,17 @@
 # ----------------------------------------------------------------------------------------------------
 import  os
 import  glob
+import  sys
 
 from    importlib import import_module
 
+from    mMeco.core.pythonVersionLib import isPython2
+
+if isPython2():
+    import  imp
+else:
+    import  importlib.util
+
 
 #
 #-----------------------------------------------------------------------------------------------------
@@ -89,3 +97,51 @@ class Module(object):
                 yield import_module(importPath.format(file))
             else:
                 yield import_module(file)
+
+    #
+    ## @brief Load Python module from given file under given module name.
+    #
+    #  Module is executed from its file path, therefore `sys.path` isn't changed and the module doesn't shadow
+    #  or get shadowed by another module with the same import path. Module is registered in `sys.modules` under
+    #  given `moduleName` while it's executed.
+    #
+    #  @param filePath   [ str | None | in  ] - Absolute path of the Python module file.
+    #  @param moduleName [ str | None | in  ] - Unique name of the module.
+    #
+    #  @exception IOError - If given `filePath` doesn't exist.
+    #
+    #  @return module - Python module.
+    @staticmethod
+    def loadFile(filePath, moduleName):
+
+        if not os.path.isfile(filePath):
+            raise IOError('Python module doesn\'t exist: {}'.format(filePath))
+
+        if isPython2():
+            return imp.load_source(moduleName, filePath)
+
+        spec    = importlib.util.spec_from_file_location(moduleName, filePath)
+        module  = importlib.util.module_from_spec(spec)
+
+        sys.modules[moduleName] = module
+
+        try:
+            spec.loader.exec_module(module)
+        except:
+            sys.modules.pop(moduleName, None)
+            raise
+
+        return module
+
+    #
+    ## @brief Unload Python module with given name by removing it from `sys.modules`.
+    #
+    #  @param moduleName [ str | None | in  ] - Name of the module.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def unload(moduleName):
+
+        sys.modules.pop(moduleName, None)
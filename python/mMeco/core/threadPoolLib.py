@@ -0,0 +1,74 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/core/threadPoolLib.py @brief [ FILE   ] - Thread pool.
+## @package mMeco.core.threadPoolLib    @brief [ MODULE ] - Thread pool.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+
+#
+# -----------------------------------------------------------------------------------------------------
+# CODE
+# -----------------------------------------------------------------------------------------------------
+#
+## @brief Whether thread pool is available, `concurrent.futures` module is required (`futures` package on Python 2).
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isAvailable():
+
+    return ThreadPoolExecutor is not None
+
+#
+## @brief Invoke given function for each item in a bounded thread pool.
+#
+#  Results are returned in the order of `items` regardless of the order the invocations finish. If an invocation
+#  raises an exception, exception of the first failed item in the order of `items` is raised.
+#
+#  Items are processed in the current thread one after another if thread pool is not available,
+#  `maxWorkers` is less than `2` or there is only one item.
+#
+#  @param function   [ function | None | in  ] - Function to be invoked with each item.
+#  @param items      [ list     | None | in  ] - Items.
+#  @param maxWorkers [ int      | None | in  ] - Maximum number of threads.
+#
+#  @exception N/A
+#
+#  @return list - Results.
+def mapInOrder(function, items, maxWorkers):
+
+    items = list(items)
+
+    if not isAvailable() or not maxWorkers or maxWorkers < 2 or len(items) < 2:
+        return [function(x) for x in items]
+
+    with ThreadPoolExecutor(max_workers=min(maxWorkers, len(items))) as executor:
+        return list(executor.map(function, items))
+
+
@@ -799,7 +799,7 @@ class Directory(object):
             versionList = [x for x in versionList if re.search(r'([0-9]{1,}\.[0-9]{1,}\.[0-9]{1,})', x)]
 
         if versionList:
-            versionList.sort(key=lambda x: [int(x) for x in x.split('.')])
+            versionList.sort(key=lambda x: mMeco.fileSystem.versionLib.SemanticVersion.getSortKey(os.path.basename(x)))
 
 
         if version == mMeco.fileSystem.versionLib.Version.kAll:
@@ -27,6 +27,10 @@
 # ----------------------------------------------------------------------------------------------------
 import os
 import shutil
+import tempfile
+import threading
+
+import mMeco.core.platformLib
 
 import mMeco.fileSystem.directoryLib
 import mMeco.fileSystem.exceptionLib
@@ -39,6 +43,16 @@ import mMeco.fileSystem.exceptionLib
 #
 ## @brief [ CLASS ] - Operate on files.
 class File(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ int ] - Umask of the process, `None` until it is read by mMeco.fileSystem.fileLib.File.getUmask method.
+    UMASK       = None
+
+    ## [ threading.Lock ] - Lock, which makes reading the umask thread safe.
+    UMASK_LOCK  = threading.Lock()
+
     #
     # ------------------------------------------------------------------------------------------------
     # PRIVATE METHODS
@@ -557,6 +571,126 @@ class File(object):
 
         return '{}{}'.format(os.path.splitext(path)[0], newExtension)
 
+    #
+    ## @brief Write given content into a file atomically.
+    #
+    #  Content is written into a temporary file in the same directory first, which is then renamed
+    #  to given `path`. Readers therefore see either the previous or the new content of the file,
+    #  never a partially written one. Directory of the file will be created if it doesn't exist.
+    #
+    #  @param path    [ str | None | in  ] - Absolute path of the file.
+    #  @param content [ str | None | in  ] - Content to be written.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the file.
+    @staticmethod
+    def writeAtomically(path, content):
+
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+        fileDescriptor, temporaryPath = tempfile.mkstemp(prefix='.{}.'.format(os.path.basename(path)),
+                                                         dir=directory)
+
+        try:
+            File.setDefaultPermissions(temporaryPath)
+
+            with os.fdopen(fileDescriptor, 'w') as _file:
+                _file.write(content)
+
+            File.replace(temporaryPath, path)
+        except:
+            if os.path.isfile(temporaryPath):
+                os.remove(temporaryPath)
+            raise
+
+        return path
+
+    #
+    ## @brief Set permissions of given file to the ones a regular file would be created with.
+    #
+    #  Temporary files are only accessible by their owner, files created from them get the permissions
+    #  by the umask of the process instead, see mMeco.fileSystem.fileLib.File.getUmask method.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def setDefaultPermissions(path):
+
+        os.chmod(path, 0o666 & ~File.getUmask())
+
+    #
+    ## @brief Get umask of the process.
+    #
+    #  Umask is read once and cached. It is read from `/proc/self/status` where available, otherwise
+    #  reading it requires setting it, which would race with other threads creating files, therefore
+    #  it is read under a lock and only once.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Umask.
+    @staticmethod
+    def getUmask():
+
+        if File.UMASK is not None:
+            return File.UMASK
+
+        with File.UMASK_LOCK:
+
+            if File.UMASK is not None:
+                return File.UMASK
+
+            umask = None
+
+            try:
+                with open('/proc/self/status') as _file:
+                    for line in _file:
+                        if line.startswith('Umask:'):
+                            umask = int(line.split(':', 1)[1].strip(), 8)
+                            break
+            except (IOError, OSError, ValueError):
+                umask = None
+
+            if umask is None:
+                umask = os.umask(0)
+                os.umask(umask)
+
+            File.UMASK = umask
+
+        return File.UMASK
+
+    #
+    ## @brief Rename `source` file to `destination` file, replacing `destination` if it exists.
+    #
+    #  Rename is atomic on POSIX file systems.
+    #
+    #  @param source      [ str | None | in  ] - Absolute path of the source file.
+    #  @param destination [ str | None | in  ] - Absolute path of the destination file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def replace(source, destination):
+
+        if hasattr(os, 'replace'):
+            os.replace(source, destination)
+            return
+
+        if mMeco.core.platformLib.Platform.isWindows() and os.path.isfile(destination):
+            os.remove(destination)
+
+        os.rename(source, destination)
+
     #
     # ------------------------------------------------------------------------------------------------
     # CLASS METHODS
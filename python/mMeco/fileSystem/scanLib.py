@@ -0,0 +1,344 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/fileSystem/scanLib.py @brief [ FILE   ] - Directory scanner.
+## @package mMeco.fileSystem.scanLib    @brief [ MODULE ] - Directory scanner.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  stat
+import  threading
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+import  mMeco.core.platformLib
+
+
+#
+# -----------------------------------------------------------------------------------------------------
+# CODE
+# -----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Entry of a scanned directory.
+#
+#  Entry wraps `os.DirEntry` when `scandir` is available, so the type information returned by listing
+#  the directory is used without a separate stat. Stat is done only when the modification time is
+#  asked and it is done once.
+class ScanEntry(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param scanner  [ mMeco.fileSystem.scanLib.Scanner | None | in  ] - Scanner, which created this entry.
+    #  @param name     [ str                              | None | in  ] - Name of the entry.
+    #  @param path     [ str                              | None | in  ] - Absolute path of the entry.
+    #  @param dirEntry [ os.DirEntry                      | None | in  ] - Directory entry.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, scanner, name, path, dirEntry=None):
+
+        ## [ mMeco.fileSystem.scanLib.Scanner ] - Scanner.
+        self._scanner       = scanner
+
+        ## [ str ] - Name.
+        self._name          = name
+
+        ## [ str ] - Absolute path.
+        self._path          = path
+
+        ## [ os.DirEntry ] - Directory entry.
+        self._dirEntry      = dirEntry
+
+        ## [ os.stat_result ] - Stat result.
+        self._stat          = None
+
+        ## [ bool ] - Whether stat has been done.
+        self._isStatDone    = False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def name(self):
+
+        return self._name
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def path(self):
+
+        return self._path
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get stat result of the entry, symbolic links are followed.
+    #
+    #  @exception N/A
+    #
+    #  @return os.stat_result - Stat result.
+    #  @return None           - If entry doesn't exist anymore or it is a broken symbolic link.
+    def stat(self):
+
+        if self._isStatDone:
+            return self._stat
+
+        self._isStatDone = True
+
+        if self._dirEntry is not None:
+            self._scanner._count(Scanner.kDirEntryStat)
+            try:
+                self._stat = self._dirEntry.stat()
+            except OSError:
+                self._stat = None
+        else:
+            self._stat = self._scanner.stat(self._path)
+
+        return self._stat
+
+    #
+    ## @brief Check whether the entry is a directory, symbolic links are followed.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isDirectory(self):
+
+        if self._dirEntry is not None and not self._isStatDone:
+            try:
+                return self._dirEntry.is_dir()
+            except OSError:
+                return False
+
+        return bool(self.stat()) and stat.S_ISDIR(self.stat().st_mode)
+
+    #
+    ## @brief Get modification time of the entry.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Modification time.
+    #  @return None  - If entry doesn't exist anymore.
+    def modificationTime(self):
+
+        return self.stat().st_mtime if self.stat() else None
+
+#
+## @brief [ CLASS ] - Directory scanner.
+#
+#  Scanner lists directories with `os.scandir` when it is available and falls back to `os.listdir`.
+#  Number of file system calls made by the scanner are counted, which can be queried with `counters` method.
+class Scanner(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ str ] - Counter name of directory listings.
+    kListDirectory  = 'listDirectory'
+
+    ## [ str ] - Counter name of stats.
+    kStat           = 'stat'
+
+    ## [ str ] - Counter name of stats done by `os.DirEntry`, which are free on Windows.
+    kDirEntryStat   = 'dirEntryStat'
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param useScandir [ bool | True | in  ] - Whether to use `os.scandir` if it is available.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, useScandir=True):
+
+        ## [ bool ] - Whether `os.scandir` is used.
+        self._useScandir    = useScandir and scandir is not None
+
+        ## [ dict ] - Counters.
+        self._counters      = {}
+
+        ## [ threading.Lock ] - Lock, which makes counting thread safe.
+        self._lock          = threading.Lock()
+
+        self.resetCounters()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Increase given counter.
+    #
+    #  Stats done by `os.DirEntry` are not counted on Windows, since type and stat information are
+    #  provided by directory listing there.
+    #
+    #  @param counter [ str | None | in  ] - Counter name.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _count(self, counter):
+
+        if counter == Scanner.kDirEntryStat and mMeco.core.platformLib.Platform.isWindows():
+            return
+
+        with self._lock:
+            self._counters[counter] += 1
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def useScandir(self):
+
+        return self._useScandir
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Value. Keys are counter names, values are number of calls.
+    def counters(self):
+
+        return dict(self._counters)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Reset counters.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def resetCounters(self):
+
+        self._counters = {Scanner.kListDirectory    : 0,
+                          Scanner.kStat             : 0,
+                          Scanner.kDirEntryStat     : 0}
+
+    #
+    ## @brief Get stat result of given path, symbolic links are followed.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return os.stat_result - Stat result.
+    #  @return None           - If path doesn't exist.
+    def stat(self, path):
+
+        self._count(Scanner.kStat)
+
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    #
+    ## @brief Check whether given path is a file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isFile(self, path):
+
+        result = self.stat(path)
+
+        return bool(result) and stat.S_ISREG(result.st_mode)
+
+    #
+    ## @brief Scan given directory.
+    #
+    #  @param path          [ str  | None  | in  ] - Absolute path of a directory.
+    #  @param includeHidden [ bool | False | in  ] - Whether to include entries starting with `.`.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mMeco.fileSystem.scanLib.ScanEntry - Entries sorted by name. Empty list if directory can't be listed.
+    def scan(self, path, includeHidden=False):
+
+        self._count(Scanner.kListDirectory)
+
+        entries = []
+
+        try:
+            if self._useScandir:
+                iterator = scandir(path)
+                try:
+                    for dirEntry in iterator:
+                        if includeHidden or not dirEntry.name.startswith('.'):
+                            entries.append(ScanEntry(self, dirEntry.name, dirEntry.path, dirEntry))
+                finally:
+                    if hasattr(iterator, 'close'):
+                        iterator.close()
+            else:
+                for name in os.listdir(path):
+                    if includeHidden or not name.startswith('.'):
+                        entries.append(ScanEntry(self, name, os.path.join(path, name)))
+        except OSError:
+            return []
+
+        entries.sort(key=lambda x: x.name())
+
+        return entries
+
+
@@ -25,6 +25,8 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import re
+
 import mMeco.core.enumAbs
 
 
@@ -53,3 +55,413 @@ class Version(mMeco.core.enumAbs.Enum):
 
     ## [ str ] - Previous.
     kPrevious   = 'previous'
+
+#
+## @brief [ CLASS ] - Semantic version, such as `1.2.3`, `1.2.3-beta.1` or `1.2.3+build.5`.
+#
+#  Sort keys are plain tuples, see mMeco.fileSystem.versionLib.SemanticVersion.getSortKey static method, therefore
+#  sorting a list of version strings doesn't create instances and compares flat tuples.
+#  Instances are interned by mMeco.fileSystem.versionLib.SemanticVersion.get static method.
+#
+#  Precedence follows semantic versioning, release numbers are compared numerically, a pre-release version
+#  has lower precedence than its release version and build metadata is only used to order versions that
+#  are otherwise equal. Version strings that can't be parsed have lower precedence than any valid version
+#  and they are ordered by their strings.
+#
+#  Newest version of a package is selected by mMeco.fileSystem.versionLib.SemanticVersion.getReleaseSortKey
+#  static method unless pre-releases are enabled by the settings, so that a pre-release version is selected
+#  only if the package doesn't have a release version.
+#
+# @code
+#import mMeco.fileSystem.versionLib
+#
+#mMeco.fileSystem.versionLib.SemanticVersion.sort(['1.10.0', '1.2.0', '1.10.0-rc.1', 'dev'])
+# #['dev', '1.2.0', '1.10.0-rc.1', '1.10.0']
+# @endcode
+class SemanticVersion(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ _sre.SRE_Pattern ] - Pattern of a semantic version.
+    PATTERN = re.compile(r'^v?([0-9]+(?:\.[0-9]+)*)(?:-([0-9A-Za-z.-]+))?(?:\+([0-9A-Za-z.-]+))?$')
+
+    ## [ tuple ] - End of the sort key of a release version.
+    RELEASE_SORT_KEY_END = (-1, (1,), '')
+
+    ## [ dict ] - Interned instances, keys are version strings.
+    __CACHE = {}
+
+    ## [ dict ] - Sort keys, keys are version strings.
+    __SORT_KEYS = {}
+
+    #
+    ## [ tuple of str ] - Slots.
+    __slots__ = ('_string', '_release', '_preRelease', '_build', '_sortKey')
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param string [ str | None | in  ] - Version string.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, string):
+
+        ## [ str ] - Version string.
+        self._string        = string
+
+        ## [ tuple of int ] - Release numbers.
+        self._release       = ()
+
+        ## [ tuple of str ] - Pre-release identifiers.
+        self._preRelease    = ()
+
+        ## [ str ] - Build metadata.
+        self._build         = ''
+
+        ## [ tuple ] - Sort key.
+        self._sortKey       = None
+
+        #
+
+        self._parse()
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String representation.
+    def __str__(self):
+
+        return self._string
+
+    #
+    ## @brief Representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Representation.
+    def __repr__(self):
+
+        return 'SemanticVersion({!r})'.format(self._string)
+
+    #
+    ## @brief Hash.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Hash.
+    def __hash__(self):
+
+        return hash(self._sortKey)
+
+    #
+    ## @brief Equal.
+    #
+    #  @param other [ mMeco.fileSystem.versionLib.SemanticVersion | None | in  ] - Other version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __eq__(self, other):
+
+        return isinstance(other, SemanticVersion) and self._sortKey == other._sortKey
+
+    #
+    ## @brief Not equal.
+    #
+    #  @param other [ mMeco.fileSystem.versionLib.SemanticVersion | None | in  ] - Other version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __ne__(self, other):
+
+        return not self.__eq__(other)
+
+    #
+    ## @brief Less than.
+    #
+    #  @param other [ mMeco.fileSystem.versionLib.SemanticVersion | None | in  ] - Other version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __lt__(self, other):
+
+        return self._sortKey < other._sortKey
+
+    #
+    ## @brief Less than or equal.
+    #
+    #  @param other [ mMeco.fileSystem.versionLib.SemanticVersion | None | in  ] - Other version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __le__(self, other):
+
+        return self._sortKey <= other._sortKey
+
+    #
+    ## @brief Greater than.
+    #
+    #  @param other [ mMeco.fileSystem.versionLib.SemanticVersion | None | in  ] - Other version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __gt__(self, other):
+
+        return self._sortKey > other._sortKey
+
+    #
+    ## @brief Greater than or equal.
+    #
+    #  @param other [ mMeco.fileSystem.versionLib.SemanticVersion | None | in  ] - Other version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __ge__(self, other):
+
+        return self._sortKey >= other._sortKey
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Parse the version string and set the sort key.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _parse(self):
+
+        self._sortKey = SemanticVersion.getSortKey(self._string)
+
+        match = SemanticVersion.PATTERN.match(self._string)
+        if not match:
+            return
+
+        release, preRelease, build = match.groups()
+
+        self._release       = tuple([int(x) for x in release.split('.')])
+        self._preRelease    = tuple(preRelease.split('.')) if preRelease else ()
+        self._build         = build if build else ''
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def string(self):
+
+        return self._string
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple of int - Value.
+    def release(self):
+
+        return self._release
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple of str - Value.
+    def preRelease(self):
+
+        return self._preRelease
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def build(self):
+
+        return self._build
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Value.
+    def sortKey(self):
+
+        return self._sortKey
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether the version string is a valid semantic version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isValid(self):
+
+        return bool(self._release)
+
+    #
+    ## @brief Check whether the version is a pre-release version.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isPreRelease(self):
+
+        return bool(self._preRelease)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get interned instance for given version string.
+    #
+    #  @param string [ str | None | in  ] - Version string.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.fileSystem.versionLib.SemanticVersion - Version.
+    @staticmethod
+    def get(string):
+
+        version = SemanticVersion.__CACHE.get(string)
+        if version is None:
+            version = SemanticVersion.__CACHE.setdefault(string, SemanticVersion(string))
+
+        return version
+
+    #
+    ## @brief Compute sort key for given version string.
+    #
+    #  Sort key of a valid version is a flat tuple of the release numbers followed by `-1`, pre-release key and
+    #  build metadata. Release numbers are compared like a list of ints and `-1` keeps a shorter release, such as
+    #  `1.2`, lower than a longer one, such as `1.2.0`. Pre-release key is `(1,)` for a release version, otherwise
+    #  `0` followed by the identifiers, numeric ones have lower precedence than alphanumeric ones, therefore each
+    #  identifier is keyed as `(0, number, '')` or `(1, 0, identifier)`, which keeps the tuples comparable.
+    #
+    #  Sort key of an invalid version is `(-1, string)`.
+    #
+    #  @param string [ str | None | in  ] - Version string.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Sort key.
+    @staticmethod
+    def computeSortKey(string):
+
+        match = SemanticVersion.PATTERN.match(string)
+        if not match:
+            return (-1, string)
+
+        release, preRelease, build = match.groups()
+
+        if preRelease:
+            preReleaseKey = (0,) + tuple([(0, int(x), '') if x.isdigit() else (1, 0, x) for x in preRelease.split('.')])
+        else:
+            preReleaseKey = (1,)
+
+        return tuple([int(x) for x in release.split('.')]) + (-1, preReleaseKey, build if build else '')
+
+    #
+    ## @brief Get sort key for given version string, which can be used as `key` argument of `sorted` function.
+    #
+    #  Release versions, such as `1.2.3`, which contain only digits and dots are keyed without the regular expression,
+    #  which is cheaper than caching their sort keys. Sort keys of the other versions are cached.
+    #
+    #  @param string [ str | None | in  ] - Version string.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Sort key, see mMeco.fileSystem.versionLib.SemanticVersion.computeSortKey.
+    @staticmethod
+    def getSortKey(string):
+
+        if not string.strip('0123456789.'):
+            try:
+                return tuple(map(int, string.split('.'))) + SemanticVersion.RELEASE_SORT_KEY_END
+            except ValueError:
+                pass
+
+        sortKey = SemanticVersion.__SORT_KEYS.get(string)
+        if sortKey is None:
+            sortKey = SemanticVersion.__SORT_KEYS.setdefault(string, SemanticVersion.computeSortKey(string))
+
+        return sortKey
+
+
+    #
+    ## @brief Get sort key for given version string, which orders release versions above pre-release versions.
+    #
+    #  Sort key can be used as `key` argument of `max` function to select the newest release version, newest
+    #  pre-release version is selected only if there is no release version. Invalid versions have the lowest precedence.
+    #
+    #  @param string [ str | None | in  ] - Version string.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Sort key.
+    @staticmethod
+    def getReleaseSortKey(string):
+
+        sortKey = SemanticVersion.getSortKey(string)
+
+        if sortKey[0] == -1:
+            return (0,) + sortKey
+
+        if sortKey[-2][0] == 0:
+            return (1,) + sortKey
+
+        return (2,) + sortKey
+
+    #
+    ## @brief Sort given version strings.
+    #
+    #  @param strings [ list of str | None  | in  ] - Version strings.
+    #  @param reverse [ bool        | False | in  ] - Sort from the newest version to the oldest one.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Sorted version strings.
+    @staticmethod
+    def sort(strings, reverse=False):
+
+        return sorted(strings, key=SemanticVersion.getSortKey, reverse=reverse)
+
+    #
+    ## @brief Clear interned instances and sort keys.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def clearCache():
+
+        SemanticVersion.__CACHE.clear()
+        SemanticVersion.__SORT_KEYS.clear()
@@ -84,6 +84,22 @@ class All(object):
             ## [ mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnvOperator ] - Operator.
             self._packageGlobalEnvOperator  = None
 
+        if not hasattr(self, '_cache'):
+            ## [ mMeco.libs.cacheLib.Cache ] - Cache.
+            self._cache             = None
+
+        if not hasattr(self, '_fingerprint'):
+            ## [ mMeco.libs.fingerprintLib.Fingerprint ] - Fingerprint.
+            self._fingerprint       = None
+
+        if not hasattr(self, '_layerStack'):
+            ## [ mMeco.libs.layerLib.LayerStack ] - Layer stack.
+            self._layerStack        = None
+
+        if not hasattr(self, '_statCache'):
+            ## [ mMeco.libs.statCacheLib.StatCache ] - Stat cache.
+            self._statCache         = None
+
         #
 
         if not hasattr(self, '_solverContainer'):
@@ -127,6 +143,10 @@ class All(object):
         data = '{}Request               : {}\n'.format(data, type(self._request))
         data = '{}Settings              : {}\n'.format(data, type(self._settingsOperator))
         data = '{}Callback              : {}\n'.format(data, type(self._callbackOperator))
+        data = '{}Cache                 : {}\n'.format(data, type(self._cache))
+        data = '{}Fingerprint           : {}\n'.format(data, type(self._fingerprint))
+        data = '{}Layer Stack           : {}\n'.format(data, type(self._layerStack))
+        data = '{}Stat Cache            : {}\n'.format(data, type(self._statCache))
 
         data = '{}Solver Container      : {}\n'.format(data, type(self._solverContainer))
         data = '{}Solver                : {}\n'.format(data, type(self._solver))
@@ -203,6 +223,46 @@ class All(object):
 
         return self._packageGlobalEnvOperator
 
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.cacheLib.Cache - Cache.
+    def cache(self):
+
+        return self._cache
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.fingerprintLib.Fingerprint - Fingerprint.
+    def fingerprint(self):
+
+        return self._fingerprint
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.layerLib.LayerStack - Layer stack.
+    def layerStack(self):
+
+        return self._layerStack
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.statCacheLib.StatCache - Stat cache.
+    def statCache(self):
+
+        return self._statCache
+
     #
     ## @brief Property.
     #
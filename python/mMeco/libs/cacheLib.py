@@ -0,0 +1,318 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/libs/cacheLib.py @brief [ FILE   ] - Cache.
+## @package mMeco.libs.cacheLib    @brief [ MODULE ] - Cache.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  json
+import  os
+
+import  mMeco.fileSystem.fileLib
+
+import  mMeco.libs.aboutLib
+import  mMeco.libs.allLib
+import  mMeco.libs.entryLib
+import  mMeco.libs.enumLib
+import  mMeco.libs.fingerprintLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Cache of a resolved env.
+#
+#  Cache contains packages solved by a solver for each env type and env entry containers created by a
+#  builder for each env type. A cache file is meant to be written by mMeco.responses.cacheWriteRes.Response
+#  and read by mMeco.solvers.cacheReadSol.Solver and mMeco.builders.cacheReadBld.Builder classes.
+#
+#  Cache also contains the fingerprint of the inputs and modification times of package info modules of the
+#  versions used or found invalid by the solver, see mMeco.libs.fingerprintLib.Fingerprint class. Cache is up to
+#  date only if both of them are unchanged.
+class Cache(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ int ] - Version of the cache data structure.
+    VERSION = 2
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path=None):
+
+        ## [ str ] - Absolute path of the cache file.
+        self._path          = path
+
+        ## [ dict ] - Cache data.
+        self._data          = None
+
+        ## [ str ] - Fingerprint of the inputs of the env resolution, see mMeco.libs.fingerprintLib.Fingerprint class.
+        self._fingerprint   = None
+
+        ## [ mMeco.libs.allLib.All ] - All.
+        self._allLib        = mMeco.libs.allLib.All.getInstance(**{'cache':self})
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String representation.
+    def __str__(self):
+
+        return self.asStr()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Property.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setPath(self, path):
+
+        self._path = path
+        self._data = None
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Value.
+    def data(self):
+
+        return self._data
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def fingerprint(self):
+
+        return self._fingerprint
+
+    #
+    ## @brief Property.
+    #
+    #  @param fingerprint [ str | None | in  ] - Fingerprint, which will be written into the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setFingerprint(self, fingerprint):
+
+        self._fingerprint = fingerprint
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get string representation of the class.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Information about the cache in human readable form.
+    def asStr(self):
+
+        data = ''
+        data += '\nCACHE'
+        data += '\n{}'.format('-' * 100)
+
+        data += '\nPath                                  : {}'.format(self._path if self._path else 'N/A')
+        data += '\nExists                                : {}'.format(self.exists())
+        data += '\nFingerprint                           : {}'.format(self._fingerprint if self._fingerprint else 'N/A')
+
+        return data
+
+    #
+    ## @brief Check whether the cache file exists.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def exists(self):
+
+        return bool(self._path) and os.path.isfile(self._path)
+
+    #
+    ## @brief Write the cache file.
+    #
+    #  Cache file is written atomically, a reader never sees a partially written cache file.
+    #
+    #  @param solver  [ mMeco.abstract.solverAbs.Solver   | None | in  ] - Solver, which solved the packages.
+    #  @param builder [ mMeco.abstract.builderAbs.Builder | None | in  ] - Builder, which built the env entry containers.
+    #
+    #  @exception IOError - If cache file path is not set.
+    #
+    #  @return str - Absolute path of the cache file.
+    def write(self, solver, builder):
+
+        if not self._path:
+            raise IOError('Cache file path is not set.')
+
+        data = {'version'                   : Cache.VERSION,
+                'mecoVersion'               : mMeco.libs.aboutLib.getVersion(),
+                'fingerprint'               : self._fingerprint,
+                'versionModificationTimes'  : {},
+                'packages'                  : {},
+                'envEntryContainers'        : {}}
+
+        if self._fingerprint and self._allLib.fingerprint():
+            data['versionModificationTimes'] = self._allLib.fingerprint().versionModificationTimes()
+
+        for envPath in solver.envPaths():
+            data['packages'][envPath.envType()] = envPath.packages()
+
+        for envType in [mMeco.libs.enumLib.EnvType.kPreBuild] + \
+                       [x.envType() for x in solver.envPaths()] + \
+                       [mMeco.libs.enumLib.EnvType.kPostBuild]:
+            data['envEntryContainers'][envType] = [x.asDict() for x in builder.getEnvEntryContainers(envType)]
+
+        mMeco.fileSystem.fileLib.File.writeAtomically(self._path, json.dumps(data, indent=1, sort_keys=True))
+
+        self._data = data
+
+        return self._path
+
+    #
+    ## @brief Read the cache file.
+    #
+    #  @exception IOError    - If cache file doesn't exist.
+    #  @exception ValueError - If cache file is corrupted or it has been written by another version of the cache.
+    #
+    #  @return dict - Cache data.
+    def read(self):
+
+        if self._data:
+            return self._data
+
+        if not self.exists():
+            raise IOError('Cache file doesn\'t exist: {}'.format(self._path))
+
+        with open(self._path, 'r') as _file:
+            data = json.loads(_file.read())
+
+        if not isinstance(data, dict) or data.get('version') != Cache.VERSION or \
+           data.get('mecoVersion') != mMeco.libs.aboutLib.getVersion():
+            raise ValueError('Cache file is not compatible with this version of meco: {}'.format(self._path))
+
+        self._data = data
+
+        return self._data
+
+    #
+    ## @brief Check whether the cache file has been written for the fingerprint of this instance.
+    #
+    #  Modification times of package info modules stored in the cache file are checked only if the fingerprint
+    #  matches. Cache file that can't be read is considered as not up to date.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isUpToDate(self):
+
+        if not self._fingerprint:
+            return False
+
+        try:
+            data = self.read()
+        except (IOError, OSError, ValueError):
+            return False
+
+        if data.get('fingerprint') != self._fingerprint:
+            return False
+
+        return not mMeco.libs.fingerprintLib.Fingerprint.hasChanged(data.get('versionModificationTimes', {}))
+
+    #
+    ## @brief Get modification times of package info modules of the versions used or found invalid by the solver.
+    #
+    #  @exception IOError    - If cache file doesn't exist.
+    #  @exception ValueError - If cache file is corrupted or it has been written by another version of the cache.
+    #
+    #  @return dict - Keys are absolute paths of package info modules, values are modification times.
+    def getVersionModificationTimes(self):
+
+        return self.read().get('versionModificationTimes', {})
+
+    #
+    ## @brief Get packages for given env type.
+    #
+    #  @param envType [ enum | None | in  ] - Value from mMeco.libs.enumLib.EnvType enum class.
+    #
+    #  @exception IOError    - If cache file doesn't exist.
+    #  @exception ValueError - If cache file is corrupted or it has been written by another version of the cache.
+    #
+    #  @return list of str  - Packages, if env type is a non-versioned env type.
+    #  @return list of dict - Packages, if env type is a versioned env type.
+    #  @return None         - If env path of given env type wasn't used when the cache was written.
+    def getPackages(self, envType):
+
+        return self.read()['packages'].get(envType)
+
+    #
+    ## @brief Get env entry containers for given env type.
+    #
+    #  @param envType [ enum | None | in  ] - Value from mMeco.libs.enumLib.EnvType enum class.
+    #
+    #  @exception IOError    - If cache file doesn't exist.
+    #  @exception ValueError - If cache file is corrupted or it has been written by another version of the cache.
+    #
+    #  @return list of mMeco.libs.entryLib.EnvEntryContainer - Env entry containers.
+    def getEnvEntryContainers(self, envType):
+
+        return [mMeco.libs.entryLib.EnvEntryContainer.fromDict(x) for x in self.read()['envEntryContainers'].get(envType, [])]
+
+
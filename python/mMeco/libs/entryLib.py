@@ -273,6 +273,18 @@ class EnvEntryContainer(object):
 
         self._entries.append(EnvEntry(mMeco.libs.enumLib.EnvEntryType.kMulti, value, variable))
 
+    #
+    ## @brief Add entries of given env entry container.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addEntries(self, envEntryContainer):
+
+        self._entries.extend(envEntryContainer.entries())
+
     #
     ## @brief Sort entries.
     #
@@ -283,6 +295,47 @@ class EnvEntryContainer(object):
 
         self._entries.sort(key=lambda x: (x.variable() if x.variable() else x.value()))
 
+    #
+    ## @brief Get data of this instance as dict, which can be serialized.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Data.
+    def asDict(self):
+
+        return {'type'          : self._type,
+                'path'          : self._path,
+                'packageName'   : self._packageName,
+                'version'       : self._version,
+                'entries'       : [x.asDict() for x in self._entries]}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create an instance from given data, which is created by `asDict` method.
+    #
+    #  Entries are restored as they are, `ignoreEnvCommands` and `ignoreEnvScripts` request
+    #  flags aren't applied since they have been applied when the data was created.
+    #
+    #  @param data [ dict | None | in  ] - Data.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.entryLib.EnvEntryContainer - Env entry container.
+    @staticmethod
+    def fromDict(data):
+
+        container = EnvEntryContainer(containerType=data['type'],
+                                      path=data['path'],
+                                      packageName=data['packageName'],
+                                      version=data['version'])
+
+        container._entries = [EnvEntry.fromDict(x) for x in data['entries']]
+
+        return container
+
 #
 ## @brief [ CLASS ] - Env envEntry.
 #
@@ -376,4 +429,33 @@ class EnvEntry(object):
 
         return data
 
+    #
+    ## @brief Get data of this instance as dict, which can be serialized.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Data.
+    def asDict(self):
+
+        return {'type'      : self._type,
+                'variable'  : self._variable,
+                'value'     : self._value}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create an instance from given data, which is created by `asDict` method.
+    #
+    #  @param data [ dict | None | in  ] - Data.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.entryLib.EnvEntry - Env entry.
+    @staticmethod
+    def fromDict(data):
+
+        return EnvEntry(data['type'], data['value'], data['variable'])
+
 
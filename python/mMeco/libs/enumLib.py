@@ -112,6 +112,36 @@ class EnvPackageType(mMeco.core.enumAbs.Enum):
     ## [ enum ] - Development.
     kVersioned              = 'Versioned'
 
+#
+## @brief [ ENUM CLASS ] - Package scopes, which env paths claim and get filtered by while resolving packages.
+class PackageScope(mMeco.core.enumAbs.Enum):
+
+    ## [ enum ] - Internal packages.
+    kInternal               = 'Internal'
+
+    ## [ enum ] - External packages.
+    kExternal               = 'External'
+
+#
+## @brief [ ENUM CLASS ] - Policies, which determine what happens to a package when its package env module times out.
+class PackageEnvTimeoutPolicy(mMeco.core.enumAbs.Enum):
+
+    ## [ enum ] - Skip the package, it isn't initialized.
+    kSkip                   = 'skip'
+
+    ## [ enum ] - Fail the execution.
+    kFail                   = 'fail'
+
+#
+## @brief [ ENUM CLASS ] - Formats of the data file written by mMeco.responses.dataRes.Response class.
+class DataFormat(mMeco.core.enumAbs.Enum):
+
+    ## [ enum ] - JSON, variables with the packages and layers of their values, scripts and commands.
+    kJson                   = 'json'
+
+    ## [ enum ] - Variables as `NAME=VALUE` pairs terminated by null characters, as `env -0` writes them.
+    kEnv                    = 'env'
+
 #
 #
 #
@@ -25,14 +25,14 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
-import  glob
 import  os
+import  re
 
-import  mMeco.fileSystem.directoryLib
 import  mMeco.fileSystem.versionLib
 
 import  mMeco.libs.allLib
 import  mMeco.libs.enumLib
+import  mMeco.libs.packageIndexLib
 
 
 #
@@ -49,13 +49,14 @@ class EnvPath(object):
     #
     ## @brief Constructor.
     #
-    #  @param path    [ str  | None | in  ] - Absolute package path of an environment.
-    #  @param envType [ enum | None | in  ] - Value from mMeco.libs.enumLib.EnvType enum class.
+    #  @param path        [ str  | None | in  ] - Absolute package path of an environment.
+    #  @param envType     [ enum | None | in  ] - Value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #  @param isVersioned [ bool | None | in  ] - Whether the env path contains versioned packages, it's determined by `envType` if not provided.
     #
     #  @exception N/A
     #
     #  @return None - None.
-    def __init__(self, path, envType):
+    def __init__(self, path, envType, isVersioned=None):
 
         ## [ str ] - Path.
         self._path              = None
@@ -69,12 +70,18 @@ class EnvPath(object):
         ## [ list of str | list of dict ] - Packages.
         self._packages          = []
 
+        ## [ list of tuple ] - Package names and versions found invalid while listing versioned packages, since they don't have package info module.
+        self._invalidVersions   = []
+
+        ## [ mMeco.libs.packageIndexLib.PackageIndex ] - Package index.
+        self._packageIndex      = None
+
         ## [ mMeco.libs.allLib.All ] - All.
         self._allLib            = mMeco.libs.allLib.All.getInstance(**{envType:self})
 
         #
 
-        self._set(path, envType)
+        self._set(path, envType, isVersioned)
 
     #
     ## @brief Get env package type for given env type.
@@ -120,20 +127,101 @@ class EnvPath(object):
     #
     ## @brief Set.
     #
-    #  @param path    [ str  | None | in  ] - Absolute package path of an environment.
-    #  @param envType [ enum | None | in  ] - Value from mMeco.libs.enumLib.EnvType enum class.
+    #  @param path        [ str  | None | in  ] - Absolute package path of an environment.
+    #  @param envType     [ enum | None | in  ] - Value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #  @param isVersioned [ bool | None | in  ] - Whether the env path contains versioned packages, it's determined by `envType` if not provided.
     #
     #  @exception IOError - If provided `path` doesn't exist.
     #
     #  @return None - None.
-    def _set(self, path, envType):
+    def _set(self, path, envType, isVersioned=None):
 
-        if not os.path.isdir(path):
+        if not self._allLib.statCache().isDirectory(path):
             raise IOError('Env path doesn\'t exist: {}'.format(path))
 
         self._path           = path
         self._envType        = envType
-        self._envPackageType = self.__getEnvPackageTypeByEnvType(envType)
+
+        if isVersioned is None:
+            self._envPackageType = self.__getEnvPackageTypeByEnvType(envType)
+        elif isVersioned:
+            self._envPackageType = mMeco.libs.enumLib.EnvPackageType.kVersioned
+        else:
+            self._envPackageType = mMeco.libs.enumLib.EnvPackageType.kNonVersioned
+
+    #
+    ## @brief Get package index of the env path.
+    #
+    #  Package index is stored in the cache directory unless `--ignore-cache` flag is provided.
+    #
+    #  @param refresh [ bool | False | in  ] - Whether to refresh the package index if it has been refreshed already.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.packageIndexLib.PackageIndex - Package index.
+    def _getPackageIndex(self, refresh=False):
+
+        if not self._packageIndex:
+
+            indexFilePath       = None
+            maxWorkers          = 1
+            settingsOperator    = self._allLib.settingsOperator()
+            request             = self._allLib.request()
+
+            if settingsOperator:
+
+                maxWorkers = settingsOperator.scanMaxWorkers()
+
+                if settingsOperator.cacheDirectoryPath() and not (request and request.ignoreCache()):
+                    indexFilePath = mMeco.libs.packageIndexLib.PackageIndex.getIndexFilePath(settingsOperator.cacheDirectoryPath(),
+                                                                                             self._path)
+
+            self._packageIndex = mMeco.libs.packageIndexLib.PackageIndex(self._path,
+                                                                         self._envPackageType == mMeco.libs.enumLib.EnvPackageType.kVersioned,
+                                                                         indexFilePath,
+                                                                         maxWorkers,
+                                                                         self._allLib.statCache())
+
+        if refresh or not self._packageIndex.isRefreshed():
+            self._packageIndex.refresh()
+
+        return self._packageIndex
+
+    #
+    ## @brief Iterate valid versions of given package, a warning is logged for each version, which doesn't have package info module.
+    #
+    #  Versions are probed lazily, therefore a version is probed only when the iteration reaches it.
+    #
+    #  @param packageIndex [ mMeco.libs.packageIndexLib.PackageIndex | None | in  ] - Package index.
+    #  @param packageName  [ str                                     | None | in  ] - Package name.
+    #  @param versions     [ list of str                             | None | in  ] - Versions in the order they will be probed.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Valid versions.
+    def _iterateValidVersions(self, packageIndex, packageName, versions):
+
+        for version in versions:
+
+            if packageIndex.hasPackageInfo(packageName, version):
+                yield version
+                continue
+
+            self._invalidVersions.append((packageName, version))
+
+            packageInfoModuleFilePath = os.path.join(self._path,
+                                                     packageName,
+                                                     version,
+                                                     packageName,
+                                                     'python',
+                                                     packageName,
+                                                     'packageInfoLib.py')
+
+            self._allLib.logger().addWarning('Package info module of "{}" version of the package is missing, '
+                                          'this version is ignored: {} '.format(version,
+                                                                                packageInfoModuleFilePath
+                                                                                )
+                                             )
 
     #
     ## @brief List non-versioned packages located in the env path.
@@ -149,81 +237,116 @@ class EnvPath(object):
         if self._envPackageType != mMeco.libs.enumLib.EnvPackageType.kNonVersioned:
             raise ValueError('"{}" env path doesn\'t contain non-versioned packages.'.format(self._envType))
 
-        packageList = []
+        packageIndex = self._getPackageIndex(refresh=True)
 
-        for packageRoot in glob.glob('{}/*'.format(self._path)):
+        packageRoots = []
 
-            if not os.path.isdir(packageRoot):
+        for packageName in packageIndex.listPackages():
+
+            packageRoot = os.path.join(self._path, packageName)
+            package     = packageIndex.getPackage(packageName)
+
+            if not package['isDirectory']:
                 self._allLib.logger().addWarning('Entry is not a package, skipping: {} '.format(packageRoot))
                 continue
 
-            packageInfoModuleFilePath = os.path.join(packageRoot, 'python', os.path.basename(packageRoot), 'packageInfoLib.py')
-            if not os.path.isfile(packageInfoModuleFilePath):
+            if not package['hasPackageInfo']:
+                packageInfoModuleFilePath = os.path.join(packageRoot, 'python', packageName, 'packageInfoLib.py')
                 self._allLib.logger().addWarning('Package info module is missing, path is ignored since it is not a package: {} '.format(packageInfoModuleFilePath))
                 continue
 
-            if invokeShouldInitializePackageCallback and \
-               not self._allLib.callbackOperator().invokeShouldInitializePackage(packageRoot):
-                    continue
+            packageRoots.append(packageRoot)
 
-            if absolutePath:
-                packageList.append(packageRoot)
-            else:
-                packageList.append(os.path.basename(packageRoot))
+        if invokeShouldInitializePackageCallback and packageRoots:
+            initializedPackageRoots = self._allLib.callbackOperator().invokeShouldInitializePackages(packageRoots)
+            packageRoots            = [x for x in packageRoots if x in initializedPackageRoots]
 
-        return packageList
+        if absolutePath:
+            return packageRoots
+
+        return [os.path.basename(x) for x in packageRoots]
 
     #
     ## @brief List versioned packages located in the env path.
     #
+    #  Versions are probed from the newest downward if `newestVersionOnly` is provided `True` and probing stops
+    #  at the first valid version, therefore package info modules of the older versions aren't checked. Pre-release
+    #  versions are probed after release versions, unless they are included by the settings,
+    #  see mMeco.operators.settingsOpt.SettingsOperator.getNewestVersionSortKey.
+    #
     #  @param absolutePath                          [ bool | False | in  ] - Whether to return absolute path of the packages.
     #  @param invokeShouldInitializePackageCallback [ bool | True  | in  ] - Whether to invoke `shouldInitializePackage` callback.
+    #  @param newestVersionOnly                     [ bool | False | in  ] - Whether to list only the newest valid version of the packages.
     #
     #  @exception ValueError - If the env package type is not mMeco.libs.enumLib.EnvPackageType.kVersioned.
     #
     #  @return list of dict - Packages. Dict keys are `package` and `versions`.
-    def _listVersionedPackages(self, absolutePath=False, invokeShouldInitializePackageCallback=True):
+    def _listVersionedPackages(self, absolutePath=False, invokeShouldInitializePackageCallback=True, newestVersionOnly=False):
 
         if self._envPackageType != mMeco.libs.enumLib.EnvPackageType.kVersioned:
             raise ValueError('"{}" env path doesn\'t contain versioned packages.'.format(self._envType))
 
+        packageIndex = self._getPackageIndex(refresh=True)
+
         packageList = []
+        pending     = []
 
-        for packageRootPath in glob.glob('{}/*'.format(self._path)):
+        del self._invalidVersions[:]
 
-            packageName = os.path.basename(packageRootPath)
+        for packageName in packageIndex.listPackages():
 
             packageData = {'package':packageName, 'versions':[]}
 
             if absolutePath:
-                packageData['package'] = packageRootPath
+                packageData['package'] = os.path.join(self._path, packageName)
+
+            versions = packageIndex.getPackage(packageName)['versions'].keys()
+
+            if newestVersionOnly:
+                versions = sorted(versions, key=self._allLib.settingsOperator().getNewestVersionSortKey(), reverse=True)
+            else:
+                versions = sorted(versions)
 
-            for version in glob.glob('{}/*'.format(packageRootPath)):
+            packageList.append(packageData)
+            pending.append((packageData, packageName, self._iterateValidVersions(packageIndex, packageName, versions)))
 
-                packageInfoModuleFilePath = os.path.join(version,
-                                                         packageName,
-                                                         'python',
-                                                         os.path.basename(packageRootPath),
-                                                         'packageInfoLib.py')
+        # Candidate versions of all packages are passed to the callback at once. If `newestVersionOnly` is provided
+        # `True`, packages of which newest valid version has been rejected are visited again for their next valid version.
+        while pending:
 
-                if not os.path.isfile(packageInfoModuleFilePath):
-                    self._allLib.logger().addWarning('Package info module of "{}" version of the package is missing, '
-                                                  'this version is ignored: {} '.format(os.path.basename(version),
-                                                                                        packageInfoModuleFilePath
-                                                                                        )
-                                                     )
-                    continue
+            candidates = []
 
+            for packageData, packageName, validVersions in pending:
 
-                if invokeShouldInitializePackageCallback and \
-                   not self._allLib.callbackOperator().invokeShouldInitializePackage(os.path.join(version, packageName)):
-                    continue
+                for version in validVersions:
 
-                packageData['versions'].append(os.path.basename(version))
+                    candidates.append((packageData, version, os.path.join(self._path, packageName, version, packageName)))
 
-            packageData['versions'].sort(key=lambda x: [int(x) for x in x.split('.')])
+                    if newestVersionOnly:
+                        break
 
-            packageList.append(packageData)
+            if not candidates:
+                break
+
+            initializedPaths = None
+            if invokeShouldInitializePackageCallback:
+                initializedPaths = self._allLib.callbackOperator().invokeShouldInitializePackages([x[2] for x in candidates])
+
+            for packageData, version, path in candidates:
+
+                if initializedPaths is None or path in initializedPaths:
+                    packageData['versions'].append(version)
+
+            if not newestVersionOnly:
+                break
+
+            pending = [x for x in pending if not x[0]['versions']]
+
+        for packageData in packageList:
+            packageData['versions'].sort(key=mMeco.fileSystem.versionLib.SemanticVersion.getSortKey)
+
+        # Keep versions found valid for the next execution
+        packageIndex.flush()
 
         # Remove the package if there is no version of it
         packageList = [x for x in packageList if x['versions']]
@@ -274,6 +397,30 @@ class EnvPath(object):
 
         return self._packages
 
+    #
+    ## @brief Property.
+    #
+    #  Packages are set as they are, no check is done on file system.
+    #
+    #  @param packages [ list of str | list of dict | None | in  ] - Packages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setPackages(self, packages):
+
+        self._packages = packages
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Package names and versions found invalid by the last listing of versioned packages.
+    def invalidVersions(self):
+
+        return self._invalidVersions
+
     #
     # ------------------------------------------------------------------------------------------------
     # PUBLIC METHODS
@@ -296,7 +443,7 @@ class EnvPath(object):
                                            os.path.basename(packageRootPath),
                                            'packageInfoLib.py')
 
-        if os.path.isfile(packageInfoFilePath):
+        if self._allLib.statCache().isFile(packageInfoFilePath):
             return packageInfoFilePath
 
         return None
@@ -316,12 +463,17 @@ class EnvPath(object):
     #  @return None - If no package with `packageName` exists in the env.
     def hasPackage(self, packageName, checkPackageInfoModule=False):
 
-        packageRootPath = os.path.join(self._path, packageName)
-        if not os.path.isdir(packageRootPath):
+        package = self._getPackageIndex().getPackage(packageName)
+        if not package or not package['isDirectory']:
             return None
 
+        packageRootPath = os.path.join(self._path, packageName)
+
         if checkPackageInfoModule:
-            if not self.isAPackage(packageRootPath):
+            if self._envPackageType == mMeco.libs.enumLib.EnvPackageType.kNonVersioned:
+                if not package['hasPackageInfo']:
+                    return None
+            elif not self.isAPackage(packageRootPath):
                 return None
 
         return packageRootPath
@@ -341,30 +493,27 @@ class EnvPath(object):
         if self._envPackageType != mMeco.libs.enumLib.EnvPackageType.kVersioned:
             raise ValueError('"{}" env path doesn\'t contain versioned packages.'.format(self._envType))
 
-        packageRootPath = os.path.join(self._path, packageName, version, packageName)
-        if not os.path.isdir(packageRootPath):
+        if not self._getPackageIndex().hasPackageInfo(packageName, version):
             return None
 
-        if not self.isAPackage(packageRootPath):
-            return None
-
-        return packageRootPath
+        return os.path.join(self._path, packageName, version, packageName)
 
     #
     ## @brief List packages in the env path.
     #
     #  @param invokeShouldInitializePackageCallback [ bool | False | in  ] - Whether to invoke `shouldInitializePackage` callback.
+    #  @param newestVersionOnly                     [ bool | False | in  ] - Whether to list only the newest valid version of versioned packages.
     #
     #  @exception N/A
     #
     #  @return list of str  - If env package type is mMeco.libs.enumLib.EnvPackageType.kNonVersioned.
     #  @return list of dict - If env package type is mMeco.libs.enumLib.EnvPackageType.kVersioned.
-    def listPackages(self, invokeShouldInitializePackageCallback=False):
+    def listPackages(self, invokeShouldInitializePackageCallback=False, newestVersionOnly=False):
 
         if self._envPackageType == mMeco.libs.enumLib.EnvPackageType.kNonVersioned:
             self._packages = self._listNonVersionedPackages(False, invokeShouldInitializePackageCallback)
         else:
-            self._packages = self._listVersionedPackages(False, invokeShouldInitializePackageCallback)
+            self._packages = self._listVersionedPackages(False, invokeShouldInitializePackageCallback, newestVersionOnly)
 
         return self._packages
 
@@ -382,15 +531,15 @@ class EnvPath(object):
         if self._envPackageType != mMeco.libs.enumLib.EnvPackageType.kVersioned:
             raise ValueError('"{}" env path doesn\'t contain versioned packages.'.format(self._envType))
 
-        packageRootPath = self.hasPackage(packageName, False)
-        if not packageRootPath:
+        packageIndex = self._getPackageIndex()
+
+        package = packageIndex.getPackage(packageName)
+        if not package or not package['isDirectory']:
             return None
 
-        versionList = mMeco.fileSystem.directoryLib.Directory.listVersionedFolders(directory=packageRootPath,
-                                                                                   absolutePath=False,
-                                                                                   version=mMeco.fileSystem.versionLib.Version.kAll
-                                                                                   )
+        versionList = [x for x in package['versions'].keys()
+                       if re.search(r'([0-9]{1,}\.[0-9]{1,}\.[0-9]{1,})', x) and packageIndex.hasPackageInfo(packageName, x)]
 
-        versionList = [x for x in versionList if self.isAPackage(os.path.join(packageRootPath, x, packageName))]
+        versionList.sort(key=mMeco.fileSystem.versionLib.SemanticVersion.getSortKey)
 
         return versionList
@@ -0,0 +1,387 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/libs/fingerprintLib.py @brief [ FILE   ] - Fingerprint.
+## @package mMeco.libs.fingerprintLib    @brief [ MODULE ] - Fingerprint.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  hashlib
+import  os
+
+import  mMeco.libs.allLib
+import  mMeco.libs.enumLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Fingerprint of the inputs of an env resolution.
+#
+#  Fingerprint is computed from
+#
+#  - Request fields that affect the solved packages and the built env entry containers.
+#  - Paths resolved by mMeco.operators.settingsOpt.SettingsOperator class.
+#  - Modification times of settings, callback and package global env modules, and the app file.
+#  - Modification times of each env path's root directory and package directories.
+#  - Modification times of package info modules, package env modules and package env files of
+#    non-versioned packages, since they are edited in place.
+#
+#  Adding or removing a version changes modification time of the package directory. A version is valid only
+#  if its package info module exists, which doesn't change the modification time of the package directory.
+#  Version directories aren't listed to compute the fingerprint, instead package info modules of the versions
+#  used by the resolved env and of the versions found invalid while resolving it are kept after the packages
+#  are solved, see mMeco.libs.fingerprintLib.Fingerprint.computeVersions. They are stored with the
+#  fingerprint and only they are checked when the stored fingerprint matches.
+#
+#  Content of a released version of a versioned package is expected not to change, therefore its package
+#  env module and package env file aren't used.
+#
+#  Callbacks aren't invoked when the cache is reused, only modification time of the callback module is
+#  used. Therefore `shouldInitializePackage`, `shouldInitializePackages`, `getPreBuild` and `getPostBuild`
+#  callbacks must return the same result for the same inputs, otherwise cache must be ignored with
+#  `--ignore-cache` flag.
+class Fingerprint(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ list of str ] - Inputs the fingerprint is computed from.
+        self._inputs                = []
+
+        ## [ dict ] - Modification times of the files and directories the fingerprint is computed from.
+        self._modificationTimes     = {}
+
+        ## [ dict ] - Modification times of package info modules of the versions used or found invalid by the solver.
+        self._versionModificationTimes = {}
+
+        ## [ str ] - Fingerprint.
+        self._value                 = None
+
+        ## [ mMeco.libs.allLib.All ] - All.
+        self._allLib                = mMeco.libs.allLib.All.getInstance(**{'fingerprint':self})
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String representation.
+    def __str__(self):
+
+        return self._value if self._value else ''
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Add an input.
+    #
+    #  @param name  [ str    | None | in  ] - Name of the input.
+    #  @param value [ object | None | in  ] - Value of the input.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _add(self, name, value):
+
+        self._inputs.append('{}={!r}'.format(name, value))
+
+    #
+    ## @brief Add modification time of given path.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file or directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addModificationTime(self, path):
+
+        try:
+            modificationTime = os.stat(path).st_mtime
+        except OSError:
+            modificationTime = None
+
+        self._modificationTimes[path] = modificationTime
+
+        self._add(path, modificationTime)
+
+    #
+    ## @brief Add modification time of package info module of given version.
+    #
+    #  @param path        [ str  | None | in  ] - Absolute path of the env path.
+    #  @param packageName [ str  | None | in  ] - Name of the package.
+    #  @param version     [ str  | None | in  ] - Version.
+    #  @param isValid     [ bool | None | in  ] - Whether the version has been found valid.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addVersionModificationTime(self, path, packageName, version, isValid):
+
+        packageInfoModuleFilePath = os.path.join(path, packageName, version, packageName, 'python', packageName, 'packageInfoLib.py')
+
+        modificationTime = None
+
+        if isValid:
+            try:
+                modificationTime = os.stat(packageInfoModuleFilePath).st_mtime
+            except OSError:
+                modificationTime = None
+
+        self._versionModificationTimes[packageInfoModuleFilePath] = modificationTime
+
+    #
+    ## @brief Add request fields.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addRequest(self):
+
+        request = self._allLib.request()
+
+        self._add('pythonVersion'       , request.pythonVersion())
+        self._add('platform'            , request.platform())
+        self._add('project'             , request.project())
+        self._add('developer'           , request.developer())
+        self._add('development'         , request.development())
+        self._add('stage'               , request.stage())
+        self._add('app'                 , request.app())
+        self._add('ignoreEnvScripts'    , request.ignoreEnvScripts())
+        self._add('ignoreEnvCommands'   , request.ignoreEnvCommands())
+        self._add('ignorePre'           , request.ignorePre())
+        self._add('ignorePost'          , request.ignorePost())
+
+    #
+    ## @brief Add paths resolved by settings operator.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addSettings(self):
+
+        settingsOperator = self._allLib.settingsOperator()
+
+        for layer in self._allLib.layerStack().layers():
+            self._add('layer', '{}:{}:{}'.format(layer.name(), layer.path(), layer.isVersioned()))
+
+        self._add('appFilePath'                       , settingsOperator.appFilePath())
+        self._add('scriptFilePath'                    , settingsOperator.scriptFilePath())
+
+        for operator in [settingsOperator,
+                         self._allLib.callbackOperator(),
+                         self._allLib.packageGlobalEnvOperator()]:
+
+            if operator and operator.module() and hasattr(operator.module(), '__file__'):
+                self._addModificationTime(operator.module().__file__)
+
+        if settingsOperator.appFilePath():
+            self._addModificationTime(settingsOperator.appFilePath())
+
+    #
+    ## @brief Add env path.
+    #
+    #  @param path        [ str  | None | in  ] - Absolute path of the env path.
+    #  @param isVersioned [ bool | None | in  ] - Whether the env path contains versioned packages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addEnvPath(self, path, isVersioned):
+
+        if not path:
+            return
+
+        self._addModificationTime(path)
+
+        entries = self._allLib.statCache().listDirectory(path)
+        if entries is None:
+            return
+
+        entries.sort()
+
+        for entry in entries:
+
+            packageRootPath = os.path.join(path, entry)
+
+            self._addModificationTime(packageRootPath)
+
+            if isVersioned:
+                continue
+
+            packagePythonPath = os.path.join(packageRootPath, 'python', entry)
+
+            self._addModificationTime(os.path.join(packagePythonPath, 'packageInfoLib.py'))
+            self._addModificationTime(os.path.join(packagePythonPath, 'packageEnvLib.py'))
+            self._addModificationTime(os.path.join(packagePythonPath, 'packageEnv.json'))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Value.
+    def inputs(self):
+
+        return self._inputs
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Value. Keys are absolute paths, values are modification times.
+    def modificationTimes(self):
+
+        return self._modificationTimes
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Value. Keys are absolute paths of package info modules, values are modification times.
+    def versionModificationTimes(self):
+
+        return self._versionModificationTimes
+
+    #
+    ## @brief Property.
+    #
+    #  @param versionModificationTimes [ dict | None | in  ] - Keys are absolute paths of package info modules, values are modification times.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setVersionModificationTimes(self, versionModificationTimes):
+
+        self._versionModificationTimes = versionModificationTimes
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def value(self):
+
+        return self._value
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Compute the fingerprint.
+    #
+    #  Request must be parsed and settings operator must be initialized before this method is invoked.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Fingerprint.
+    def compute(self):
+
+        self._inputs            = []
+        self._modificationTimes = {}
+
+        self._addRequest()
+
+        self._addSettings()
+
+        for layer in self._allLib.layerStack().layers():
+            self._addEnvPath(layer.path(), layer.isVersioned())
+
+        self._value = hashlib.sha1('\n'.join(self._inputs).encode('utf-8')).hexdigest()
+
+        return self._value
+
+    #
+    ## @brief Get modification times of package info modules of the versions used or found invalid by given solver.
+    #
+    #  Package info modules of the versions found invalid don't exist, their modification times are `None`.
+    #
+    #  @param solver [ mMeco.abstract.solverAbs.Solver | None | in  ] - Solver, which solved the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are absolute paths of package info modules, values are modification times.
+    def computeVersions(self, solver):
+
+        self._versionModificationTimes = {}
+
+        for envPath in solver.envPaths():
+
+            if envPath.envPackageType() != mMeco.libs.enumLib.EnvPackageType.kVersioned:
+                continue
+
+            for package in envPath.packages():
+                for version in package['versions']:
+                    self._addVersionModificationTime(envPath.path(), package['package'], version, True)
+
+            for packageName, version in envPath.invalidVersions():
+                self._addVersionModificationTime(envPath.path(), packageName, version, False)
+
+        return self._versionModificationTimes
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether modification time of any of given paths has changed.
+    #
+    #  @param modificationTimes [ dict | None | in  ] - Keys are absolute paths, values are modification times, `None` for paths which didn't exist.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def hasChanged(modificationTimes):
+
+        for path, modificationTime in modificationTimes.items():
+
+            try:
+                if os.stat(path).st_mtime != modificationTime:
+                    return True
+            except OSError:
+                if modificationTime is not None:
+                    return True
+
+        return False
+
+
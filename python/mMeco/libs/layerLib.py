@@ -0,0 +1,428 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/libs/layerLib.py @brief [ FILE   ] - Layer.
+## @package mMeco.libs.layerLib    @brief [ MODULE ] - Layer.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  mMeco.libs.allLib
+import  mMeco.libs.enumLib
+import  mMeco.libs.resolverLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Layer, which represents an env path, packages of which are used in the env.
+class Layer(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param name         [ str          | None | in  ] - Name of the layer, which is used as env type, such as a value from mMeco.libs.enumLib.EnvType enum class.
+    #  @param path         [ str          | None | in  ] - Absolute path of the env path.
+    #  @param isVersioned  [ bool         | None | in  ] - Whether the env path contains versioned packages.
+    #  @param claimScopes  [ list of enum | None | in  ] - Scopes the layer claims its packages in, values from mMeco.libs.enumLib.PackageScope enum class.
+    #  @param filterScope  [ enum         | None | in  ] - Scope the layer is filtered by, a value from mMeco.libs.enumLib.PackageScope enum class.
+    #  @param infoName     [ str          | None | in  ] - Name displayed next to the number of the packages of the layer, such as project name.
+    #  @param colorEnvType [ enum         | None | in  ] - Env type, terminal display colors of which are used for the layer, name of the layer is used if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, name, path, isVersioned, claimScopes=None, filterScope=None, infoName=None, colorEnvType=None):
+
+        ## [ str ] - Name.
+        self._name          = name
+
+        ## [ str ] - Absolute path of the env path.
+        self._path          = path
+
+        ## [ bool ] - Whether the env path contains versioned packages.
+        self._isVersioned   = isVersioned
+
+        ## [ list of enum ] - Scopes the layer claims its packages in.
+        self._claimScopes   = claimScopes if claimScopes else []
+
+        ## [ enum ] - Scope the layer is filtered by.
+        self._filterScope   = filterScope
+
+        ## [ str ] - Name displayed next to the number of the packages of the layer.
+        self._infoName      = infoName
+
+        ## [ enum ] - Env type, terminal display colors of which are used for the layer.
+        self._colorEnvType  = colorEnvType if colorEnvType else name
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String representation.
+    def __str__(self):
+
+        return self.asStr()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def name(self):
+
+        return self._name
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def isVersioned(self):
+
+        return self._isVersioned
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return list of enum - Value.
+    def claimScopes(self):
+
+        return self._claimScopes
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return enum - Value.
+    def filterScope(self):
+
+        return self._filterScope
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def infoName(self):
+
+        return self._infoName
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return enum - Value.
+    def colorEnvType(self):
+
+        return self._colorEnvType
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get string representation of the class.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Information about the layer in human readable form.
+    def asStr(self):
+
+        return '{} ({}): {}'.format(self._name,
+                                    'Versioned' if self._isVersioned else 'Non-Versioned',
+                                    self._path)
+
+#
+## @brief [ CLASS ] - Layer stack, which keeps the layers in precedence order.
+#
+#  Solver, builder and response iterate the layers of the layer stack, therefore a layer can be added
+#  by `addLayers` function of the settings module without changing them.
+#
+# @code
+#def addLayers(layerStack, project, developer, development, stage, system):
+#
+#    layerStack.add(mMeco.libs.layerLib.Layer('Show Internal',
+#                                             '/mnt/shows/{}/packages/internal'.format(project),
+#                                             True,
+#                                             claimScopes=[mMeco.libs.enumLib.PackageScope.kInternal],
+#                                             filterScope=mMeco.libs.enumLib.PackageScope.kInternal,
+#                                             infoName=project,
+#                                             colorEnvType=mMeco.libs.enumLib.EnvType.kProjectInternal),
+#                   before=mMeco.libs.enumLib.EnvType.kMasterProjectInternal)
+# @endcode
+class LayerStack(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ list of mMeco.libs.layerLib.Layer ] - Layers in precedence order.
+        self._layers    = []
+
+        ## [ mMeco.libs.allLib.All ] - All.
+        self._allLib    = mMeco.libs.allLib.All.getInstance(**{'layerStack':self})
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String representation.
+    def __str__(self):
+
+        return self.asStr()
+
+    #
+    ## @brief Get index of the layer by given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the layer.
+    #
+    #  @exception ValueError - If no layer found by given name.
+    #
+    #  @return int - Index.
+    def __getIndex(self, name):
+
+        for index, layer in enumerate(self._layers):
+            if layer.name() == name:
+                return index
+
+        raise ValueError('No layer found by given name: {}'.format(name))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mMeco.libs.layerLib.Layer - Value.
+    def layers(self):
+
+        return self._layers
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get string representation of the class.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Information about the layers in human readable form.
+    def asStr(self):
+
+        data = ''
+        data += '\nLAYERS'
+        data += '\n{}'.format('-' * 100)
+
+        for layer in self._layers:
+            data += '\n{}'.format(layer.asStr())
+
+        return data
+
+    #
+    ## @brief Get names of the layers in precedence order.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names.
+    def names(self):
+
+        return [x.name() for x in self._layers]
+
+    #
+    ## @brief Get layer by given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the layer.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.layerLib.Layer - Layer.
+    #  @return None                      - If no layer found by given name.
+    def getByName(self, name):
+
+        for layer in self._layers:
+            if layer.name() == name:
+                return layer
+
+        return None
+
+    #
+    ## @brief Add a layer.
+    #
+    #  Layer is added as the layer with the lowest precedence unless `before` or `after` is provided.
+    #
+    #  @param layer  [ mMeco.libs.layerLib.Layer | None | in  ] - Layer.
+    #  @param before [ str                       | None | in  ] - Name of the layer, which the layer will be added before.
+    #  @param after  [ str                       | None | in  ] - Name of the layer, which the layer will be added after.
+    #
+    #  @exception ValueError - If a layer with the same name already exists.
+    #  @exception ValueError - If no layer found by given `before` or `after` name.
+    #  @exception IOError    - If path of the layer doesn't exist.
+    #
+    #  @return None - None.
+    def add(self, layer, before=None, after=None):
+
+        if self.getByName(layer.name()):
+            raise ValueError('Layer already exists: {}'.format(layer.name()))
+
+        if not layer.path() or not self._allLib.statCache().isDirectory(layer.path()):
+            raise IOError('Layer path doesn\'t exist: {}'.format(layer.path()))
+
+        if before:
+            self._layers.insert(self.__getIndex(before), layer)
+        elif after:
+            self._layers.insert(self.__getIndex(after) + 1, layer)
+        else:
+            self._layers.append(layer)
+
+    #
+    ## @brief Remove the layer by given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the layer.
+    #
+    #  @exception ValueError - If no layer found by given name.
+    #
+    #  @return mMeco.libs.layerLib.Layer - Removed layer.
+    def remove(self, name):
+
+        return self._layers.pop(self.__getIndex(name))
+
+    #
+    ## @brief Remove packages overridden by the layers with higher precedence.
+    #
+    #  Resolving is linear in the total number of packages regardless of the number of the layers,
+    #  see mMeco.libs.resolverLib.Resolver class.
+    #
+    #  @param packages [ dict | None | in  ] - Keys are names of the layers, values are packages of the layers.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are names of the layers, values are packages, which haven't been overridden.
+    def resolve(self, packages):
+
+        resolver = mMeco.libs.resolverLib.Resolver()
+
+        for layer in self._layers:
+
+            if not layer.name() in packages:
+                continue
+
+            resolver.addLayer(layer.name(),
+                              packages[layer.name()],
+                              claimScopes=layer.claimScopes(),
+                              filterScope=layer.filterScope())
+
+        return resolver.resolve()
+
+    #
+    ## @brief Add default layers, which are resolved by given settings operator.
+    #
+    #  @param settingsOperator [ mMeco.operators.settingsOpt.SettingsOperator | None | in  ] - Settings operator.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addDefaultLayers(self, settingsOperator):
+
+        bothScopes = [mMeco.libs.enumLib.PackageScope.kInternal, mMeco.libs.enumLib.PackageScope.kExternal]
+
+        for name, path, isVersioned, claimScopes, filterScope, infoName in \
+            [(mMeco.libs.enumLib.EnvType.kReserved,
+              settingsOperator.reservedPackagesPath(),
+              False, None, None,
+              settingsOperator.projectNameInUse()),
+
+             (mMeco.libs.enumLib.EnvType.kDevelopment,
+              settingsOperator.developmentPackagesPath(),
+              False, bothScopes, None,
+              settingsOperator.projectNameInUse()),
+
+             (mMeco.libs.enumLib.EnvType.kStage,
+              settingsOperator.stagePackagesPath(),
+              False, bothScopes, None,
+              self._allLib.request().stage()),
+
+             (mMeco.libs.enumLib.EnvType.kProjectInternal,
+              settingsOperator.projectInternalPackagesPath(),
+              True, [mMeco.libs.enumLib.PackageScope.kInternal], mMeco.libs.enumLib.PackageScope.kInternal,
+              settingsOperator.projectNameInUse()),
+
+             (mMeco.libs.enumLib.EnvType.kProjectExternal,
+              settingsOperator.projectExternalPackagesPath(),
+              True, [mMeco.libs.enumLib.PackageScope.kExternal], mMeco.libs.enumLib.PackageScope.kExternal,
+              settingsOperator.projectNameInUse()),
+
+             (mMeco.libs.enumLib.EnvType.kMasterProjectInternal,
+              settingsOperator.masterProjectInternalPackagesPath(),
+              True, [mMeco.libs.enumLib.PackageScope.kInternal], mMeco.libs.enumLib.PackageScope.kInternal,
+              settingsOperator.masterProjectName()),
+
+             (mMeco.libs.enumLib.EnvType.kMasterProjectExternal,
+              settingsOperator.masterProjectExternalPackagesPath(),
+              True, [mMeco.libs.enumLib.PackageScope.kExternal], mMeco.libs.enumLib.PackageScope.kExternal,
+              settingsOperator.masterProjectName())]:
+
+            if not path:
+                continue
+
+            self.add(Layer(name, path, isVersioned, claimScopes=claimScopes, filterScope=filterScope, infoName=infoName))
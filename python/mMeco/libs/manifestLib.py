@@ -0,0 +1,176 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/libs/manifestLib.py @brief [ FILE   ] - Manifest.
+## @package mMeco.libs.manifestLib    @brief [ MODULE ] - Manifest.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  json
+import  os
+
+import  mMeco.fileSystem.fileLib
+
+import  mMeco.libs.aboutLib
+import  mMeco.libs.allLib
+import  mMeco.libs.fingerprintLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Manifest of a script file.
+#
+#  Manifest is written next to the script file and contains the env paths, the packages and versions
+#  used by the script file and modification times of the files and directories that produced it,
+#  see mMeco.libs.fingerprintLib.Fingerprint class. It is used to check whether a script file is stale,
+#  only by checking modification times without listing any env path.
+#
+#  Modification times include package info modules of the versions used or found invalid by the solver,
+#  so a script file is stale when one of them becomes valid or invalid. Manifest files of version 1 don't
+#  contain them and are considered stale.
+class Manifest(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ int ] - Version of the manifest data structure.
+    VERSION = 2
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the manifest file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path=None):
+
+        ## [ str ] - Absolute path of the manifest file.
+        self._path      = path
+
+        ## [ mMeco.libs.allLib.All ] - All.
+        self._allLib    = mMeco.libs.allLib.All.getInstance()
+
+    #
+    ## @brief Get env paths of the layers.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are names of the layers, values are absolute paths.
+    def __getEnvPaths(self):
+
+        return dict([(x.name(), x.path()) for x in self._allLib.layerStack().layers()])
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def path(self):
+
+        return self._path
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write the manifest file.
+    #
+    #  @param fingerprint [ mMeco.libs.fingerprintLib.Fingerprint | None | in  ] - Fingerprint computed before the env is resolved.
+    #  @param solver      [ mMeco.abstract.solverAbs.Solver        | None | in  ] - Solver, which solved the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the manifest file.
+    def write(self, fingerprint, solver):
+
+        packages            = {}
+        modificationTimes   = dict(fingerprint.modificationTimes())
+
+        modificationTimes.update(fingerprint.versionModificationTimes())
+
+        for envPath in solver.envPaths():
+            packages[envPath.envType()] = envPath.packages()
+
+        data = {'version'           : Manifest.VERSION,
+                'mecoVersion'       : mMeco.libs.aboutLib.getVersion(),
+                'fingerprint'       : fingerprint.value(),
+                'envPaths'          : self.__getEnvPaths(),
+                'packages'          : packages,
+                'modificationTimes' : modificationTimes}
+
+        return mMeco.fileSystem.fileLib.File.writeAtomically(self._path, json.dumps(data, sort_keys=True))
+
+    #
+    ## @brief Remove the manifest file if it exists.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def remove(self):
+
+        if self._path and os.path.isfile(self._path):
+            os.remove(self._path)
+
+    #
+    ## @brief Check whether the script file that the manifest has been written for is up to date.
+    #
+    #  Only modification times stored in the manifest file are checked, no env path is listed.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isUpToDate(self):
+
+        if not self._path or not os.path.isfile(self._path):
+            return False
+
+        try:
+            with open(self._path, 'r') as _file:
+                data = json.loads(_file.read())
+        except (IOError, OSError, ValueError):
+            return False
+
+        if not isinstance(data, dict) or data.get('version') != Manifest.VERSION or \
+           data.get('mecoVersion') != mMeco.libs.aboutLib.getVersion():
+            return False
+
+        if data.get('envPaths') != self.__getEnvPaths():
+            return False
+
+        return not mMeco.libs.fingerprintLib.Fingerprint.hasChanged(data.get('modificationTimes', {}))
+
+
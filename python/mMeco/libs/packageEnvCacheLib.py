@@ -0,0 +1,392 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/libs/packageEnvCacheLib.py @brief [ FILE   ] - Package env cache.
+## @package mMeco.libs.packageEnvCacheLib    @brief [ MODULE ] - Package env cache.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  hashlib
+import  json
+import  os
+
+import  mMeco.fileSystem.fileLib
+
+import  mMeco.libs.aboutLib
+import  mMeco.libs.allLib
+import  mMeco.libs.entryLib
+
+import  mMeco.operators.packageEnvOpt
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Cache of the env entry containers built for the versioned packages of an env path.
+#
+#  Content of a released version of a versioned package is expected not to change, therefore env entry
+#  container built for a version by its package env module and package global env is stored and replayed
+#  by the next executions without importing the package env module.
+#
+#  A stored env entry container is used only if the inputs it has been built from are the same, which are
+#
+#  - Modification times of the package env file and the package env module of the version.
+#  - Modification times of settings, callback and package global env modules, and the app file.
+#  - Request fields, which describe the requested env, see mMeco.libs.packageEnvCacheLib.PackageEnvCache.REQUEST_FIELDS.
+#    Package env modules and package global env can read them through mMeco.libs.requestLib.Request class.
+#
+#  Request fields, which only change how the resolved env is written or logged, such as `--display-only` or
+#  `--verbose`, aren't inputs. Package env modules of versioned packages are expected to set the same env
+#  entries for the same inputs, a package env module, which depends on anything else, such as env variables of
+#  the process, must not be cached and `--ignore-cache` flag must be used.
+#
+#  Since the request fields are inputs, the same version can be built for another project, developer, development
+#  or stage. Env entry containers of a version are stored for the last
+#  mMeco.libs.packageEnvCacheLib.PackageEnvCache.ENTRIES_PER_VERSION distinct inputs, so alternating between
+#  requests doesn't replace them each time, the oldest one is dropped.
+class PackageEnvCache(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ int ] - Version of the cache data structure.
+    VERSION             = 3
+
+    ## [ int ] - Maximum number of env entry containers stored for a version, each of which is built from distinct inputs.
+    ENTRIES_PER_VERSION = 4
+
+    ## [ list of str ] - Names of mMeco.libs.requestLib.Request methods, which return the request fields used as inputs.
+    REQUEST_FIELDS      = ['pythonVersion',
+                           'platform',
+                           'project',
+                           'developer',
+                           'development',
+                           'stage',
+                           'app',
+                           'appArgs',
+                           'ignoreAppExec',
+                           'ignoreEnvScripts',
+                           'ignoreEnvCommands',
+                           'ignorePre',
+                           'ignorePost']
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path          [ str | None | in  ] - Absolute path of the env path.
+    #  @param cacheFilePath [ str | None | in  ] - Absolute path of the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path, cacheFilePath):
+
+        ## [ str ] - Absolute path of the env path.
+        self._path              = path
+
+        ## [ str ] - Absolute path of the cache file.
+        self._cacheFilePath     = cacheFilePath
+
+        ## [ dict ] - Packages, keys are `packageName:version`, values are lists of dicts with `inputs`, `isInitialized` and `envEntryContainer` keys, the newest first.
+        self._packages          = {}
+
+        ## [ list of str ] - Inputs shared by all packages of the env path.
+        self._inputs            = []
+
+        ## [ bool ] - Whether the cache has changed since it has been written.
+        self._hasChanged        = False
+
+        ## [ mMeco.libs.allLib.All ] - All.
+        self._allLib            = mMeco.libs.allLib.All.getInstance()
+
+        #
+
+        self._setInputs()
+        self._read()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Set inputs shared by all packages of the env path.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _setInputs(self):
+
+        request             = self._allLib.request()
+        settingsOperator    = self._allLib.settingsOperator()
+        statCache           = self._allLib.statCache()
+
+        self._inputs = ['path={!r}'.format(self._path),
+                        'mecoVersion={!r}'.format(mMeco.libs.aboutLib.getVersion()),
+                        'appFilePath={!r}'.format(settingsOperator.appFilePath())]
+
+        for field in PackageEnvCache.REQUEST_FIELDS:
+            self._inputs.append('{}={!r}'.format(field, getattr(request, field)()))
+
+        for operator in [settingsOperator,
+                         self._allLib.callbackOperator(),
+                         self._allLib.packageGlobalEnvOperator()]:
+
+            if operator and operator.module() and hasattr(operator.module(), '__file__'):
+                self._inputs.append('{}={!r}'.format(operator.module().__file__,
+                                                     statCache.getModificationTime(operator.module().__file__)))
+
+        if settingsOperator.appFilePath():
+            self._inputs.append('{}={!r}'.format(settingsOperator.appFilePath(),
+                                                 statCache.getModificationTime(settingsOperator.appFilePath())))
+
+    #
+    ## @brief Get inputs of given env entry container, which represents a version of a versioned package.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Hash of the inputs.
+    def _getInputs(self, envEntryContainer):
+
+        packagePythonPath = mMeco.operators.packageEnvOpt.PackageEnvOperator.getPackagePythonPath(envEntryContainer)
+
+        inputs = list(self._inputs)
+
+        for fileName in [mMeco.operators.packageEnvOpt.PackageEnvOperator.FILE_NAME,
+                         mMeco.operators.packageEnvOpt.PackageEnvOperator.MODULE_FILE_NAME]:
+
+            filePath = os.path.join(packagePythonPath, fileName)
+
+            inputs.append('{}={!r}'.format(filePath, self._allLib.statCache().getModificationTime(filePath)))
+
+        return hashlib.sha1('\n'.join(inputs).encode('utf-8')).hexdigest()
+
+    #
+    ## @brief Get key of given env entry container.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Key.
+    def _getKey(self, envEntryContainer):
+
+        return '{}:{}'.format(envEntryContainer.packageName(), envEntryContainer.version())
+
+    #
+    ## @brief Find stored entry of given env entry container, which has been built from the same inputs.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Entry.
+    #  @return None - If there is no entry built from the same inputs.
+    def _find(self, envEntryContainer):
+
+        entries = self._packages.get(self._getKey(envEntryContainer))
+        if not entries:
+            return None
+
+        inputs = self._getInputs(envEntryContainer)
+
+        for entry in entries:
+            if entry['inputs'] == inputs:
+                return entry
+
+        return None
+
+    #
+    ## @brief Read the cache file.
+    #
+    #  Cache file that can't be read or that has been written for another env path is ignored.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _read(self):
+
+        if not self._cacheFilePath or not os.path.isfile(self._cacheFilePath):
+            return
+
+        try:
+            with open(self._cacheFilePath, 'r') as _file:
+                data = json.loads(_file.read())
+        except (IOError, OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or \
+           data.get('version') != PackageEnvCache.VERSION or \
+           data.get('path') != self._path:
+            return
+
+        self._packages = data['packages']
+
+    #
+    ## @brief Write the cache file.
+    #
+    #  Cache file is a cache, failing to write it doesn't fail the execution.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _write(self):
+
+        if not self._cacheFilePath:
+            return
+
+        data = {'version'   : PackageEnvCache.VERSION,
+                'path'      : self._path,
+                'packages'  : self._packages}
+
+        try:
+            mMeco.fileSystem.fileLib.File.writeAtomically(self._cacheFilePath, json.dumps(data, sort_keys=True))
+        except (IOError, OSError):
+            pass
+
+        self._hasChanged = False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def cacheFilePath(self):
+
+        return self._cacheFilePath
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether the cache has an up to date env entry container for given env entry container.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container, which represents a version of a versioned package.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def has(self, envEntryContainer):
+
+        return self._find(envEntryContainer) is not None
+
+    #
+    ## @brief Get stored env entry container for given env entry container.
+    #
+    #  mMeco.libs.packageEnvCacheLib.PackageEnvCache.has method should be used to check whether the stored env
+    #  entry container is up to date.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container, which represents a version of a versioned package.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.entryLib.EnvEntryContainer - Env entry container.
+    #  @return None                                  - If the package hasn't been initialized, since `setEnvironment` function of its package env module returned `False`,
+    #                                                  or there is no env entry container stored for the inputs.
+    def get(self, envEntryContainer):
+
+        entry = self._find(envEntryContainer)
+
+        if not entry or not entry['isInitialized']:
+            return None
+
+        return mMeco.libs.entryLib.EnvEntryContainer.fromDict(entry['envEntryContainer'])
+
+    #
+    ## @brief Store given built env entry container.
+    #
+    #  Env entry container stored for the same inputs is replaced, the oldest one is dropped if there are
+    #  mMeco.libs.packageEnvCacheLib.PackageEnvCache.ENTRIES_PER_VERSION of them.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container, which represents a version of a versioned package.
+    #  @param isInitialized     [ bool                                  | True | in  ] - Whether the package has been initialized.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def set(self, envEntryContainer, isInitialized=True):
+
+        inputs  = self._getInputs(envEntryContainer)
+        key     = self._getKey(envEntryContainer)
+        entries = [x for x in self._packages.get(key, []) if x['inputs'] != inputs]
+
+        entries.insert(0, {'inputs'             : inputs,
+                           'isInitialized'      : isInitialized,
+                           'envEntryContainer'  : envEntryContainer.asDict() if isInitialized else None})
+
+        self._packages[key] = entries[:PackageEnvCache.ENTRIES_PER_VERSION]
+
+        self._hasChanged = True
+
+    #
+    ## @brief Write the cache file if the cache has changed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def flush(self):
+
+        if self._hasChanged:
+            self._write()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get cache file path for given env path.
+    #
+    #  @param cacheDirectoryPath [ str | None | in  ] - Absolute path of the cache directory.
+    #  @param path               [ str | None | in  ] - Absolute path of the env path.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the cache file.
+    @staticmethod
+    def getCacheFilePath(cacheDirectoryPath, path):
+
+        return os.path.join(cacheDirectoryPath,
+                            'packageEnv',
+                            '{}.json'.format(hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()))
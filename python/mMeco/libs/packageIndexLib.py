@@ -0,0 +1,491 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/libs/packageIndexLib.py @brief [ FILE   ] - Package index.
+## @package mMeco.libs.packageIndexLib    @brief [ MODULE ] - Package index.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  hashlib
+import  json
+import  os
+import  stat
+
+import  mMeco.core.threadPoolLib
+
+import  mMeco.fileSystem.fileLib
+import  mMeco.fileSystem.scanLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Index of the packages located in an env path.
+#
+#  Index contains packages of an env path, whether package info module of non-versioned packages exists,
+#  versions of versioned packages and whether each version is a directory, along with the modification times
+#  of the env path and package directories.
+#
+#  Index is refreshed incrementally, package directories are listed only if their modification time has
+#  changed, env path itself is listed only if its modification time has changed. Package info modules of
+#  non-versioned packages are checked again on each refresh, since they are added and removed without
+#  changing the modification time of the package directory.
+#
+#  Package info modules of the versions are probed on demand by mMeco.libs.packageIndexLib.PackageIndex.hasPackageInfo
+#  method, so that a caller, which needs only the newest valid version of a package, doesn't stat every version.
+#  A version is probed each time, whether it has been found valid before or not, therefore results of the probes
+#  aren't stored in the index. If a stat cache is provided, a version is stat'ed once per execution.
+#
+#  If index file path is provided, index is read from and written into the index file, which lets the
+#  next execution to refresh the index incrementally.
+class PackageIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ int ] - Version of the index data structure.
+    VERSION                     = 3
+
+    ## [ int ] - Minimum number of package directories to be scanned to scan them in a thread pool.
+    PARALLEL_SCAN_THRESHOLD     = 16
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path          [ str  | None | in  ] - Absolute path of the env path.
+    #  @param isVersioned   [ bool | None | in  ] - Whether the env path contains versioned packages.
+    #  @param indexFilePath [ str  | None | in  ] - Absolute path of the index file.
+    #  @param maxWorkers    [ int  | 1    | in  ] - Maximum number of threads to scan package directories.
+    #  @param statCache     [ mMeco.libs.statCacheLib.StatCache | None | in  ] - Stat cache to probe package info modules.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path, isVersioned, indexFilePath=None, maxWorkers=1, statCache=None):
+
+        ## [ str ] - Absolute path of the env path.
+        self._path              = path
+
+        ## [ bool ] - Whether the env path contains versioned packages.
+        self._isVersioned       = isVersioned
+
+        ## [ str ] - Absolute path of the index file.
+        self._indexFilePath     = indexFilePath
+
+        ## [ int ] - Maximum number of threads to scan package directories.
+        self._maxWorkers        = maxWorkers
+
+        ## [ float ] - Modification time of the env path.
+        self._modificationTime  = None
+
+        ## [ dict ] - Packages, keys are package names.
+        self._packages          = {}
+
+        ## [ bool ] - Whether the index has been refreshed.
+        self._isRefreshed       = False
+
+        ## [ bool ] - Whether the index has changed since it has been written.
+        self._hasChanged        = False
+
+        ## [ mMeco.fileSystem.scanLib.Scanner ] - Scanner.
+        self._scanner           = mMeco.fileSystem.scanLib.Scanner()
+
+        ## [ mMeco.libs.statCacheLib.StatCache ] - Stat cache to probe package info modules.
+        self._statCache         = statCache
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get absolute path of package info module file.
+    #
+    #  @param packageName [ str | None | in  ] - Name of the package.
+    #  @param version     [ str | None | in  ] - Version of the package, if the package is versioned.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the package info module file.
+    def _getPackageInfoModuleFilePath(self, packageName, version=None):
+
+        if version:
+            return os.path.join(self._path, packageName, version, packageName, 'python', packageName, 'packageInfoLib.py')
+
+        return os.path.join(self._path, packageName, 'python', packageName, 'packageInfoLib.py')
+
+    #
+    ## @brief Check whether given path is a file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _isFile(self, path):
+
+        if self._statCache:
+            return self._statCache.isFile(path)
+
+        return self._scanner.isFile(path)
+
+    #
+    ## @brief Scan a package.
+    #
+    #  Entries of a versioned package directory are recorded along with whether they are directories,
+    #  package info modules of the versions aren't probed.
+    #
+    #  @param packageName      [ str   | None | in  ] - Name of the package.
+    #  @param isDirectory      [ bool  | None | in  ] - Whether the package is a directory.
+    #  @param modificationTime [ float | None | in  ] - Modification time of the package directory.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Package data.
+    def _scanPackage(self, packageName, isDirectory, modificationTime):
+
+        package = {'modificationTime'   : modificationTime,
+                   'isDirectory'        : isDirectory}
+
+        if not self._isVersioned:
+            package['hasPackageInfo'] = isDirectory and \
+                                        self._isFile(self._getPackageInfoModuleFilePath(packageName))
+            return package
+
+        package['versions'] = {}
+
+        if isDirectory:
+            for entry in self._scanner.scan(os.path.join(self._path, packageName)):
+                package['versions'][entry.name()] = entry.isDirectory()
+
+        return package
+
+    #
+    ## @brief Check package info module of a package again.
+    #
+    #  Versions of versioned packages aren't checked, since they are probed on demand.
+    #
+    #  @param packageName [ str  | None | in  ] - Name of the package.
+    #  @param package     [ dict | None | in  ] - Package data.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether package data has changed.
+    def _recheckPackage(self, packageName, package):
+
+        if not package['isDirectory']:
+            return False
+
+        if self._isVersioned:
+            return False
+
+        hasPackageInfo = self._isFile(self._getPackageInfoModuleFilePath(packageName))
+
+        if package['hasPackageInfo'] == hasPackageInfo:
+            return False
+
+        package['hasPackageInfo'] = hasPackageInfo
+
+        return True
+
+    #
+    ## @brief Read the index file.
+    #
+    #  Index file that can't be read or that has been written for another env path is ignored.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _read(self):
+
+        if not self._indexFilePath or not os.path.isfile(self._indexFilePath):
+            return
+
+        try:
+            with open(self._indexFilePath, 'r') as _file:
+                data = json.loads(_file.read())
+        except (IOError, OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or \
+           data.get('version') != PackageIndex.VERSION or \
+           data.get('path') != self._path or \
+           data.get('isVersioned') != self._isVersioned:
+            return
+
+        self._modificationTime  = data['modificationTime']
+        self._packages          = data['packages']
+
+    #
+    ## @brief Write the index file.
+    #
+    #  Index file is a cache, failing to write it doesn't fail the execution.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _write(self):
+
+        if not self._indexFilePath:
+            return
+
+        data = {'version'           : PackageIndex.VERSION,
+                'path'              : self._path,
+                'isVersioned'       : self._isVersioned,
+                'modificationTime'  : self._modificationTime,
+                'packages'          : self._packages}
+
+        try:
+            mMeco.fileSystem.fileLib.File.writeAtomically(self._indexFilePath, json.dumps(data, sort_keys=True))
+        except (IOError, OSError):
+            pass
+
+        self._hasChanged = False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def isVersioned(self):
+
+        return self._isVersioned
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def indexFilePath(self):
+
+        return self._indexFilePath
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def isRefreshed(self):
+
+        return self._isRefreshed
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.fileSystem.scanLib.Scanner - Value.
+    def scanner(self):
+
+        return self._scanner
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Refresh the index.
+    #
+    #  Index file is read on first refresh and it is written if the index has changed.
+    #
+    #  Modification times are needed only to refresh the index incrementally from the index file, therefore
+    #  if index file path isn't provided, env path and package directories are listed without being stat'ed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def refresh(self):
+
+        if not self._isRefreshed:
+            self._read()
+
+        rootStat    = self._scanner.stat(self._path) if self._indexFilePath else None
+        entries     = []
+
+        if rootStat and rootStat.st_mtime == self._modificationTime:
+
+            # Env path hasn't changed, only stat the package directories
+            for packageName in sorted(self._packages.keys()):
+                packageStat = self._scanner.stat(os.path.join(self._path, packageName))
+                if packageStat:
+                    entries.append((packageName, stat.S_ISDIR(packageStat.st_mode), packageStat.st_mtime))
+                else:
+                    entries.append((packageName, False, None))
+
+        else:
+
+            for entry in self._scanner.scan(self._path):
+                entries.append((entry.name(),
+                                entry.isDirectory(),
+                                entry.modificationTime() if self._indexFilePath else None))
+
+            self._modificationTime  = rootStat.st_mtime if rootStat else None
+            self._hasChanged        = True
+
+        packages        = {}
+        packagesToScan  = []
+
+        for packageName, isDirectory, packageModificationTime in entries:
+
+            package = self._packages.get(packageName)
+
+            if package and packageModificationTime is not None and package['modificationTime'] == packageModificationTime:
+                if self._recheckPackage(packageName, package):
+                    self._hasChanged = True
+
+                packages[packageName] = package
+            else:
+                packagesToScan.append((packageName, isDirectory, packageModificationTime))
+
+        if packagesToScan:
+
+            maxWorkers = self._maxWorkers if len(packagesToScan) >= PackageIndex.PARALLEL_SCAN_THRESHOLD else 1
+
+            scannedPackages = mMeco.core.threadPoolLib.mapInOrder(lambda x: self._scanPackage(*x),
+                                                                  packagesToScan,
+                                                                  maxWorkers)
+
+            for packageToScan, package in zip(packagesToScan, scannedPackages):
+                packages[packageToScan[0]] = package
+
+            self._hasChanged = True
+
+        self._packages      = packages
+        self._isRefreshed   = True
+
+        self.flush()
+
+    #
+    ## @brief Write the index file if the index has changed since it has been written.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def flush(self):
+
+        if self._hasChanged:
+            self._write()
+
+    #
+    ## @brief List names of the packages, including the entries that are not valid packages.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Package names.
+    def listPackages(self):
+
+        if not self._isRefreshed:
+            self.refresh()
+
+        return sorted(self._packages.keys())
+
+    #
+    ## @brief Get data of a package.
+    #
+    #  Data is a dict, which has `modificationTime` and `isDirectory` keys. Non-versioned packages have
+    #  `hasPackageInfo` key, versioned packages have `versions` key, which is a dict where keys are the
+    #  versions and values are whether the versions are directories, see
+    #  mMeco.libs.packageIndexLib.PackageIndex.hasPackageInfo method.
+    #
+    #  @param packageName [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Package data.
+    #  @return None - If package doesn't exist.
+    def getPackage(self, packageName):
+
+        if not self._isRefreshed:
+            self.refresh()
+
+        return self._packages.get(packageName)
+
+    #
+    ## @brief Check whether package info module of a package exists.
+    #
+    #  Package info module of a version is probed each time, since it can be added or removed without
+    #  changing the modification time of the package directory or the version directory. Versions, which
+    #  are not directories, aren't probed.
+    #
+    #  @param packageName [ str | None | in  ] - Name of the package.
+    #  @param version     [ str | None | in  ] - Version of the package, if the package is versioned.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def hasPackageInfo(self, packageName, version=None):
+
+        package = self.getPackage(packageName)
+        if not package or not package['isDirectory']:
+            return False
+
+        if not self._isVersioned:
+            return package['hasPackageInfo']
+
+        if not package['versions'].get(version):
+            return False
+
+        return self._isFile(self._getPackageInfoModuleFilePath(packageName, version))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get index file path for given env path.
+    #
+    #  @param cacheDirectoryPath [ str | None | in  ] - Absolute path of the cache directory.
+    #  @param path               [ str | None | in  ] - Absolute path of the env path.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the index file.
+    @staticmethod
+    def getIndexFilePath(cacheDirectoryPath, path):
+
+        return os.path.join(cacheDirectoryPath,
+                            'packageIndex',
+                            '{}.json'.format(hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()))
+
+
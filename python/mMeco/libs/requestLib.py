@@ -32,6 +32,7 @@ from    getpass         import getuser
 from    platform        import system
 
 import  mMeco.libs.allLib
+import  mMeco.libs.enumLib
 
 
 #
@@ -140,6 +141,12 @@ class Request(object):
         ## [ bool ] - Repeat last env.
         self._last                  = False
 
+        ## [ int ] - Maximum number of threads to build the packages of an env path.
+        self._buildWorkers          = 1
+
+        ## [ enum ] - Data format, a value from mMeco.libs.enumLib.DataFormat enum class.
+        self._dataFormat            = None
+
         # CACHE
 
         ## [ bool ] - Cache write.
@@ -148,6 +155,9 @@ class Request(object):
         ## [ bool ] - Cache get.
         self._cacheRead             = False
 
+        ## [ bool ] - Ignore cache.
+        self._ignoreCache           = False
+
         #
 
         ## [ mMeco.allLib.All ] - All.
@@ -332,6 +342,27 @@ class Request(object):
                               action='store_true',
                               help='Repeat last initialized environment exactly.')
 
+        setState.add_argument('-bw',
+                              '--build-workers',
+                              type=int,
+                              required=False,
+                              default=1,
+                              metavar='',
+                              help='Maximum number of threads to build the packages of an env path. Packages are '
+                                   'built one after another by default. Env is the same regardless of the number '
+                                   'of the threads.')
+
+        setState.add_argument('-df',
+                              '--data-format',
+                              type=str,
+                              required=False,
+                              default=None,
+                              choices=sorted(mMeco.libs.enumLib.DataFormat.listAttributes()),
+                              metavar='',
+                              help='Write the resolved env into a data file instead of a script file. '
+                                   'json - Variables with the packages and layers of their values, scripts and commands. '
+                                   'env - Variables in `env -0` format.')
+
         #
 
         # CACHE
@@ -348,6 +379,11 @@ class Request(object):
                            action='store_true',
                            help='')
 
+        cache.add_argument('-ic',
+                           '--ignore-cache',
+                           action='store_true',
+                           help='Do not reuse or write the cache automatically, resolve the env from scratch.')
+
     #
     ## @brief Set attributes after either `parse` or `parseFromStr` method is invoked.
     #  
@@ -393,11 +429,14 @@ class Request(object):
 
         self._raiseExceptions   = self._args.raise_exceptions
         self._last              = self._args.last
+        self._buildWorkers      = self._args.build_workers
+        self._dataFormat        = self._args.data_format
 
         #
 
         self._cacheWrite         = self._args.cache_write
         self._cacheRead          = self._args.cache_read
+        self._ignoreCache        = self._args.ignore_cache
 
     #
     # ------------------------------------------------------------------------------------------------
@@ -665,6 +704,26 @@ class Request(object):
 
         return self._last
 
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Value.
+    def buildWorkers(self):
+
+        return self._buildWorkers
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return enum - Value.
+    def dataFormat(self):
+
+        return self._dataFormat
+
     #
     ## @brief Property.
     #
@@ -685,6 +744,16 @@ class Request(object):
 
         return self._cacheRead
 
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def ignoreCache(self):
+
+        return self._ignoreCache
+
     #
     ## @brief Property.
     #
@@ -737,9 +806,12 @@ class Request(object):
         data += '\nIgnore Post Env                       : {}'.format(self._ignorePost)
         data += '\nRaise Exceptions                      : {}'.format(self._raiseExceptions)
         data += '\nLast                                  : {}'.format(self._last)
+        data += '\nBuild Workers                         : {}'.format(self._buildWorkers)
+        data += '\nData Format                           : {}'.format(self._dataFormat if self._dataFormat else 'N/A')
 
         data += '\nCache Write                           : {}'.format(self._cacheWrite)
         data += '\nCache Read                            : {}'.format(self._cacheRead)
+        data += '\nIgnore Cache                          : {}'.format(self._ignoreCache)
 
         return data
 
@@ -0,0 +1,169 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/libs/resolverLib.py @brief [ FILE   ] - Resolver.
+## @package mMeco.libs.resolverLib    @brief [ MODULE ] - Resolver.
+
+
+#
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Resolve which env path wins a package.
+#
+#  Layers are added in precedence order, highest precedence first. Each layer can claim its packages in
+#  package scopes from mMeco.libs.enumLib.PackageScope enum class and can be filtered by a package scope.
+#  A package of a layer that is filtered by a scope is removed if a layer added before claimed the same
+#  package name in that scope.
+#
+#  Layers are processed in one pass, by building a package name to winning layer map for each scope,
+#  therefore resolving is linear in the total number of packages.
+#
+# @code
+#resolver = Resolver()
+#resolver.addLayer('Development'            , ['a']                                  , claimScopes=['Internal', 'External'])
+#resolver.addLayer('Project Internal'       , [{'package':'b', 'versions':['1.0.0']}], claimScopes=['Internal'], filterScope='Internal')
+#resolver.addLayer('Master Project Internal', [{'package':'a', 'versions':['1.0.0']},
+#                                              {'package':'b', 'versions':['1.0.0']},
+#                                              {'package':'c', 'versions':['1.0.0']}], claimScopes=['Internal'], filterScope='Internal')
+#
+#resolver.resolve()['Master Project Internal']
+# #[{'package':'c', 'versions':['1.0.0']}]
+# @endcode
+class Resolver(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ list of dict ] - Layers in precedence order.
+        self._layers    = []
+
+        ## [ dict ] - Keys are package scopes, values are dicts where keys are package names and values are layer names.
+        self._winners   = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Value.
+    def layers(self):
+
+        return self._layers
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Add a layer.
+    #
+    #  @param name        [ str                         | None | in  ] - Name of the layer, such as a value from mMeco.libs.enumLib.EnvType enum class.
+    #  @param packages    [ list of str | list of dict  | None | in  ] - Non-versioned or versioned packages of the layer.
+    #  @param claimScopes [ list of enum                | None | in  ] - Scopes the layer claims its packages in, values from mMeco.libs.enumLib.PackageScope enum class.
+    #  @param filterScope [ enum                        | None | in  ] - Scope the layer is filtered by, a value from mMeco.libs.enumLib.PackageScope enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addLayer(self, name, packages, claimScopes=None, filterScope=None):
+
+        self._layers.append({'name'         : name,
+                             'packages'     : packages if packages else [],
+                             'claimScopes'  : claimScopes if claimScopes else [],
+                             'filterScope'  : filterScope})
+
+    #
+    ## @brief Resolve.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are layer names, values are filtered packages of the layers in their original order.
+    def resolve(self):
+
+        self._winners = {}
+
+        result = {}
+
+        for layer in self._layers:
+
+            packages = layer['packages']
+
+            if layer['filterScope']:
+                winners  = self._winners.get(layer['filterScope'], {})
+                packages = [x for x in packages if Resolver.getPackageName(x) not in winners]
+
+            for scope in layer['claimScopes']:
+                winners = self._winners.setdefault(scope, {})
+                for package in packages:
+                    winners.setdefault(Resolver.getPackageName(package), layer['name'])
+
+            result[layer['name']] = packages
+
+        return result
+
+    #
+    ## @brief Get the layer that won given package in given scope.
+    #
+    #  @param scope       [ enum | None | in  ] - A value from mMeco.libs.enumLib.PackageScope enum class.
+    #  @param packageName [ str  | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Name of the layer.
+    #  @return None - If no layer claimed the package in given scope.
+    def getWinner(self, scope, packageName):
+
+        return self._winners.get(scope, {}).get(packageName)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get name of given package.
+    #
+    #  @param package [ str | dict | None | in  ] - Non-versioned package name or versioned package data.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name of the package.
+    @staticmethod
+    def getPackageName(package):
+
+        if isinstance(package, dict):
+            return package['package']
+
+        return package
+
+
@@ -0,0 +1,306 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/libs/statCacheLib.py @brief [ FILE   ] - Stat cache.
+## @package mMeco.libs.statCacheLib    @brief [ MODULE ] - Stat cache.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  stat
+import  threading
+
+import  mMeco.fileSystem.scanLib
+
+import  mMeco.libs.allLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Stat cache.
+#
+#  File system facade, which memoises stat and directory listing results for the lifetime of a request,
+#  since the same paths are checked by settings operator, layer stack, env paths, builders and package
+#  env operator. Results are kept until they are invalidated explicitly by
+#  mMeco.libs.statCacheLib.StatCache.invalidate method.
+#
+#  Both mMeco.libs.statCacheLib.StatCache.isDirectory and mMeco.libs.statCacheLib.StatCache.isFile
+#  methods share a single stat call for a path.
+class StatCache(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ dict ] - Stat results, keys are paths, values are os.stat_result or None if path doesn't exist.
+        self._stats          = {}
+
+        ## [ dict ] - Directory listings, keys are paths, values are list of str or None if path can't be listed.
+        self._listings       = {}
+
+        ## [ dict ] - Subdirectories, keys are paths, values are frozenset of str.
+        self._subdirectories = {}
+
+        ## [ mMeco.fileSystem.scanLib.Scanner ] - Scanner, which lists subdirectories.
+        self._scanner        = mMeco.fileSystem.scanLib.Scanner()
+
+        ## [ int ] - Number of results returned from the cache.
+        self._hits           = 0
+
+        ## [ int ] - Number of system calls made.
+        self._syscalls       = 0
+
+        ## [ threading.Lock ] - Lock, which makes counters and caches thread safe.
+        self._lock           = threading.Lock()
+
+        ## [ mMeco.libs.allLib.All ] - All.
+        self._allLib         = mMeco.libs.allLib.All.getInstance(**{'statCache':self})
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String representation.
+    def __str__(self):
+
+        return self.asStr()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get stat result of given path.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file or directory.
+    #
+    #  @exception N/A
+    #
+    #  @return os.stat_result - Stat result.
+    #  @return None           - If path doesn't exist.
+    def _getStat(self, path):
+
+        with self._lock:
+            if path in self._stats:
+                self._hits += 1
+                return self._stats[path]
+
+            self._syscalls += 1
+
+        try:
+            result = os.stat(path)
+        except OSError:
+            result = None
+
+        with self._lock:
+            self._stats[path] = result
+
+        return result
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Value.
+    def hits(self):
+
+        return self._hits
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Value.
+    def syscalls(self):
+
+        return self._syscalls
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether given path is an existing directory.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isDirectory(self, path):
+
+        if not path:
+            return False
+
+        result = self._getStat(path)
+
+        return result is not None and stat.S_ISDIR(result.st_mode)
+
+    #
+    ## @brief Check whether given path is an existing file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isFile(self, path):
+
+        if not path:
+            return False
+
+        result = self._getStat(path)
+
+        return result is not None and stat.S_ISREG(result.st_mode)
+
+    #
+    ## @brief Get modification time of given path.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Modification time.
+    #  @return None  - If path doesn't exist.
+    def getModificationTime(self, path):
+
+        if not path:
+            return None
+
+        result = self._getStat(path)
+
+        return result.st_mtime if result is not None else None
+
+    #
+    ## @brief List given directory.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a directory.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the entries, a new list is returned for each call.
+    #  @return None        - If path can't be listed.
+    def listDirectory(self, path):
+
+        with self._lock:
+            if path in self._listings:
+                self._hits += 1
+                result = self._listings[path]
+                return list(result) if result is not None else None
+
+            self._syscalls += 1
+
+        try:
+            result = os.listdir(path)
+        except OSError:
+            result = None
+
+        with self._lock:
+            self._listings[path] = result
+
+        return list(result) if result is not None else None
+
+    #
+    ## @brief Get names of the subdirectories of given directory, symbolic links are followed.
+    #
+    #  Directory is scanned once by mMeco.fileSystem.scanLib.Scanner class, which doesn't stat the entries
+    #  on the platforms where directory entries have their types.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a directory.
+    #
+    #  @exception N/A
+    #
+    #  @return frozenset of str - Names of the subdirectories. Empty set if path can't be listed.
+    def listSubdirectories(self, path):
+
+        with self._lock:
+            if path in self._subdirectories:
+                self._hits += 1
+                return self._subdirectories[path]
+
+            self._syscalls += 1
+
+        result = frozenset([x.name() for x in self._scanner.scan(path, includeHidden=True) if x.isDirectory()])
+
+        with self._lock:
+            self._subdirectories[path] = result
+
+        return result
+
+    #
+    ## @brief Invalidate cached results.
+    #
+    #  Listing of the parent directory of given path is invalidated as well, since it contains the path.
+    #
+    #  @param path [ str | None | in  ] - Absolute path, all cached results are invalidated if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def invalidate(self, path=None):
+
+        with self._lock:
+
+            if not path:
+                self._stats.clear()
+                self._listings.clear()
+                self._subdirectories.clear()
+                return
+
+            self._stats.pop(path, None)
+            self._listings.pop(path, None)
+            self._listings.pop(os.path.dirname(path), None)
+            self._subdirectories.pop(path, None)
+            self._subdirectories.pop(os.path.dirname(path), None)
+
+    #
+    ## @brief Get string representation of the class.
+    #
+    #  @exception N/A
+    #
+    #  @return str - String representation.
+    def asStr(self):
+
+        data = 'Cached Stats    : {}\n'.format(len(self._stats))
+        data = '{}Cached Listings : {}\n'.format(data, len(self._listings))
+        data = '{}Cached Scans    : {}\n'.format(data, len(self._subdirectories))
+        data = '{}Hits            : {}\n'.format(data, self._hits)
+        data = '{}Syscalls        : {}\n'.format(data, self._syscalls)
+
+        return data
@@ -41,7 +41,12 @@ import mMeco.operators.packageGlobalEnvOpt
 
 import mMeco.libs.aboutLib
 import mMeco.libs.allLib
+import mMeco.libs.cacheLib
+import mMeco.libs.enumLib
+import mMeco.libs.fingerprintLib
+import mMeco.libs.manifestLib
 import mMeco.libs.requestLib
+import mMeco.libs.statCacheLib
 
 import mMeco.solvers.cacheReadSol
 import mMeco.solvers.prioritySol
@@ -50,6 +55,7 @@ import mMeco.builders.cacheReadBld
 import mMeco.builders.standardBld
 
 import mMeco.responses.cacheWriteRes
+import mMeco.responses.dataRes
 import mMeco.responses.writeRes
 
 
@@ -80,6 +86,9 @@ class Meco(object):
         ## [ mMeco.requestLib.Request ] - Request.
         self._request                   = mMeco.libs.requestLib.Request()
 
+        ## [ mMeco.libs.statCacheLib.StatCache ] - Stat cache, which is used by the operators, solvers and builders below.
+        self._statCache                 = mMeco.libs.statCacheLib.StatCache()
+
         ## [ mMeco.operators.settingsOpt.SettingsOperator ] - Operator.
         self._settingsOperator          = mMeco.operators.settingsOpt.SettingsOperator()
 
@@ -92,6 +101,15 @@ class Meco(object):
         ## [ mMeco.operators.appFileOpt.AppFileOperator ] - Operator.
         self._appFileOperator           = mMeco.operators.appFileOpt.AppFileOperator()
 
+        ## [ mMeco.libs.cacheLib.Cache ] - Cache.
+        self._cache                     = mMeco.libs.cacheLib.Cache()
+
+        ## [ mMeco.libs.fingerprintLib.Fingerprint ] - Fingerprint.
+        self._fingerprint               = mMeco.libs.fingerprintLib.Fingerprint()
+
+        ## [ bool ] - Whether the cache is up to date for this request.
+        self._isCacheUpToDate           = False
+
         ## [ mMeco.libs.allLib.All ] - All libraries.
         self._allLib                    = mMeco.libs.allLib.All.getInstance()
 
@@ -174,7 +192,7 @@ class Meco(object):
     #  @return mMeco.abstract.solverAbs.Solver - A solver class that inherits mMeco.abstract.solverAbs.Solver class.
     def _getSolver(self):
 
-        if self._allLib.request().cacheRead():
+        if self._allLib.request().cacheRead() or self._isCacheUpToDate:
             return self._solverContainer.getByName(mMeco.solvers.cacheReadSol.Solver.NAME)
 
         return self._solverContainer.getByName(mMeco.solvers.prioritySol.Solver.NAME)
@@ -187,7 +205,7 @@ class Meco(object):
     #  @return mMeco.abstract.builderAbs.Builder - A builder class that inherits mMeco.abstract.builderAbs.Builder class.
     def _getBuilder(self):
 
-        if self._allLib.request().cacheRead():
+        if self._allLib.request().cacheRead() or self._isCacheUpToDate:
             return self._builderContainer.getByName(mMeco.builders.cacheReadBld.Builder.NAME)
 
         return self._builderContainer.getByName(mMeco.builders.standardBld.Builder.NAME)
@@ -200,7 +218,10 @@ class Meco(object):
     #  @return mMeco.abstract.responseAbs.Response - A response class that inherits mMeco.abstract.responseAbs.Response class.
     def _getResponse(self):
 
-        if self._allLib.request().cacheWrite():
+        if self._allLib.request().dataFormat():
+            return self._responseContainer.getByName(mMeco.responses.dataRes.Response.NAME)
+
+        if self._allLib.request().cacheWrite() or (self._cache.fingerprint() and not self._isCacheUpToDate):
             return self._responseContainer.getByName(mMeco.responses.cacheWriteRes.Response.NAME)
 
         return self._responseContainer.getByName(mMeco.responses.writeRes.Response.NAME)
@@ -235,6 +256,9 @@ class Meco(object):
                 raise
             return False
 
+        # Cache
+        self._cache.setPath(self._settingsOperator.cacheFilePath())
+
         # Callback Module
         try:
             self._callbackOperator.initialize()
@@ -274,24 +298,55 @@ class Meco(object):
 
         return True
 
+    #
+    ## @brief Compute the fingerprint and check whether the cache is up to date.
+    #
+    #  Fingerprint isn't computed if `--ignore-cache` or `--cache-read` flag is provided.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the cache is up to date.
+    def _checkCache(self):
+
+        if self._allLib.request().ignoreCache() or self._allLib.request().cacheRead():
+            return False
+
+        try:
+            self._cache.setFingerprint(self._fingerprint.compute())
+            self._isCacheUpToDate = self._cache.isUpToDate()
+        except Exception as error:
+            self._allLib.logger().addWarning('Fingerprint couldn\'t be computed, cache is ignored: {}'.format(error))
+            if self._allLib.request().raiseExceptions():
+                raise
+
+        if self._isCacheUpToDate:
+            self._fingerprint.setVersionModificationTimes(self._cache.getVersionModificationTimes())
+            self._allLib.logger().addInfo('Cache is up to date, env is read from the cache file: {}'.format(self._cache.path()))
+
+        return self._isCacheUpToDate
+
     #
     ## @brief Respond last request.
     #
-    #  @exception IOError - If there is no previously created script file exist for the request.
+    #  Script file is reused only if its manifest file shows that the files and directories which produced
+    #  the script file haven't changed since. Manifest file is checked by modification times only.
     #
-    #  @return bool - Result.
+    #  @exception N/A
+    #
+    #  @return bool - Whether the script file of the last request can be reused.
     def _respondLast(self):
 
-        if os.path.isfile(self._allLib.settingsOperator().scriptFilePath()):
-            return True
-
-        message = 'Script file doesn\'t exist for this env configuration, -l|--last ignored: {}'.format(self._allLib.settingsOperator().scriptFilePath())
-        self._allLib.logger().addFailure(message)
+        if not os.path.isfile(self._allLib.settingsOperator().scriptFilePath()):
+            self._allLib.logger().addWarning('Script file doesn\'t exist for this env configuration, '
+                                             'env will be resolved: {}'.format(self._allLib.settingsOperator().scriptFilePath()))
+            return False
 
-        if self._allLib.request().raiseExceptions():
-            raise IOError(message)
+        if not mMeco.libs.manifestLib.Manifest(self._allLib.settingsOperator().manifestFilePath()).isUpToDate():
+            self._allLib.logger().addWarning('Script file is stale for this env configuration, '
+                                             'env will be resolved: {}'.format(self._allLib.settingsOperator().scriptFilePath()))
+            return False
 
-        return False
+        return True
 
     #
     ## @brief Solve.
@@ -307,6 +362,11 @@ class Meco(object):
             self._solver = self._getSolver()
             self._allLib.setSolver(self._solver)
             self._solver.solve()
+
+            # Versions, which the cache file and the manifest file depend on
+            if self._fingerprint.value() and not self._isCacheUpToDate:
+                self._fingerprint.computeVersions(self._solver)
+
             return True
 
         except Exception as error:
@@ -418,8 +478,10 @@ class Meco(object):
         if self._displayInfo():
             return False
 
-        if self._allLib.request().last():
-            return self._respondLast()
+        if self._allLib.request().last() and not self._allLib.request().dataFormat() and self._respondLast():
+            return True
+
+        self._checkCache()
 
         if not self._solve():
             return False
@@ -504,3 +566,23 @@ class Meco(object):
             return None
 
         return self._settingsOperator.scriptFilePath()
+
+    #
+    ## @brief Execute and return the path of the data file, which has the resolved env in given format.
+    #
+    #  Method adds `--data-format` flag to the request, see mMeco.responses.dataRes.Response class.
+    #
+    #  @param dataFormat [ enum | mMeco.libs.enumLib.DataFormat.kJson | in  ] - A value from mMeco.libs.enumLib.DataFormat enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Absolute path of the data file.
+    #  @return None - If a problem occurs during execution.
+    def writeData(self, dataFormat=mMeco.libs.enumLib.DataFormat.kJson):
+
+        self._parameters = '{} --data-format {}'.format(self._parameters, dataFormat)
+
+        if not self.execute():
+            return None
+
+        return mMeco.responses.dataRes.Response.getDataFilePath(self._settingsOperator.scriptFilePath(), dataFormat)
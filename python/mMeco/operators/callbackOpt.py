@@ -104,6 +104,24 @@ class CallbackOperator(mMeco.abstract.operatorAbs.Operator):
 
         return getattr(self._module, 'shouldInitializePackage')(self._all, packagePath)
 
+    #
+    ## @brief Invoke `shouldInitializePackages` function in the settings module for given package paths at once.
+    #
+    #  `shouldInitializePackages` function is optional, `shouldInitializePackage` function is invoked for each path
+    #  if the settings module doesn't have it.
+    #
+    #  @param packagePaths [ list of str | None | in  ] - Absolute paths of the roots of the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return set of str - Paths of the packages, which should be initialized.
+    def invokeShouldInitializePackages(self, packagePaths):
+
+        if hasattr(self._module, 'shouldInitializePackages'):
+            return set(getattr(self._module, 'shouldInitializePackages')(self._all, list(packagePaths)) or [])
+
+        return set([x for x in packagePaths if self.invokeShouldInitializePackage(x)])
+
     #
     ## @brief Invoke `getAppExecutableFlags` function in the settings module.
     #
@@ -29,14 +29,18 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import  hashlib
+import  json
 import  os
-import  sys
+import  threading
+import  time
 
-from    importlib import import_module
+import  mMeco.core.moduleLib
 
 import  mMeco.libs.allLib
 
 import  mMeco.libs.entryLib
+import  mMeco.libs.enumLib
 
 
 #
@@ -46,7 +50,39 @@ import  mMeco.libs.entryLib
 #
 #
 ## @brief [ CLASS ] - Class to operate on package env module.
+#
+#  Env of a package is set by its package env file, if the package has one, otherwise by `setEnvironment`
+#  function of its package env module. Both are located in `python/<packageName>` directory of the package.
+#
+#  Package env file is a JSON file, which is parsed without importing Python. Its top level sections are
+#  applied on all platforms, sections in `platforms` are applied on the platform they're named after, i.e.
+#  `Linux`, `Darwin` or `Windows`. `{root}`, `{platform}`, `{platformLower}`, `{packageName}` and `{version}`
+#  placeholders in the values are replaced with root path of the package, platform, platform in lowercase as
+#  in `bin/linux` directories of the packages, name and version of the package.
+#
+#  Values of `multi` section are strings or lists of strings, values of `single` section are strings, `scripts`
+#  and `commands` sections are lists of strings.
+#
+# @code
+#{
+#    "multi"     : {"PATH": ["{root}/bin/{platformLower}"], "PYTHONPATH": "{root}/python"},
+#    "single"    : {"MY_PACKAGE_ROOT": "{root}"},
+#    "scripts"   : [],
+#    "commands"  : [],
+#    "platforms" : {"Windows": {"multi": {"PATH": ["{root}/bin/win"]}}}
+#}
+# @endcode
 class PackageEnvOperator(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ str ] - File name of package env module.
+    MODULE_FILE_NAME    = 'packageEnvLib.py'
+
+    ## [ str ] - File name of package env file.
+    FILE_NAME           = 'packageEnv.json'
+
     #
     # ------------------------------------------------------------------------------------------------
     # PROTECTED METHODS
@@ -62,71 +98,294 @@ class PackageEnvOperator(object):
     def __init__(self, envEntryContainer=None):
 
         ## [ mMeco.libs.allLib.All ] - All.
-        self._allLib = mMeco.libs.allLib.All.getInstance()
+        self._allLib            = mMeco.libs.allLib.All.getInstance()
+
+        ## [ set of str ] - Root paths of the packages, which have been skipped since their package env modules timed out.
+        self._timedOutPackages  = set()
 
         if envEntryContainer:
             self.invoke(envEntryContainer)
 
     #
-    ## @brief Invoke `setEnvironment` function in env module of the package.
+    ## @brief Replace placeholders in given value.
+    #
+    #  @param value        [ str  | None | in  ] - Value.
+    #  @param placeholders [ dict | None | in  ] - Placeholders, keys are placeholders, values are the values they're replaced with.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def _replacePlaceholders(self, value, placeholders):
+
+        for placeholder, replacement in placeholders.items():
+            value = value.replace(placeholder, replacement)
+
+        return value
+
+    #
+    ## @brief Check whether given value is a string.
+    #
+    #  @param value [ object | None | in  ] - Value.
     #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _isString(self, value):
+
+        return isinstance(value, (str, type(u'')))
+
+    #
+    ## @brief Validate given section of a package env file.
+    #
+    #  @param section  [ dict | None | in  ] - Section.
+    #  @param filePath [ str  | None | in  ] - Absolute path of the package env file.
+    #
+    #  @exception ValueError - If a section or a value has an invalid type.
+    #
+    #  @return None - None.
+    def _validateSection(self, section, filePath):
+
+        for key in ['multi', 'single']:
+
+            if not isinstance(section.get(key, {}), dict):
+                raise ValueError('"{}" section of package env file must be a JSON object: {}'.format(key, filePath))
+
+        for variable, values in section.get('multi', {}).items():
+
+            if not self._isString(values) and \
+               not (isinstance(values, list) and all([self._isString(x) for x in values])):
+                raise ValueError('Value of "{}" variable in "multi" section of package env file must be a string or '
+                                 'a list of strings: {}'.format(variable, filePath))
+
+        for variable, value in section.get('single', {}).items():
+
+            if not self._isString(value):
+                raise ValueError('Value of "{}" variable in "single" section of package env file must be a '
+                                 'string: {}'.format(variable, filePath))
+
+        for key in ['scripts', 'commands']:
+
+            values = section.get(key, [])
+
+            if not isinstance(values, list) or not all([self._isString(x) for x in values]):
+                raise ValueError('"{}" section of package env file must be a list of strings: {}'.format(key, filePath))
+
+    #
+    ## @brief Apply given section of a package env file.
+    #
+    #  @param section           [ dict                                  | None | in  ] - Section.
     #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env envEntry container, which represents a package.
+    #  @param placeholders      [ dict                                  | None | in  ] - Placeholders.
     #
     #  @exception N/A
     #
+    #  @return None - None.
+    def _applySection(self, section, envEntryContainer, placeholders):
+
+        for variable, values in sorted(section.get('multi', {}).items()):
+
+            if not isinstance(values, list):
+                values = [values]
+
+            for value in values:
+                envEntryContainer.addMulti(variable, self._replacePlaceholders(value, placeholders))
+
+        for variable, value in sorted(section.get('single', {}).items()):
+            envEntryContainer.addSingle(variable, self._replacePlaceholders(value, placeholders))
+
+        for scriptPath in section.get('scripts', []):
+            envEntryContainer.addScript(self._replacePlaceholders(scriptPath, placeholders))
+
+        for command in section.get('commands', []):
+            envEntryContainer.addCommand(self._replacePlaceholders(command, placeholders))
+
+    #
+    ## @brief Set env of the package by given package env file.
+    #
+    #  @param filePath          [ str                                   | None | in  ] - Absolute path of the package env file.
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env envEntry container, which represents a package.
+    #
+    #  @exception ValueError - If package env file is not a valid JSON file.
+    #  @exception ValueError - If a section or a value has an invalid type.
+    #
+    #  @return None - None.
+    def _invokeFile(self, filePath, envEntryContainer):
+
+        try:
+            with open(filePath, 'r') as _file:
+                data = json.loads(_file.read())
+        except ValueError:
+            raise ValueError('Package env file is not a valid JSON file: {}'.format(filePath))
+
+        if not isinstance(data, dict):
+            raise ValueError('Package env file must contain a JSON object: {}'.format(filePath))
+
+        platform     = self._allLib.request().platform()
+        placeholders = {'{root}'            : envEntryContainer.getPackageRootPath(),
+                        '{platform}'        : platform,
+                        '{platformLower}'   : platform.lower(),
+                        '{packageName}'     : envEntryContainer.packageName(),
+                        '{version}'         : envEntryContainer.version() if envEntryContainer.version() else ''}
+
+        if not isinstance(data.get('platforms', {}), dict):
+            raise ValueError('"platforms" section of package env file must be a JSON object: {}'.format(filePath))
+
+        platformSection = data.get('platforms', {}).get(platform)
+        if platformSection is not None and not isinstance(platformSection, dict):
+            raise ValueError('"{}" section of package env file must be a JSON object: {}'.format(platform, filePath))
+
+        self._validateSection(data, filePath)
+
+        if platformSection:
+            self._validateSection(platformSection, filePath)
+
+        self._applySection(data, envEntryContainer, placeholders)
+
+        if platformSection:
+            self._applySection(platformSection, envEntryContainer, placeholders)
+
+    #
+    ## @brief Invoke given `setEnvironment` function in a worker thread and wait for it as long as the timeout.
+    #
+    #  Function is invoked with a copy of given env entry container and the entries are added to given env entry
+    #  container only if the function returns in time, therefore a function, which times out and keeps running
+    #  in the background, can't change the env. Worker thread is a daemon thread, it doesn't keep the process
+    #  alive after the execution ends.
+    #
+    #  @param function          [ function                              | None | in  ] - `setEnvironment` function.
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env envEntry container, which represents a package.
+    #
+    #  @exception IOError - If the function times out and timeout policy is mMeco.libs.enumLib.PackageEnvTimeoutPolicy.kFail.
+    #
+    #  @return bool - Result of the function, `False` if the function times out.
+    def _invokeWithTimeout(self, function, envEntryContainer):
+
+        settingsOperator = self._allLib.settingsOperator()
+
+        workEnvEntryContainer = mMeco.libs.entryLib.EnvEntryContainer(containerType=envEntryContainer.type(),
+                                                                      path=envEntryContainer.path(),
+                                                                      packageName=envEntryContainer.packageName(),
+                                                                      version=envEntryContainer.version())
+
+        outcome = {}
+
+        def run():
+            try:
+                outcome['result'] = function(self._allLib, workEnvEntryContainer)
+            except BaseException as exception:
+                outcome['exception'] = exception
+
+        startTime = time.time()
+
+        thread = threading.Thread(target=run,
+                                  name='mMecoPackageEnv-{}'.format(envEntryContainer.packageName()))
+        thread.daemon = True
+        thread.start()
+        thread.join(settingsOperator.packageEnvTimeout())
+
+        elapsedTime = time.time() - startTime
+
+        if thread.is_alive():
+
+            message = 'Package env module of the package timed out after {:.2f} seconds: {}'.format(elapsedTime,
+                                                                                                    envEntryContainer.getPackageRootPath())
+
+            # Failure is logged by the caller
+            if settingsOperator.packageEnvTimeoutPolicy() == mMeco.libs.enumLib.PackageEnvTimeoutPolicy.kFail:
+                raise IOError(message)
+
+            self._allLib.logger().addWarning('{}, the package is skipped.'.format(message))
+
+            self._timedOutPackages.add(envEntryContainer.getPackageRootPath())
+
+            return False
+
+        if 'exception' in outcome:
+            raise outcome['exception']
+
+        envEntryContainer.addEntries(workEnvEntryContainer)
+
+        return outcome.get('result')
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Set env of the package by its package env file or by invoking `setEnvironment` function in its package env module.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env envEntry container, which represents a package.
+    #
+    #  @exception ValueError - If package env file is not a valid JSON file.
+    #  @exception IOError    - If `setEnvironment` function times out and timeout policy is mMeco.libs.enumLib.PackageEnvTimeoutPolicy.kFail.
+    #
+    #  @return True  - If package has a package env file.
     #  @return True  - If package doesn't have env module.
     #  @return True  - If package env module doesn't have `setEnvironment` function.
     #  @return False - If `setEnvironment` function of the env module of the package returns `False`.
+    #  @return False - If `setEnvironment` function times out and timeout policy is mMeco.libs.enumLib.PackageEnvTimeoutPolicy.kSkip.
     def invoke(self, envEntryContainer):
 
-        packageEnvFilePath = None
-
-        if envEntryContainer.version():
-            packageEnvFilePath = os.path.join(envEntryContainer.path(),
-                                              envEntryContainer.packageName(),
-                                              envEntryContainer.version(),
-                                              envEntryContainer.packageName(),
-                                              'python',
-                                              envEntryContainer.packageName(),
-                                              'packageEnvLib.py')
-        else:
-            packageEnvFilePath = os.path.join(envEntryContainer.path(),
-                                              envEntryContainer.packageName(),
-                                              'python',
-                                              envEntryContainer.packageName(),
-                                              'packageEnvLib.py')
-
-        if not os.path.isfile(packageEnvFilePath):
+        packagePythonPath = PackageEnvOperator.getPackagePythonPath(envEntryContainer)
+
+        # Package env file
+        packageEnvFilePath = os.path.join(packagePythonPath, PackageEnvOperator.FILE_NAME)
+
+        if self._allLib.statCache().isFile(packageEnvFilePath):
+            self._invokeFile(packageEnvFilePath, envEntryContainer)
             return True
 
-        #
-        packagePythonPath       = None
-        packagePythonPathAdded  = False
-
-        if envEntryContainer.version():
-            packagePythonPath = os.path.join(envEntryContainer.path(),
-                                             envEntryContainer.packageName(),
-                                             envEntryContainer.version(),
-                                             envEntryContainer.packageName(),
-                                             'python')
-        else:
-            packagePythonPath = os.path.join(envEntryContainer.path(),
-                                             envEntryContainer.packageName(),
-                                             'python')
-
-        if not packagePythonPath in sys.path:
-            sys.path.append(packagePythonPath)
-
-        module = import_module('{}.packageEnvLib'.format(envEntryContainer.packageName()))
-
-        if not hasattr(module, 'setEnvironment'):
-            if packagePythonPathAdded:
-                sys.path.pop()
+        # Package env module
+        packageEnvModuleFilePath = os.path.join(packagePythonPath, PackageEnvOperator.MODULE_FILE_NAME)
+
+        if not self._allLib.statCache().isFile(packageEnvModuleFilePath):
             return True
 
-        result = getattr(module, 'setEnvironment')(self._allLib, envEntryContainer)
+        # Package env module is executed from its file under a unique module name, see mMeco.core.moduleLib.Module.loadFile
+        moduleName  = 'mMecoPackageEnv_{}'.format(hashlib.sha1(packageEnvModuleFilePath.encode('utf-8')).hexdigest())
+        module      = mMeco.core.moduleLib.Module.loadFile(packageEnvModuleFilePath, moduleName)
+
+        result = True
+
+        try:
+            if hasattr(module, 'setEnvironment'):
+                if self._allLib.settingsOperator().packageEnvTimeout():
+                    result = self._invokeWithTimeout(getattr(module, 'setEnvironment'), envEntryContainer)
+                else:
+                    result = getattr(module, 'setEnvironment')(self._allLib, envEntryContainer)
+        finally:
+            if self._allLib.settingsOperator().unloadPackageEnvModules():
+                mMeco.core.moduleLib.Module.unload(moduleName)
+
+        return result
 
-        if packagePythonPathAdded:
-            sys.path.pop()
+    #
+    ## @brief Check whether the package has been skipped since its package env module timed out.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env envEntry container, which represents a package.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def hasTimedOut(self, envEntryContainer):
+
+        return envEntryContainer.getPackageRootPath() in self._timedOutPackages
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get path of the directory, where package env file and package env module of the package are located.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env envEntry container, which represents a package.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path.
+    @staticmethod
+    def getPackagePythonPath(envEntryContainer):
 
-        return result
\ No newline at end of file
+        return os.path.join(envEntryContainer.getPackageRootPath(),
+                            'python',
+                            envEntryContainer.packageName())
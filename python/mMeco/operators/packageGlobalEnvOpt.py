@@ -25,10 +25,15 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import os
+import re
+
 from   inspect import isclass
 
 import mMeco.abstract.operatorAbs
 
+import mMeco.core.platformLib
+
 
 #
 #-----------------------------------------------------------------------------------------------------
@@ -134,6 +139,173 @@ class PackageGlobalEnv(object):
 
         return data
 
+#
+## @brief [ CLASS ] - Rules of a package global env compiled for an app.
+#
+#  Values of the attributes of a package global env are relative paths of directories in the root of a
+#  package, `FOLDER_NAME` and `VERSION` in the values are replaced once when the rules are compiled.
+#  Rules are looked up by the first component of their relative paths, therefore a package is matched
+#  against all rules by scanning its root directory once, only the rules with nested relative paths,
+#  whose first component exists, are checked further.
+#
+#  First components are matched case-insensitively on Windows and Darwin, whose file systems are case-insensitive
+#  by default, so that directories are matched the same way as they are found by `os.path.isdir`.
+class PackageGlobalEnvRules(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param packageGlobalEnv [ mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnv | None | in  ] - Package global env.
+    #  @param folderName       [ str                                                  | ''   | in  ] - Folder name, which replaces `FOLDER_NAME` in the values.
+    #  @param version          [ str                                                  | ''   | in  ] - Version, which replaces `VERSION` in the values.
+    #  @param appFilePath      [ str                                                  | None | in  ] - Absolute path of the app file, `VERSION` can be used only if it's provided.
+    #  @param isCaseSensitive  [ bool                                                 | None | in  ] - Whether first components are matched case-sensitively, it's determined by the platform if not provided.
+    #
+    #  @exception ValueError - If a value has `FOLDER_NAME` and `folderName` is not provided.
+    #  @exception ValueError - If a value has `VERSION` and `appFilePath` is not provided.
+    #
+    #  @return None - None.
+    def __init__(self, packageGlobalEnv, folderName='', version='', appFilePath=None, isCaseSensitive=None):
+
+        if isCaseSensitive is None:
+            isCaseSensitive = not (mMeco.core.platformLib.Platform.isWindows() or mMeco.core.platformLib.Platform.isDarwin())
+
+        ## [ str ] - Name of the package global env.
+        self._name                  = packageGlobalEnv.name()
+
+        ## [ bool ] - Whether first components are matched case-sensitively.
+        self._isCaseSensitive       = isCaseSensitive
+
+        ## [ list of tuple ] - Rules, each rule is a tuple of variable name and relative path.
+        self._rules                 = []
+
+        ## [ dict ] - Indices of the rules, keys are first components of the relative paths.
+        self._rulesByFirstComponent = {}
+
+        ## [ list of int ] - Indices of the rules, which can't be looked up by the first component of their relative paths.
+        self._otherRules            = []
+
+        #
+
+        for attr in packageGlobalEnv.attributes():
+
+            for value in attr['value']:
+
+                if 'FOLDER_NAME' in value and not folderName:
+                    raise ValueError('App file must have "folderName" key for this configuration: {}'.format(appFilePath))
+                else:
+                    value = value.replace('FOLDER_NAME', folderName)
+
+                if 'VERSION' in value and not appFilePath:
+                    raise ValueError('App file must have "version" key for this configuration: {}'.format(appFilePath))
+                else:
+                    value = value.replace('VERSION', version)
+
+                self._add(attr['name'], value)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get key of given first component of a relative path.
+    #
+    #  @param name [ str | None | in  ] - First component of a relative path or name of a directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Key.
+    def _getKey(self, name):
+
+        return name if self._isCaseSensitive else name.lower()
+
+    #
+    ## @brief Add a rule.
+    #
+    #  @param variable     [ str | None | in  ] - Name of the variable.
+    #  @param relativePath [ str | None | in  ] - Relative path of a directory in the root of a package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _add(self, variable, relativePath):
+
+        index = len(self._rules)
+
+        self._rules.append((variable, relativePath))
+
+        components = [x for x in re.split(r'[\\/]', relativePath) if x and x != '.']
+
+        if os.path.isabs(relativePath) or not components or components[0] == '..':
+            self._otherRules.append(index)
+            return
+
+        self._rulesByFirstComponent.setdefault(self._getKey(components[0]), []).append((index, len(components) > 1))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def name(self):
+
+        return self._name
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Value.
+    def rules(self):
+
+        return self._rules
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Match the rules against given package root.
+    #
+    #  @param packageRootPath [ str                                  | None | in  ] - Absolute path of the root of a package.
+    #  @param statCache       [ mMeco.libs.statCacheLib.StatCache    | None | in  ] - Stat cache.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Variable names and absolute paths of the existing directories, in the order of the rules.
+    def match(self, packageRootPath, statCache):
+
+        indices = []
+
+        if self._rulesByFirstComponent:
+
+            for name in statCache.listSubdirectories(packageRootPath):
+
+                for index, isNested in self._rulesByFirstComponent.get(self._getKey(name), []):
+
+                    if isNested and not statCache.isDirectory(os.path.join(packageRootPath, self._rules[index][1])):
+                        continue
+
+                    indices.append(index)
+
+        for index in self._otherRules:
+
+            if statCache.isDirectory(os.path.join(packageRootPath, self._rules[index][1])):
+                indices.append(index)
+
+        indices.sort()
+
+        return [(self._rules[x][0], os.path.join(packageRootPath, self._rules[x][1])) for x in indices]
+
 #
 ## @brief [ CLASS ] - Class to operate on Python modules.
 class PackageGlobalEnvOperator(mMeco.abstract.operatorAbs.Operator):
@@ -164,7 +336,13 @@ class PackageGlobalEnvOperator(mMeco.abstract.operatorAbs.Operator):
         mMeco.abstract.operatorAbs.Operator.__dict__['__init__'](self, module)
 
         ## [ list of mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnv ] - Package global env.
-        self._packageGlobalEnvs = []
+        self._packageGlobalEnvs         = []
+
+        ## [ dict ] - Package global envs, keys are their names.
+        self._packageGlobalEnvsByName   = {}
+
+        ## [ dict ] - Compiled rules, keys are tuples of class name, folder name, version and app file path.
+        self._rules                     = {}
 
     #
     # ------------------------------------------------------------------------------------------------
@@ -218,6 +396,8 @@ class PackageGlobalEnvOperator(mMeco.abstract.operatorAbs.Operator):
 
             self._packageGlobalEnvs.append(packageEnv)
 
+            self._packageGlobalEnvsByName[className] = packageEnv
+
 
     #
     # ------------------------------------------------------------------------------------------------
@@ -237,11 +417,33 @@ class PackageGlobalEnvOperator(mMeco.abstract.operatorAbs.Operator):
         if not self._packageGlobalEnvs:
             return None
 
-        className = '{}{}'.format(className.title(), self._all.request().platform())
+        return self._packageGlobalEnvsByName.get('{}{}'.format(className.title(), self._all.request().platform()))
+
+    #
+    ## @brief Get compiled rules of the class for given `className`.
+    #
+    #  Rules are compiled once for each combination of the arguments.
+    #
+    #  @param className   [ str | None | in  ] - Name of the class.
+    #  @param folderName  [ str | ''   | in  ] - Folder name, which replaces `FOLDER_NAME` in the values.
+    #  @param version     [ str | ''   | in  ] - Version, which replaces `VERSION` in the values.
+    #  @param appFilePath [ str | None | in  ] - Absolute path of the app file.
+    #
+    #  @exception ValueError - If the rules can't be compiled, see mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnvRules class.
+    #
+    #  @return mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnvRules - Rules.
+    #  @return None                                                      - If no class found for given name.
+    def getRules(self, className, folderName='', version='', appFilePath=None):
+
+        key = (className, folderName, version, appFilePath)
+
+        if key not in self._rules:
 
-        for app in self._packageGlobalEnvs:
+            packageGlobalEnv = self.getClass(className)
 
-            if className == app.name():
-                return app
+            self._rules[key] = PackageGlobalEnvRules(packageGlobalEnv,
+                                                     folderName,
+                                                     version,
+                                                     appFilePath) if packageGlobalEnv else None
 
-        return None
\ No newline at end of file
+        return self._rules[key]
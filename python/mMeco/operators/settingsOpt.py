@@ -30,6 +30,12 @@ from    platform    import system
 
 import  mMeco.abstract.operatorAbs
 
+import  mMeco.fileSystem.fileLib
+import  mMeco.fileSystem.versionLib
+
+import  mMeco.libs.enumLib
+import  mMeco.libs.layerLib
+
 
 #
 #-----------------------------------------------------------------------------------------------------
@@ -43,7 +49,28 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
     # PUBLIC STATIC MEMBERS
     # ------------------------------------------------------------------------------------------------
     ## [ str ] - Default Python module import name.
-    MODULE  = 'mMecoSettings.settingsLib'
+    MODULE              = 'mMecoSettings.settingsLib'
+
+    ## [ int ] - Default maximum number of threads to list env paths, which can be overridden by `SCAN_MAX_WORKERS` attribute of the settings module.
+    SCAN_MAX_WORKERS    = 8
+
+    ## [ bool ] - Default of whether to probe only the newest valid version of versioned packages, which can be overridden by `NEWEST_VERSION_ONLY` attribute of the settings module.
+    NEWEST_VERSION_ONLY = True
+
+    ## [ bool ] - Default of whether pre-release versions are selected as the newest version over release versions, which can be overridden by `NEWEST_VERSION_INCLUDES_PRE_RELEASES` attribute of the settings module.
+    NEWEST_VERSION_INCLUDES_PRE_RELEASES = False
+
+    ## [ bool ] - Default of whether to remove package env modules from `sys.modules` after they're invoked, which can be overridden by `UNLOAD_PACKAGE_ENV_MODULES` attribute of the settings module.
+    UNLOAD_PACKAGE_ENV_MODULES = True
+
+    ## [ float ] - Default number of seconds `setEnvironment` function of a package env module can take, which can be overridden by `PACKAGE_ENV_TIMEOUT` attribute of the settings module. `None` disables the timeout.
+    PACKAGE_ENV_TIMEOUT = None
+
+    ## [ enum ] - Default policy from mMeco.libs.enumLib.PackageEnvTimeoutPolicy enum class, which can be overridden by `PACKAGE_ENV_TIMEOUT_POLICY` attribute of the settings module.
+    PACKAGE_ENV_TIMEOUT_POLICY = mMeco.libs.enumLib.PackageEnvTimeoutPolicy.kSkip
+
+    ## [ float ] - Default number of seconds a stored script file is kept after it was last used, which can be overridden by `SCRIPT_STORE_MAX_AGE` attribute of the settings module. `None` keeps stored script files forever.
+    SCRIPT_STORE_MAX_AGE = None
 
     #
     # ------------------------------------------------------------------------------------------------
@@ -99,6 +126,9 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
         ## [ str ] - Master project external packages path.
         self._masterProjectExternalPackagesPath     = None
 
+        ## [ mMeco.libs.layerLib.LayerStack ] - Layer stack.
+        self._layerStack                            = None
+
         #
 
         ## [ str ] - App path.
@@ -107,6 +137,41 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
         ## [ str ] - Script file path.
         self._scriptFilePath                        = None
 
+        ## [ str ] - Cache file path.
+        self._cacheFilePath                         = None
+
+        ## [ str ] - Manifest file path.
+        self._manifestFilePath                      = None
+
+        ## [ str ] - Cache directory path.
+        self._cacheDirectoryPath                    = None
+
+        ## [ str ] - Script store path, scripts are stored under hash of their content in this directory.
+        self._scriptStorePath                       = None
+
+        ## [ float ] - Number of seconds a stored script file is kept after it was last used.
+        self._scriptStoreMaxAge                     = SettingsOperator.SCRIPT_STORE_MAX_AGE
+
+        #
+
+        ## [ int ] - Maximum number of threads to list env paths.
+        self._scanMaxWorkers                        = SettingsOperator.SCAN_MAX_WORKERS
+
+        ## [ bool ] - Whether to probe only the newest valid version of versioned packages.
+        self._newestVersionOnly                     = SettingsOperator.NEWEST_VERSION_ONLY
+
+        ## [ bool ] - Whether pre-release versions are selected as the newest version over release versions.
+        self._newestVersionIncludesPreReleases      = SettingsOperator.NEWEST_VERSION_INCLUDES_PRE_RELEASES
+
+        ## [ bool ] - Whether to remove package env modules from `sys.modules` after they're invoked.
+        self._unloadPackageEnvModules               = SettingsOperator.UNLOAD_PACKAGE_ENV_MODULES
+
+        ## [ float ] - Number of seconds `setEnvironment` function of a package env module can take.
+        self._packageEnvTimeout                     = SettingsOperator.PACKAGE_ENV_TIMEOUT
+
+        ## [ enum ] - Policy from mMeco.libs.enumLib.PackageEnvTimeoutPolicy enum class.
+        self._packageEnvTimeoutPolicy               = SettingsOperator.PACKAGE_ENV_TIMEOUT_POLICY
+
         ## [ str ] - Log file.
         self._logFilePath                           = None
 
@@ -164,7 +229,7 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
         # Reserved
         self._reservedPackagesPath = getattr(self._module, 'getReservedPackagesPath')(self._all.request().developer(),
                                                                                       system())
-        if not os.path.isdir(self._reservedPackagesPath):
+        if not self._all.statCache().isDirectory(self._reservedPackagesPath):
             self._reservedPackagesPath = None
 
 
@@ -176,7 +241,7 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
                                                                                                 system(),
                                                                                                 create=False)
 
-            if not os.path.isdir(self._developmentPackagesPath):
+            if not self._all.statCache().isDirectory(self._developmentPackagesPath):
                 raise IOError('Development packages path doesn\'t exist: {}'.format(self._developmentPackagesPath))
 
 
@@ -186,7 +251,7 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
                                                                                     self._all.request().developer(),
                                                                                     self._all.request().stage(),
                                                                                     system())
-            if not os.path.isdir(self._stagePackagesPath):
+            if not self._all.statCache().isDirectory(self._stagePackagesPath):
                 raise IOError('Stage packages path doesn\'t exist: {}'.format(self._stagePackagesPath))
 
 
@@ -195,25 +260,38 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
 
             self._projectInternalPackagesPath = getattr(self._module, 'getProjectInternalPackagesPath')(self._projectNameInUse,
                                                                                                         system())
-            if not os.path.isdir(self._projectInternalPackagesPath):
+            if not self._all.statCache().isDirectory(self._projectInternalPackagesPath):
                 raise IOError('Project internal packages path doesn\'t exist: {}'.format(self._projectInternalPackagesPath))
 
             self._projectExternalPackagesPath = getattr(self._module, 'getProjectExternalPackagesPath')(self._projectNameInUse,
                                                                                                         system())
-            if not os.path.isdir(self._projectExternalPackagesPath):
+            if not self._all.statCache().isDirectory(self._projectExternalPackagesPath):
                 raise IOError('Project external packages path doesn\'t exist: {}'.format(self._projectExternalPackagesPath))
 
 
         # Master Project
         self._masterProjectInternalPackagesPath = getattr(self._module, 'getMasterProjectInternalPackagesPath')(system())
-        if not os.path.isdir(self._masterProjectInternalPackagesPath):
+        if not self._all.statCache().isDirectory(self._masterProjectInternalPackagesPath):
             raise IOError('Master project internal packages path doesn\'t exist: {}'.format(self._masterProjectInternalPackagesPath))
 
         self._masterProjectExternalPackagesPath = getattr(self._module, 'getMasterProjectExternalPackagesPath')(system())
-        if not os.path.isdir(self._masterProjectExternalPackagesPath):
+        if not self._all.statCache().isDirectory(self._masterProjectExternalPackagesPath):
             raise IOError('Master project external packages path doesn\'t exist: {}'.format(self._masterProjectExternalPackagesPath))
 
 
+        # Layers
+        self._layerStack = mMeco.libs.layerLib.LayerStack()
+        self._layerStack.addDefaultLayers(self)
+
+        if hasattr(self._module, 'addLayers'):
+            getattr(self._module, 'addLayers')(self._layerStack,
+                                               self._projectNameInUse,
+                                               self._all.request().developer(),
+                                               self._all.request().development(),
+                                               self._all.request().stage(),
+                                               system())
+
+
         # App File Path
         if self._all.request().app():
             self._appFilePath = getattr(self._module, 'getAppFilePath')(self._projectNameInUse,
@@ -222,7 +300,7 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
                                                                         self._all.request().stage(),
                                                                         system(),
                                                                         self._all.request().app())
-            if self._appFilePath and not os.path.isfile(self._appFilePath):
+            if self._appFilePath and not self._all.statCache().isFile(self._appFilePath):
                 raise IOError('App file path doesn\'t exist: {}'.format(self._appFilePath))
 
 
@@ -235,6 +313,72 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
                                                                           self._appFilePath)
 
 
+        # Cache File Path
+        if hasattr(self._module, 'getCacheFilePath'):
+            self._cacheFilePath = getattr(self._module, 'getCacheFilePath')(self._projectNameInUse,
+                                                                            self._all.request().developer(),
+                                                                            self._all.request().development(),
+                                                                            self._all.request().stage(),
+                                                                            system(),
+                                                                            self._appFilePath)
+        else:
+            self._cacheFilePath = mMeco.fileSystem.fileLib.File.replaceExtension(self._scriptFilePath, 'cache')
+
+
+        # Manifest File Path
+        if hasattr(self._module, 'getManifestFilePath'):
+            self._manifestFilePath = getattr(self._module, 'getManifestFilePath')(self._projectNameInUse,
+                                                                                  self._all.request().developer(),
+                                                                                  self._all.request().development(),
+                                                                                  self._all.request().stage(),
+                                                                                  system(),
+                                                                                  self._appFilePath)
+        else:
+            self._manifestFilePath = mMeco.fileSystem.fileLib.File.replaceExtension(self._scriptFilePath, 'manifest')
+
+
+        # Cache Directory Path
+        if hasattr(self._module, 'getCacheDirectoryPath'):
+            self._cacheDirectoryPath = getattr(self._module, 'getCacheDirectoryPath')(system())
+        else:
+            self._cacheDirectoryPath = os.path.join(os.path.dirname(self._scriptFilePath), 'cache')
+
+
+        # Script Store Path
+        if hasattr(self._module, 'getScriptStorePath'):
+            self._scriptStorePath = getattr(self._module, 'getScriptStorePath')(system())
+
+
+        # Script Store Max Age
+        self._scriptStoreMaxAge = getattr(self._module, 'SCRIPT_STORE_MAX_AGE', SettingsOperator.SCRIPT_STORE_MAX_AGE)
+
+
+        # Scan Max Workers
+        self._scanMaxWorkers = getattr(self._module, 'SCAN_MAX_WORKERS', SettingsOperator.SCAN_MAX_WORKERS)
+
+
+        # Newest Version Only
+        self._newestVersionOnly = getattr(self._module, 'NEWEST_VERSION_ONLY', SettingsOperator.NEWEST_VERSION_ONLY)
+
+
+        # Newest Version Includes Pre-Releases
+        self._newestVersionIncludesPreReleases = getattr(self._module,
+                                                         'NEWEST_VERSION_INCLUDES_PRE_RELEASES',
+                                                         SettingsOperator.NEWEST_VERSION_INCLUDES_PRE_RELEASES)
+
+
+        # Unload Package Env Modules
+        self._unloadPackageEnvModules = getattr(self._module, 'UNLOAD_PACKAGE_ENV_MODULES', SettingsOperator.UNLOAD_PACKAGE_ENV_MODULES)
+
+
+        # Package Env Timeout
+        self._packageEnvTimeout         = getattr(self._module, 'PACKAGE_ENV_TIMEOUT', SettingsOperator.PACKAGE_ENV_TIMEOUT)
+        self._packageEnvTimeoutPolicy   = getattr(self._module, 'PACKAGE_ENV_TIMEOUT_POLICY', SettingsOperator.PACKAGE_ENV_TIMEOUT_POLICY)
+
+        if self._packageEnvTimeoutPolicy not in mMeco.libs.enumLib.PackageEnvTimeoutPolicy.listAttributes():
+            raise ValueError('Package env timeout policy is not valid: {}'.format(self._packageEnvTimeoutPolicy))
+
+
         # Terminal Header Display Color
         self._terminalHeaderDisplayColor = getattr(self._module, 'getTerminalHeaderDisplayColors')(system())
 
@@ -335,6 +479,16 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
 
         return self._masterProjectExternalPackagesPath
 
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return mMeco.libs.layerLib.LayerStack - Value.
+    def layerStack(self):
+
+        return self._layerStack
+
     #
     ## @brief Property.
     #
@@ -355,6 +509,117 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
 
         return self._scriptFilePath
 
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def cacheFilePath(self):
+
+        return self._cacheFilePath
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def manifestFilePath(self):
+
+        return self._manifestFilePath
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def cacheDirectoryPath(self):
+
+        return self._cacheDirectoryPath
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def scriptStorePath(self):
+
+        return self._scriptStorePath
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Value.
+    def scriptStoreMaxAge(self):
+
+        return self._scriptStoreMaxAge
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Value.
+    def scanMaxWorkers(self):
+
+        return self._scanMaxWorkers
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def newestVersionOnly(self):
+
+        return self._newestVersionOnly
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def newestVersionIncludesPreReleases(self):
+
+        return self._newestVersionIncludesPreReleases
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def unloadPackageEnvModules(self):
+
+        return self._unloadPackageEnvModules
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Value.
+    #  @return None  - If timeout is disabled.
+    def packageEnvTimeout(self):
+
+        return self._packageEnvTimeout
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return enum - Value from mMeco.libs.enumLib.PackageEnvTimeoutPolicy enum class.
+    def packageEnvTimeoutPolicy(self):
+
+        return self._packageEnvTimeoutPolicy
+
     #
     ## @brief Property.
     #
@@ -417,9 +682,35 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
         data += '\nLog File                              : {}'.format(self._logFilePath if self._logFilePath else 'N/A')
         data += '\nApp File Path                         : {}'.format(self._appFilePath if self._appFilePath else 'N/A')
         data += '\nScript File Path                      : {}'.format(self._scriptFilePath if self._scriptFilePath else 'N/A')
+        data += '\nCache File Path                       : {}'.format(self._cacheFilePath if self._cacheFilePath else 'N/A')
+        data += '\nManifest File Path                    : {}'.format(self._manifestFilePath if self._manifestFilePath else 'N/A')
+        data += '\nCache Directory Path                  : {}'.format(self._cacheDirectoryPath if self._cacheDirectoryPath else 'N/A')
+        data += '\nScript Store Path                     : {}'.format(self._scriptStorePath if self._scriptStorePath else 'N/A')
+        data += '\nScript Store Max Age                  : {}'.format(self._scriptStoreMaxAge if self._scriptStoreMaxAge else 'N/A')
+        data += '\nScan Max Workers                      : {}'.format(self._scanMaxWorkers)
+        data += '\nNewest Version Only                   : {}'.format(self._newestVersionOnly)
+        data += '\nNewest Version Includes Pre-Releases  : {}'.format(self._newestVersionIncludesPreReleases)
+        data += '\nUnload Package Env Modules            : {}'.format(self._unloadPackageEnvModules)
+        data += '\nPackage Env Timeout                   : {}'.format(self._packageEnvTimeout if self._packageEnvTimeout else 'N/A')
+        data += '\nPackage Env Timeout Policy            : {}'.format(self._packageEnvTimeoutPolicy)
+        data += '\nLayers                                : {}'.format(', '.join(self._layerStack.names()) if self._layerStack else 'N/A')
 
         return data
 
+    #
+    ## @brief Get sort key function to select the newest version of a package.
+    #
+    #  @exception N/A
+    #
+    #  @return function - mMeco.fileSystem.versionLib.SemanticVersion.getSortKey if pre-release versions are included,
+    #                     mMeco.fileSystem.versionLib.SemanticVersion.getReleaseSortKey otherwise.
+    def getNewestVersionSortKey(self):
+
+        if self._newestVersionIncludesPreReleases:
+            return mMeco.fileSystem.versionLib.SemanticVersion.getSortKey
+
+        return mMeco.fileSystem.versionLib.SemanticVersion.getReleaseSortKey
+
     #
     ## @brief Get terminal display color for given env type.
     #
@@ -432,6 +723,10 @@ class SettingsOperator(mMeco.abstract.operatorAbs.Operator):
     def getTerminalDisplayColorByColorName(self, colorName, envType=None):
 
         if envType:
+            layer = self._layerStack.getByName(envType) if self._layerStack else None
+            if layer:
+                envType = layer.colorEnvType()
+
             envType = envType.replace(' ', '-').lower()
 
         data = self._terminalDisplayColor
@@ -25,9 +25,7 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
-from    sys import stdout
-
-import  mMeco.abstract.responseAbs
+import  mMeco.responses.writeRes
 
 
 #
@@ -36,7 +34,11 @@ import  mMeco.abstract.responseAbs
 #-----------------------------------------------------------------------------------------------------
 #
 ## @brief [ CLASS ] - Response class.
-class Response(mMeco.abstract.responseAbs.Response):
+#
+#  Response writes the script file as mMeco.responses.writeRes.Response does, it then writes packages solved by
+#  the solver and env entry containers built by the builder into the cache file, so they can be read back by
+#  mMeco.solvers.cacheReadSol.Solver and mMeco.builders.cacheReadBld.Builder classes.
+class Response(mMeco.responses.writeRes.Response):
     #
     # ------------------------------------------------------------------------------------------------
     # PUBLIC STATIC MEMBERS
@@ -56,11 +58,11 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def __init__(self):
 
-        mMeco.abstract.responseAbs.Response.__dict__['__init__'](self)
+        mMeco.responses.writeRes.Response.__dict__['__init__'](self)
 
     #
     # ------------------------------------------------------------------------------------------------
-    # PUBLIC METHODS
+    # PROTECTED METHODS
     # ------------------------------------------------------------------------------------------------
     #
     ## @brief Respond.
@@ -68,8 +70,12 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @exception N/A
     #
     #  @return bool - Result.
-    def respond(self):
+    def _respond(self):
+
+        mMeco.responses.writeRes.Response._respond(self)
+
+        self._allLib.cache().write(self._allLib.solver(), self._allLib.builder())
 
-        stdout.write('Response: {}\n'.format(self.NAME))
+        self._allLib.logger().addInfo('Cache file has been written: {}'.format(self._allLib.cache().path()))
 
         return True
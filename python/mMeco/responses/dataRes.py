@@ -0,0 +1,352 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMeco/responses/dataRes.py @brief [ FILE   ] - Response.
+## @package mMeco.responses.dataRes    @brief [ MODULE ] - Response.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  json
+import  os
+import  re
+
+import  mMeco.abstract.responseAbs
+
+import  mMeco.core.platformLib
+
+import  mMeco.fileSystem.fileLib
+
+import  mMeco.libs.enumLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Response class.
+#
+#  Response writes the resolved env into a data file in the format requested by `--data-format` flag, so it can
+#  be applied without sourcing a script file in a shell. Env entries are processed in the order the script file
+#  written by mMeco.responses.writeRes.Response class evaluates them.
+#
+#  JSON format has the variables in the order they are first set, scripts and commands in the order they are
+#  evaluated. Each value has the package, version and layer it comes from. Value of a variable is the values of
+#  the variable joined by the separator, followed by its base if it has one, otherwise by the existing value
+#  of the variable. Values are written as they are built, `hasReference` key of a value tells whether it
+#  references a variable, which has to be expanded by the consumer.
+#
+#  Env format has `NAME=VALUE` pairs terminated by null characters, as `env -0` writes them. References to
+#  variables, `$NAME` and `${NAME}`, also `$env:NAME` and `%NAME%` on Windows, are expanded in the order the
+#  entries are evaluated against the env built so far, which falls back to the env of the current process.
+#  References to variables, which aren't set, are expanded to empty strings as a shell does. Scripts and commands
+#  can't be represented in this format, therefore they are skipped with a warning. Env format has only the
+#  variables set by mMeco, it isn't a full `env -0` dump of the resulting env, variables of the current
+#  process that mMeco doesn't set aren't written.
+class Response(mMeco.abstract.responseAbs.Response):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ str ] - Name.
+    NAME    = 'dataRes'
+
+    ## [ int ] - Version of the JSON format.
+    VERSION                     = 1
+
+    ## [ re.Pattern ] - Pattern of the references to variables.
+    REFERENCE_PATTERN           = re.compile(r'\$\{(\w+)\}|\$(\w+)')
+
+    ## [ re.Pattern ] - Pattern of the references to variables on Windows.
+    WINDOWS_REFERENCE_PATTERN   = re.compile(r'\$env:(\w+)|\$\{(\w+)\}|\$(\w+)|%(\w+)%')
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        mMeco.abstract.responseAbs.Response.__dict__['__init__'](self)
+
+        ## [ list of str ] - Variables in the order they are first set.
+        self._variableNames = []
+
+        ## [ dict ] - Variables, keys are names, values are dict with `base` and `values` keys. Values are in the order they are added.
+        self._variables     = {}
+
+        ## [ list of dict ] - Scripts and commands in the order they are evaluated.
+        self._commands      = []
+
+        ## [ list of tuple ] - Env entry type, variable name and value of the multi and single env entries in the order they are evaluated.
+        self._entries       = []
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get variable by given name, variable is created if it doesn't exist.
+    #
+    #  @param name [ str | None | in  ] - Name of the variable.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Variable.
+    def _getVariable(self, name):
+
+        variable = self._variables.get(name)
+        if variable is None:
+            variable = {'name'  : name,
+                        'base'  : None,
+                        'values': []}
+
+            self._variables[name] = variable
+            self._variableNames.append(name)
+
+        return variable
+
+    #
+    ## @brief Add entries of given env entry container.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #  @param envType           [ enum                                  | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addEntries(self, envEntryContainer, envType):
+
+        for entry in envEntryContainer.entries():
+
+            data = {'value'         : entry.value(),
+                    'hasReference'  : self._getReferencePattern().search(entry.value()) is not None,
+                    'package'       : envEntryContainer.packageName(),
+                    'version'       : envEntryContainer.version(),
+                    'layer'         : envType}
+
+            if entry.envEntryType() == mMeco.libs.enumLib.EnvEntryType.kMulti:
+
+                self._getVariable(entry.variable())['values'].append(data)
+                self._entries.append((entry.envEntryType(), entry.variable(), entry.value()))
+
+            elif entry.envEntryType() == mMeco.libs.enumLib.EnvEntryType.kSingle:
+
+                variable = self._getVariable(entry.variable())
+                variable['base']   = data
+                variable['values'] = []
+                self._entries.append((entry.envEntryType(), entry.variable(), entry.value()))
+
+            else:
+
+                data['type'] = entry.envEntryType()
+                self._commands.append(data)
+
+    #
+    ## @brief Get variables.
+    #
+    #  Values are prepended, therefore values added later take precedence and they come first. Duplicate values
+    #  of a variable are removed, the one which takes precedence is kept.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Variables.
+    def _getVariables(self):
+
+        variables = []
+
+        for name in self._variableNames:
+
+            variable = self._variables[name]
+
+            values      = []
+            valueSet    = set()
+            for value in reversed(variable['values']):
+                if not value['value'] in valueSet:
+                    valueSet.add(value['value'])
+                    values.append(value)
+
+            variables.append({'name'    : name,
+                              'base'    : variable['base'],
+                              'values'  : values})
+
+        return variables
+
+    #
+    ## @brief Get separator of the values of the variables for the requested platform.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Separator.
+    def _getSeparator(self):
+
+        return ';' if mMeco.core.platformLib.Platform.isWindows() else ':'
+
+    #
+    ## @brief Get pattern of the references to variables for the requested platform.
+    #
+    #  @exception N/A
+    #
+    #  @return re.Pattern - Pattern.
+    def _getReferencePattern(self):
+
+        if mMeco.core.platformLib.Platform.isWindows():
+            return Response.WINDOWS_REFERENCE_PATTERN
+
+        return Response.REFERENCE_PATTERN
+
+    #
+    ## @brief Join given values of a variable with its base or with its existing value.
+    #
+    #  Values are prepended, therefore values added later take precedence and they come first. Duplicate values
+    #  are removed, the one which takes precedence is kept.
+    #
+    #  @param name   [ str         | None | in  ] - Name of the variable.
+    #  @param values [ list of str | None | in  ] - Values in the order they are added.
+    #  @param base   [ str         | None | in  ] - Base, `None` if the variable doesn't have one.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value of the variable.
+    def _joinValues(self, name, values, base):
+
+        joinedValues    = []
+        valueSet        = set()
+        for value in reversed(values):
+            if not value in valueSet:
+                valueSet.add(value)
+                joinedValues.append(value)
+
+        if base is not None:
+            joinedValues.append(base)
+        elif os.environ.get(name):
+            joinedValues.append(os.environ[name])
+
+        return self._getSeparator().join(joinedValues)
+
+    #
+    ## @brief Get the resolved env in JSON format.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Data.
+    def _getJson(self):
+
+        data = {'version'   : Response.VERSION,
+                'platform'  : self._allLib.request().platform(),
+                'separator' : self._getSeparator(),
+                'variables' : self._getVariables(),
+                'commands'  : self._commands}
+
+        return json.dumps(data, indent=1, sort_keys=True)
+
+    #
+    ## @brief Get the resolved env in `env -0` format.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Data.
+    def _getEnv(self):
+
+        if self._commands:
+            self._allLib.logger().addWarning('Scripts and commands can\'t be written in env data format, '
+                                             '{} of them are skipped.'.format(len(self._commands)))
+
+        pattern     = self._getReferencePattern()
+        environ     = dict(os.environ)
+        variables   = {}
+
+        def expand(match):
+            return environ.get(match.group(match.lastindex), '')
+
+        for envEntryType, name, value in self._entries:
+
+            value       = pattern.sub(expand, value)
+            variable    = variables.setdefault(name, {'base': None, 'values': []})
+
+            if envEntryType == mMeco.libs.enumLib.EnvEntryType.kMulti:
+                variable['values'].append(value)
+            else:
+                variable['base']   = value
+                variable['values'] = []
+
+            environ[name] = self._joinValues(name, variable['values'], variable['base'])
+
+        return ''.join(['{}={}\0'.format(name, environ[name]) for name in self._variableNames])
+
+    #
+    ## @brief Respond.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _respond(self):
+
+        # Pre
+        for envEntryContainer in self._allLib.builder().preBuildEnvEntryContainers():
+            self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kPreBuild)
+
+        # Layers
+        for name in self._allLib.layerStack().names():
+            for envEntryContainer in self._allLib.builder().getEnvEntryContainers(name) or []:
+                self._addEntries(envEntryContainer, name)
+
+        # Post
+        for envEntryContainer in self._allLib.builder().postBuildEnvEntryContainers():
+            self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kPostBuild)
+
+        #
+
+        dataFormat = self._allLib.request().dataFormat()
+
+        data = self._getEnv() if dataFormat == mMeco.libs.enumLib.DataFormat.kEnv else self._getJson()
+
+        dataFilePath = mMeco.fileSystem.fileLib.File.writeAtomically(Response.getDataFilePath(self._allLib.settingsOperator().scriptFilePath(),
+                                                                                              dataFormat),
+                                                                     data)
+
+        self._allLib.logger().addInfo('Data file has been written: {}'.format(dataFilePath))
+
+        return True
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get path of the data file of given script file.
+    #
+    #  @param scriptFilePath [ str  | None | in  ] - Absolute path of the script file.
+    #  @param dataFormat     [ enum | None | in  ] - A value from mMeco.libs.enumLib.DataFormat enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the data file.
+    @staticmethod
+    def getDataFilePath(scriptFilePath, dataFormat):
+
+        return mMeco.fileSystem.fileLib.File.replaceExtension(scriptFilePath, dataFormat)
@@ -25,20 +25,337 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import  hashlib
 import  os
+import  shutil
+import  tempfile
+import  time
+import  uuid
 
 import  mMeco.abstract.responseAbs
 
 import  mMeco.core.platformLib
 
+import  mMeco.fileSystem.fileLib
+
 import  mMeco.libs.aboutLib
+import  mMeco.libs.allLib
 import  mMeco.libs.enumLib
+import  mMeco.libs.manifestLib
 
 
 #
 #-----------------------------------------------------------------------------------------------------
 # CODE
 #-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Render context.
+#
+#  Platform, request flags and colors are resolved once per respond, display templates are resolved once
+#  per env type, so rendering an entry is a single format call. Templates have `variable` and `value`
+#  fields.
+class RenderContext(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ mMeco.libs.allLib.All ] - All.
+        self._allLib            = mMeco.libs.allLib.All.getInstance()
+
+        ## [ bool ] - Whether current platform is Windows.
+        self._isWindows         = mMeco.core.platformLib.Platform.isWindows()
+
+        ## [ bool ] - Set only.
+        self._setOnly           = self._allLib.request().setOnly()
+
+        ## [ bool ] - Display only.
+        self._displayOnly       = self._allLib.request().displayOnly()
+
+        ## [ int ] - Verbose.
+        self._verbose           = self._allLib.request().verbose()
+
+        ## [ str ] - New line.
+        self._newLine           = 'Write-Host "";' if self._isWindows else 'echo "";\n'
+
+        ## [ str ] - Separator of the values of multi envs.
+        self._multiSeparator    = ';' if self._isWindows else ':'
+
+        ## [ dict ] - Env templates, keys are values from mMeco.libs.enumLib.EnvEntryType enum class.
+        self._envTemplates      = {}
+
+        ## [ dict ] - Display templates, keys are env types or names of the layers, values are dict.
+        self._displayTemplates  = {}
+
+        self._initialize()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Initialize env templates.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _initialize(self):
+
+        if self._isWindows:
+            self._envTemplates[mMeco.libs.enumLib.EnvEntryType.kMulti]  = '$env:{variable}="{value};$env:{variable}";\n'
+            self._envTemplates[mMeco.libs.enumLib.EnvEntryType.kSingle] = '$env:{variable}="{value}";\n'
+            self._envTemplates[mMeco.libs.enumLib.EnvEntryType.kScript] = '. {value};\n'
+        else:
+            self._envTemplates[mMeco.libs.enumLib.EnvEntryType.kMulti]  = 'export {variable}={value}:${variable};\n'
+            self._envTemplates[mMeco.libs.enumLib.EnvEntryType.kSingle] = 'export {variable}={value};\n'
+            self._envTemplates[mMeco.libs.enumLib.EnvEntryType.kScript] = 'source {value};\n'
+
+    #
+    ## @brief Get display template of a line, which consists of a variable, a separator and a value.
+    #
+    #  @param envType        [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #  @param variableColor  [ enum | None | in  ] - A value from mMeco.libs.enumLib.ColorName enum class.
+    #  @param separator      [ str  | None | in  ] - Separator.
+    #  @param separatorColor [ enum | None | in  ] - A value from mMeco.libs.enumLib.ColorName enum class.
+    #  @param valueColor     [ enum | None | in  ] - A value from mMeco.libs.enumLib.ColorName enum class.
+    #  @param padding        [ int  | None | in  ] - Padding of the variable.
+    #  @param end            [ str  | None | in  ] - End of the printf statement.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Template.
+    def _getLineTemplate(self, envType, variableColor, separator, separatorColor, valueColor, padding, end):
+
+        variableColor  = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(variableColor, envType)
+        separatorColor = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(separatorColor, envType)
+        valueColor     = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(valueColor, envType)
+
+        variable = '{{variable:<{}}}'.format(padding)
+
+        if self._isWindows:
+            return 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{{value}}" -NoNewline -ForegroundColor {};\n'.format(variable,
+                                                                                                                                                                                   RenderContext.escape(variableColor),
+                                                                                                                                                                                   separator,
+                                                                                                                                                                                   RenderContext.escape(separatorColor),
+                                                                                                                                                                                   RenderContext.escape(valueColor))
+
+        return 'printf "{}{} {}";{}'.format(RenderContext.colorize(variableColor, variable),
+                                            RenderContext.colorize(separatorColor, separator),
+                                            RenderContext.colorize(valueColor, '{value}'),
+                                            end)
+
+    #
+    ## @brief Get display template of a line, which consists of a value.
+    #
+    #  @param envType    [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #  @param valueColor [ enum | None | in  ] - A value from mMeco.libs.enumLib.ColorName enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Template.
+    def _getValueTemplate(self, envType, valueColor):
+
+        valueColor = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(valueColor, envType)
+
+        if self._isWindows:
+            return 'Write-Host "{{value}}" -NoNewline -ForegroundColor {};\n'.format(RenderContext.escape(valueColor))
+
+        return 'printf "{}";\n'.format(RenderContext.colorize(valueColor, '{value}'))
+
+    #
+    ## @brief Resolve display templates of given env type.
+    #
+    #  Templates of the entries, which aren't displayed for the env type with current verbose level are None.
+    #  New line display is included in the templates.
+    #
+    #  @param envType [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are values from mMeco.libs.enumLib.EnvEntryType enum class and mMeco.libs.enumLib.EnvEntryContainerType.kPackage
+    #                 for the container, values are str or None.
+    def _resolveDisplayTemplates(self, envType):
+
+        isBuild = envType in [mMeco.libs.enumLib.EnvType.kPreBuild, mMeco.libs.enumLib.EnvType.kPostBuild]
+
+        templates = {mMeco.libs.enumLib.EnvEntryType.kMulti                 : None,
+                     mMeco.libs.enumLib.EnvEntryType.kSingle                : None,
+                     mMeco.libs.enumLib.EnvEntryType.kCommand               : None,
+                     mMeco.libs.enumLib.EnvEntryType.kScript                : None,
+                     mMeco.libs.enumLib.EnvEntryContainerType.kPackage      : None}
+
+        if self._setOnly:
+            return templates
+
+        if not isBuild:
+            templates[mMeco.libs.enumLib.EnvEntryContainerType.kPackage] = self._getLineTemplate(envType,
+                                                                                                 mMeco.libs.enumLib.ColorName.kPackageVariable,
+                                                                                                 '>',
+                                                                                                 mMeco.libs.enumLib.ColorName.kArrow,
+                                                                                                 mMeco.libs.enumLib.ColorName.kPackageValue,
+                                                                                                 Response.PADDING_1,
+                                                                                                 '\n') + self._newLine
+
+        if isBuild or self._verbose in [2, 3, 4]:
+
+            templates[mMeco.libs.enumLib.EnvEntryType.kMulti]  = self._getLineTemplate(envType,
+                                                                                       mMeco.libs.enumLib.ColorName.kMultiVariable,
+                                                                                       ':',
+                                                                                       mMeco.libs.enumLib.ColorName.kColon,
+                                                                                       mMeco.libs.enumLib.ColorName.kMultiValue,
+                                                                                       Response.PADDING_1,
+                                                                                       '\n') + self._newLine
+
+            templates[mMeco.libs.enumLib.EnvEntryType.kSingle] = self._getLineTemplate(envType,
+                                                                                       mMeco.libs.enumLib.ColorName.kSingleVariable,
+                                                                                       ':',
+                                                                                       mMeco.libs.enumLib.ColorName.kColon,
+                                                                                       mMeco.libs.enumLib.ColorName.kSingleValue,
+                                                                                       Response.PADDING_2 if isBuild else Response.PADDING_1,
+                                                                                       '') + self._newLine
+
+        if (isBuild and self._verbose in [4]) or (not isBuild and self._verbose in [3, 4]):
+
+            templates[mMeco.libs.enumLib.EnvEntryType.kCommand] = self._getValueTemplate(envType, mMeco.libs.enumLib.ColorName.kCommand) + self._newLine
+            templates[mMeco.libs.enumLib.EnvEntryType.kScript]  = templates[mMeco.libs.enumLib.EnvEntryType.kCommand]
+
+        return templates
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def isWindows(self):
+
+        return self._isWindows
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def setOnly(self):
+
+        return self._setOnly
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Value.
+    def displayOnly(self):
+
+        return self._displayOnly
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Value.
+    def verbose(self):
+
+        return self._verbose
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def newLine(self):
+
+        return self._newLine
+
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def multiSeparator(self):
+
+        return self._multiSeparator
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get env template of given env entry type.
+    #
+    #  @param envEntryType [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvEntryType enum class except kCommand.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Template.
+    def getEnvTemplate(self, envEntryType):
+
+        return self._envTemplates[envEntryType]
+
+    #
+    ## @brief Get display templates of given env type.
+    #
+    #  @param envType [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Templates, see mMeco.responses.writeRes.RenderContext._resolveDisplayTemplates.
+    def getDisplayTemplates(self, envType):
+
+        templates = self._displayTemplates.get(envType)
+        if templates is None:
+            templates = self._resolveDisplayTemplates(envType)
+            self._displayTemplates[envType] = templates
+
+        return templates
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Escape braces of given string, so it can be used as literal in a template.
+    #
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    @staticmethod
+    def escape(value):
+
+        return value.replace('{', '{{').replace('}', '}}')
+
+    #
+    ## @brief Apply given terminal display color, which has a `{}` placeholder, to given template field or text.
+    #
+    #  @param color [ str | None | in  ] - Terminal display color.
+    #  @param field [ str | None | in  ] - Template field such as `{value}` or text without braces.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Template.
+    @staticmethod
+    def colorize(color, field):
+
+        return RenderContext.escape(color).replace('{{}}', field)
+
 #
 ## @brief [ CLASS ] - Response class.
 class Response(mMeco.abstract.responseAbs.Response):
@@ -69,59 +386,189 @@ class Response(mMeco.abstract.responseAbs.Response):
 
         mMeco.abstract.responseAbs.Response.__dict__['__init__'](self)
 
+        ## [ list of str ] - Variables of the pending multi envs in the order they are added.
+        self._multiEnvVariables = []
+
+        ## [ dict ] - Pending multi envs, keys are variables, values are list of str in the order they are added.
+        self._multiEnvValues    = {}
+
+        ## [ file ] - Temporary script file, which script file start and display members are streamed into.
+        self._scriptFile        = None
+
+        ## [ str ] - Absolute path of the temporary script file, which exists until it is moved or removed.
+        self._temporaryScriptFilePath = None
+
+        ## [ file ] - Temporary file, which env members are streamed into.
+        self._envSpoolFile      = None
+
+        ## [ mMeco.responses.writeRes.RenderContext ] - Render context of current respond.
+        self._renderContext     = None
+
     #
     # ------------------------------------------------------------------------------------------------
     # PROTECTED METHODS
     # ------------------------------------------------------------------------------------------------
     #
-    ## @brief Write the env into a script file.
+    ## @brief Open the temporary files the script file is streamed into.
+    #
+    #  Script file start and display members are written into a temporary file in the directory of the script
+    #  file, or in the script store if there is one, whereas env members are written into a separate spool since
+    #  they follow the display members in the script file.
     #
     #  @exception N/A
     #
-    #  @return str - Absolute path of the script file.
-    def _write(self):
+    #  @return None - None.
+    def _openSpools(self):
+
+        path = self._allLib.settingsOperator().scriptStorePath()
+        if not path:
+            path = os.path.dirname(self._allLib.settingsOperator().scriptFilePath())
 
-        path = os.path.dirname(self._allLib.settingsOperator().scriptFilePath())
         if not os.path.isdir(path):
-            os.makedirs(path)
+            try:
+                os.makedirs(path)
+            except OSError:
+                if not os.path.isdir(path):
+                    raise
+
+        fileDescriptor, self._temporaryScriptFilePath = tempfile.mkstemp(prefix='.{}.'.format(os.path.basename(self._allLib.settingsOperator().scriptFilePath())),
+                                                                         dir=path)
+
+        mMeco.fileSystem.fileLib.File.setDefaultPermissions(self._temporaryScriptFilePath)
+
+        self._scriptFile   = os.fdopen(fileDescriptor, 'w')
+        self._envSpoolFile = tempfile.TemporaryFile(mode='w+', dir=path)
 
-        file = open(self._allLib.settingsOperator().scriptFilePath(), 'w')
+        self._scriptFile.writelines(self._scriptFileStartEnv)
+        del self._scriptFileStartEnv[:]
+
+    #
+    ## @brief Stream display and env members of given env type into the temporary files and release them.
+    #
+    #  @param envType [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _spool(self, envType):
 
-        file.writelines(self._scriptFileStartEnv)
+        display = self._getDisplayByEnvType(envType)
+        env     = self._getEnvByEnvType(envType)
 
         if not self._allLib.request().setOnly():
-            file.writelines(self._preBuiltDisplay)
-            file.writelines(self._reservedDisplay)
-            file.writelines(self._developmentDisplay)
-            file.writelines(self._stageDisplay)
-            file.writelines(self._projectInternalDisplay)
-            file.writelines(self._projectExternalDisplay)
-            file.writelines(self._masterProjectInternalDisplay)
-            file.writelines(self._masterProjectExternalDisplay)
-            file.writelines(self._postBuiltDisplay)
-            file.writelines(self._envDisplay)
-            file.writelines(self._infoDisplay)
-            file.writelines(self._productInfoDisplay)
-            pass
+            self._scriptFile.writelines(display)
 
         if not self._allLib.request().displayOnly():
-            file.writelines(self._preBuiltEnv)
-            file.writelines(self._reservedEnv)
-            file.writelines(self._developmentEnv)
-            file.writelines(self._stageEnv)
-            file.writelines(self._projectInternalEnv)
-            file.writelines(self._projectExternalEnv)
-            file.writelines(self._masterProjectInternalEnv)
-            file.writelines(self._masterProjectExternalEnv)
-            file.writelines(self._postBuiltEnv)
-            file.writelines(self._envEnv)
+            self._envSpoolFile.writelines(env)
+
+        del display[:]
+        del env[:]
+
+    #
+    ## @brief Close the temporary files, temporary script file is removed if it hasn't been moved.
+    #
+    #  Temporary script file is removed whenever it still exists, such as when rendering, storing or linking
+    #  the script file fails.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _closeSpools(self):
+
+        if self._envSpoolFile:
+            self._envSpoolFile.close()
+            self._envSpoolFile = None
+
+        if self._scriptFile:
+            self._scriptFile.close()
+            self._scriptFile = None
 
-        file.writelines(self._scriptFileEndEnv)
+        if self._temporaryScriptFilePath and os.path.isfile(self._temporaryScriptFilePath):
+            try:
+                os.remove(self._temporaryScriptFilePath)
+            except OSError:
+                pass
+
+        self._temporaryScriptFilePath = None
 
-        file.close()
+    #
+    ## @brief Write the env into a script file.
+    #
+    #  Env spool is appended to the temporary script file, which is then renamed to the script file, so the
+    #  script file is replaced atomically. If there is a script store, the temporary script file is stored by
+    #  mMeco.responses.writeRes.Response._store method instead.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the script file.
+    def _write(self):
+
+        self._envSpoolFile.seek(0)
+        shutil.copyfileobj(self._envSpoolFile, self._scriptFile)
+
+        self._scriptFile.writelines(self._scriptFileEndEnv)
+        del self._scriptFileEndEnv[:]
+
+        self._scriptFile.close()
+        self._scriptFile = None
+
+        if self._allLib.settingsOperator().scriptStorePath():
+            self._store()
+        else:
+            mMeco.fileSystem.fileLib.File.replace(self._temporaryScriptFilePath, self._allLib.settingsOperator().scriptFilePath())
 
         return self._allLib.settingsOperator().scriptFilePath()
 
+    #
+    ## @brief Store the temporary script file under the hash of its content and link the script file to it.
+    #
+    #  Identical scripts share a single file in the script store. Temporary script file is discarded if the
+    #  store already has the script with the same size, so an intact stored script is never rewritten, its
+    #  modification time is updated instead. Stored script files, which haven't been used for
+    #  `SCRIPT_STORE_MAX_AGE` seconds, are removed beforehand, otherwise the store grows without bound.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the stored script file.
+    def _store(self):
+
+        storePath     = self._allLib.settingsOperator().scriptStorePath()
+        storeFilePath = os.path.join(storePath,
+                                     '{}{}'.format(Response.getContentHash(self._temporaryScriptFilePath),
+                                                   os.path.splitext(self._allLib.settingsOperator().scriptFilePath())[1]))
+
+        if self._allLib.settingsOperator().scriptStoreMaxAge():
+            Response.pruneStore(storePath, self._allLib.settingsOperator().scriptStoreMaxAge(), [self._temporaryScriptFilePath])
+
+        if os.path.isfile(storeFilePath) and os.path.getsize(storeFilePath) == os.path.getsize(self._temporaryScriptFilePath):
+            os.remove(self._temporaryScriptFilePath)
+            os.utime(storeFilePath, None)
+        else:
+            mMeco.fileSystem.fileLib.File.replace(self._temporaryScriptFilePath, storeFilePath)
+
+        Response.link(storeFilePath, self._allLib.settingsOperator().scriptFilePath())
+
+        return storeFilePath
+
+    #
+    ## @brief Write the manifest file of the script file.
+    #
+    #  Manifest file can only be written if the fingerprint has been computed before the env is resolved,
+    #  otherwise existing manifest file is removed since it doesn't describe the script file anymore.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _writeManifest(self):
+
+        manifest    = mMeco.libs.manifestLib.Manifest(self._allLib.settingsOperator().manifestFilePath())
+        fingerprint = self._allLib.fingerprint()
+
+        if fingerprint and fingerprint.value():
+            manifest.write(fingerprint, self._allLib.solver())
+        else:
+            manifest.remove()
+
     #
     #
     #
@@ -186,6 +633,9 @@ class Response(mMeco.abstract.responseAbs.Response):
     #
     ## @brief Add multi env.
     #
+    #  Multi envs are not written immediately, they are kept pending so that consecutive multi envs of a variable
+    #  can be written as a single assignment by mMeco.responses.writeRes.Response._flushMultiEnvs method.
+    #
     #  @param envEntry  [ mMeco.libs.entryLib.EnvEntry  | None | in  ] - Env envEntry.
     #  @param envType   [ enum                          | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class.
     #
@@ -194,21 +644,60 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addMultiEnv(self, envEntry, envType):
 
-        if self._allLib.request().displayOnly():
+        if self._renderContext.displayOnly():
             return
 
-        value = ''
+        # Value, which references a variable, must see the pending multi envs
+        if Response.hasReference(envEntry.value()):
+            self._flushMultiEnvs(envType)
 
-        if mMeco.core.platformLib.Platform.isWindows():
-            value = '$env:{}="{};$env:{}";\n'.format(envEntry.variable(), envEntry.value(), envEntry.variable())
-        else:
-            value = 'export {}={}:${};\n'.format(envEntry.variable(), envEntry.value(), envEntry.variable())
+        if not envEntry.variable() in self._multiEnvValues:
+            self._multiEnvVariables.append(envEntry.variable())
 
-        self._getEnvByEnvType(envType).append(value)
+        self._multiEnvValues.setdefault(envEntry.variable(), []).append(envEntry.value())
+
+    #
+    ## @brief Write pending multi envs, one assignment per variable.
+    #
+    #  Every multi env prepends its value, therefore values added later take precedence. Values are written
+    #  in reverse order they are added and duplicate values are written once where they take precedence, so
+    #  the variables end up resolving the same way as if each multi env was written separately.
+    #
+    #  Pending multi envs must be written before any entry, which may read or override them, such as single
+    #  envs of a pending variable, command and script envs and single or multi envs, which reference a variable.
+    #
+    #  @param envType [ enum | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class or name of a layer.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _flushMultiEnvs(self, envType):
+
+        if not self._multiEnvVariables:
+            return
+
+        template  = self._renderContext.getEnvTemplate(mMeco.libs.enumLib.EnvEntryType.kMulti)
+        separator = self._renderContext.multiSeparator()
+        env       = self._getEnvByEnvType(envType)
+
+        for variable in self._multiEnvVariables:
+
+            values = []
+            for value in reversed(self._multiEnvValues[variable]):
+                if not value in values:
+                    values.append(value)
+
+            env.append(template.format(variable=variable, value=separator.join(values)))
+
+        del self._multiEnvVariables[:]
+        self._multiEnvValues.clear()
 
     #
     ## @brief Add single env.
     #
+    #  Pending multi envs are written first only if the single env overrides one of them or its value references
+    #  a variable, otherwise they stay pending, since the single env can't read them.
+    #
     #  @param envEntry  [ mMeco.libs.entryLib.EnvEntry  | None | in  ] - Env envEntry.
     #  @param envType   [ enum                          | None | in  ] - A value from mMeco.libs.enumLib.EnvType enum class.
     #
@@ -217,17 +706,14 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addSingleEnv(self, envEntry, envType):
 
-        if self._allLib.request().displayOnly():
+        if self._renderContext.displayOnly():
             return
 
-        value = ''
+        if envEntry.variable() in self._multiEnvValues or Response.hasReference(envEntry.value()):
+            self._flushMultiEnvs(envType)
 
-        if mMeco.core.platformLib.Platform.isWindows():
-            value = '$env:{}="{}";\n'.format(envEntry.variable(), envEntry.value())
-        else:
-            value = 'export {}={};\n'.format(envEntry.variable(), envEntry.value())
-
-        self._getEnvByEnvType(envType).append(value)
+        self._getEnvByEnvType(envType).append(self._renderContext.getEnvTemplate(mMeco.libs.enumLib.EnvEntryType.kSingle).format(variable=envEntry.variable(),
+                                                                                                                                 value=envEntry.value()))
 
     #
     ## @brief Add command env.
@@ -240,9 +726,11 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addCommandEnv(self, envEntry, envType):
 
-        if self._allLib.request().displayOnly():
+        if self._renderContext.displayOnly():
             return
 
+        self._flushMultiEnvs(envType)
+
         value = envEntry.value()
 
         if not value.endswith(';'):
@@ -263,17 +751,12 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addScriptEnv(self, envEntry, envType):
 
-        if self._allLib.request().displayOnly():
+        if self._renderContext.displayOnly():
             return
 
-        value = ''
+        self._flushMultiEnvs(envType)
 
-        if mMeco.core.platformLib.Platform.isWindows():
-            value = '. {};\n'.format(envEntry.value())
-        else:
-            value = 'source {};\n'.format(envEntry.value())
-
-        self._getEnvByEnvType(envType).append(value)
+        self._getEnvByEnvType(envType).append(self._renderContext.getEnvTemplate(mMeco.libs.enumLib.EnvEntryType.kScript).format(value=envEntry.value()))
 
     #
     ## @brief Add app env.
@@ -322,10 +805,7 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return str - New line.
     def _getNewLine(self):
 
-        if mMeco.core.platformLib.Platform.isWindows():
-            return 'Write-Host "";'
-        else:
-            return 'echo "";\n'
+        return self._renderContext.newLine()
 
     #
     ## @brief Add new line display.
@@ -337,17 +817,10 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addNewLineDisplay(self, envType):
 
-        if self._allLib.request().setOnly():
+        if self._renderContext.setOnly():
             return
 
-        newLine = ''
-
-        if mMeco.core.platformLib.Platform.isWindows():
-            newLine = 'Write-Host "";'
-        else:
-            newLine = 'echo "";\n'
-
-        self._getDisplayByEnvType(envType).append(newLine)
+        self._getDisplayByEnvType(envType).append(self._renderContext.newLine())
 
     #
     ## @brief Add new line display.
@@ -413,36 +886,14 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addContainerDisplay(self, envEntryContainer, envType):
 
-        if self._allLib.request().setOnly():
+        template = self._renderContext.getDisplayTemplates(envType)[mMeco.libs.enumLib.EnvEntryContainerType.kPackage]
+        if not template:
             return
 
-        colorVariable = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kPackageVariable, envType)
-        colorArrow    = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kArrow, envType)
-        colorValue    = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kPackageValue, envType)
-
         variable = '{}{}'.format(envEntryContainer.packageName(),
                                  ' - {}'.format(envEntryContainer.version()) if envEntryContainer.version() else '')
 
-        variableAndValueDisplay = ''
-
-        if mMeco.core.platformLib.Platform.isWindows():
-            variableAndValueDisplay = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-            variableAndValueDisplay = variableAndValueDisplay.format(variable.ljust(Response.PADDING_1),
-                                                                     colorVariable,
-                                                                     '>',
-                                                                     colorArrow,
-                                                                     envEntryContainer.getPackageRootPath(),
-                                                                     colorValue
-                                                                     )
-        else:
-            variableAndValueDisplay = 'printf "{}{} {}";\n'.format(colorVariable.format(variable.ljust(Response.PADDING_1)),
-                                                                   colorArrow.format('>'),
-                                                                   colorValue.format(envEntryContainer.getPackageRootPath())
-                                                                   )
-
-        self._getDisplayByEnvType(envType).append(variableAndValueDisplay)
-
-        self._addNewLineDisplay(envType)
+        self._getDisplayByEnvType(envType).append(template.format(variable=variable, value=envEntryContainer.getPackageRootPath()))
 
     #
     ## @brief Add multi display.
@@ -455,41 +906,11 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addMultiDisplay(self, envEntry, envType):
 
-        if self._allLib.request().setOnly():
+        template = self._renderContext.getDisplayTemplates(envType)[mMeco.libs.enumLib.EnvEntryType.kMulti]
+        if not template:
             return
 
-        if not envType in [mMeco.libs.enumLib.EnvType.kPreBuild,
-                           mMeco.libs.enumLib.EnvType.kPostBuild] and \
-           not self._allLib.request().verbose() in [2, 3, 4]:
-            return
-
-        colorVariable = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kMultiVariable, envType)
-        colorColon    = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kColon, envType)
-        colorValue    = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kMultiValue, envType)
-
-        value = ''
-
-        if mMeco.core.platformLib.Platform.isWindows():
-
-            value = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-            value = value.format(envEntry.variable().ljust(Response.PADDING_1),
-                                 colorVariable,
-                                 ':',
-                                 colorColon,
-                                 envEntry.value(),
-                                 colorValue
-                                 )
-
-        else:
-
-            value = 'printf "{}";\n'.format('{}{} {}'.format(colorVariable.format(envEntry.variable().ljust(Response.PADDING_1)),
-                                                             colorColon.format(':'),
-                                                             colorValue.format(envEntry.value())
-                                                             )
-                                            )
-
-        self._getDisplayByEnvType(envType).append(value)
-        self._addNewLineDisplay(envType)
+        self._getDisplayByEnvType(envType).append(template.format(variable=envEntry.variable(), value=envEntry.value()))
 
     #
     ## @brief Add single display.
@@ -502,43 +923,11 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addSingleDisplay(self, envEntry, envType):
 
-        if self._allLib.request().setOnly():
-            return
-
-        if not envType in [mMeco.libs.enumLib.EnvType.kPreBuild,
-                           mMeco.libs.enumLib.EnvType.kPostBuild] and \
-           not self._allLib.request().verbose() in [2, 3, 4]:
+        template = self._renderContext.getDisplayTemplates(envType)[mMeco.libs.enumLib.EnvEntryType.kSingle]
+        if not template:
             return
 
-        padding = Response.PADDING_1
-        if envType in [mMeco.libs.enumLib.EnvType.kPreBuild,mMeco.libs.enumLib.EnvType.kPostBuild]:
-            padding = Response.PADDING_2
-
-        colorVariable = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kSingleVariable, envType)
-        colorColon    = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kColon, envType)
-        colorValue    = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kSingleValue, envType)
-
-        value = ''
-
-        if mMeco.core.platformLib.Platform.isWindows():
-
-            value = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-            value = value.format(envEntry.variable().ljust(padding),
-                                 colorVariable,
-                                 ':',
-                                 colorColon,
-                                 envEntry.value(),
-                                 colorValue
-                                 )
-
-        else:
-
-            value = 'printf "{}{} {}";'.format(colorVariable.format(envEntry.variable().ljust(padding)),
-                                               colorColon.format(':'),
-                                               colorValue.format(envEntry.value()))
-
-        self._getDisplayByEnvType(envType).append(value)
-        self._addNewLineDisplay(envType)
+        self._getDisplayByEnvType(envType).append(template.format(variable=envEntry.variable(), value=envEntry.value()))
 
     #
     ## @brief Add command display.
@@ -551,31 +940,11 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addCommandDisplay(self, envEntry, envType):
 
-        if self._allLib.request().setOnly():
-            return
-
-        if envType in [mMeco.libs.enumLib.EnvType.kPreBuild, mMeco.libs.enumLib.EnvType.kPostBuild] and \
-            not self._allLib.request().verbose() in [4]:
+        template = self._renderContext.getDisplayTemplates(envType)[mMeco.libs.enumLib.EnvEntryType.kCommand]
+        if not template:
             return
 
-        if not envType in [mMeco.libs.enumLib.EnvType.kPreBuild, mMeco.libs.enumLib.EnvType.kPostBuild] and \
-           not self._allLib.request().verbose() in [3, 4]:
-                return
-
-        colorValue = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kCommand, envType)
-
-        value = ''
-
-        if mMeco.core.platformLib.Platform.isWindows():
-
-            value = 'Write-Host "{}" -NoNewline -ForegroundColor {};\n'.format(envEntry.value(), colorValue)
-
-        else:
-
-            value = 'printf "{}";\n'.format(colorValue.format(envEntry.value()))
-
-        self._getDisplayByEnvType(envType).append(value)
-        self._addNewLineDisplay(envType)
+        self._getDisplayByEnvType(envType).append(template.format(variable=envEntry.variable(), value=envEntry.value()))
 
     #
     ## @brief Add script display.
@@ -588,31 +957,11 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return None - None.
     def _addScriptDisplay(self, envEntry, envType):
 
-        if self._allLib.request().setOnly():
-            return
-
-        if envType in [mMeco.libs.enumLib.EnvType.kPreBuild, mMeco.libs.enumLib.EnvType.kPostBuild] and \
-            not self._allLib.request().verbose() in [4]:
+        template = self._renderContext.getDisplayTemplates(envType)[mMeco.libs.enumLib.EnvEntryType.kScript]
+        if not template:
             return
 
-        if not envType in [mMeco.libs.enumLib.EnvType.kPreBuild, mMeco.libs.enumLib.EnvType.kPostBuild] and \
-           not self._allLib.request().verbose() in [3, 4]:
-                return
-
-        colorValue = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kCommand, envType)
-
-        value = ''
-
-        if mMeco.core.platformLib.Platform.isWindows():
-
-            value = 'Write-Host "{}" -NoNewline -ForegroundColor {};\n'.format(envEntry.value(), colorValue)
-
-        else:
-
-            value = 'printf "{}";\n'.format(colorValue.format(envEntry.value()))
-
-        self._getDisplayByEnvType(envType).append(value)
-        self._addNewLineDisplay(envType)
+        self._getDisplayByEnvType(envType).append(template.format(variable=envEntry.variable(), value=envEntry.value()))
 
     #
     ## @brief Add app display.
@@ -775,161 +1124,30 @@ class Response(mMeco.abstract.responseAbs.Response):
         colorColon    = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kColon, envType)
         colorValue    = self._allLib.settingsOperator().getTerminalDisplayColorByColorName(mMeco.libs.enumLib.ColorName.kSingleValue, envType)
 
-        if mMeco.core.platformLib.Platform.isWindows():
-            
-            if self._allLib.builder().reservedEnvEntryContainers():
-                value = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-                value = value.format('Reserved Packages ({})'.format(self._allLib.settingsOperator().projectNameInUse()).ljust(Response.PADDING_2),
-                                     colorVariable,
-                                     ':',
-                                     colorColon,
-                                     len(self._allLib.builder().reservedEnvEntryContainers()),
-                                     colorValue
-                                     )
-
-                display.append(value)
-                self._addNewLineDisplay(envType)
-
-            if self._allLib.builder().developmentEnvEntryContainers():
-                value = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-                value = value.format('Development Packages ({})'.format(self._allLib.settingsOperator().projectNameInUse()).ljust(Response.PADDING_2),
-                                     colorVariable,
-                                     ':',
-                                     colorColon,
-                                     len(self._allLib.builder().developmentEnvEntryContainers()),
-                                     colorValue
-                                     )
+        for layer in self._allLib.layerStack().layers():
 
-                display.append(value)
-                self._addNewLineDisplay(envType)
-
-            if self._allLib.builder().stageEnvEntryContainers():
-                value = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-                value = value.format('Stage Packages ({})'.format(self._allLib.settingsOperator().stage()).ljust(Response.PADDING_2),
-                                     colorVariable,
-                                     ':',
-                                     colorColon,
-                                     len(self._allLib.builder().stageEnvEntryContainers()),
-                                     colorValue
-                                     )
+            envEntryContainers = self._allLib.builder().getEnvEntryContainers(layer.name())
+            if not envEntryContainers:
+                continue
 
-                display.append(value)
-                self._addNewLineDisplay(envType)
+            variable = '{} Packages ({})'.format(layer.name(), layer.infoName()).ljust(Response.PADDING_2)
 
-            if self._allLib.builder().projectInternalEnvEntryContainers():
+            if mMeco.core.platformLib.Platform.isWindows():
                 value = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-                value = value.format('Project Internal Packages ({})'.format(self._allLib.settingsOperator().projectNameInUse()).ljust(Response.PADDING_2),
+                value = value.format(variable,
                                      colorVariable,
                                      ':',
                                      colorColon,
-                                     len(self._allLib.builder().projectInternalEnvEntryContainers()),
+                                     len(envEntryContainers),
                                      colorValue
                                      )
+            else:
+                value = 'printf "{}{} {}"\n'.format(colorVariable.format(variable),
+                                                    colorColon.format(':'),
+                                                    colorValue.format(len(envEntryContainers)))
 
-                display.append(value)
-                self._addNewLineDisplay(envType)
-
-            if self._allLib.builder().projectExternalEnvEntryContainers():
-                value = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-                value = value.format('Project External Packages ({})'.format(self._allLib.settingsOperator().projectNameInUse()).ljust(Response.PADDING_2),
-                                     colorVariable,
-                                     ':',
-                                     colorColon,
-                                     len(self._allLib.builder().projectExternalEnvEntryContainers()),
-                                     colorValue
-                                     )
-
-                display.append(value)
-                self._addNewLineDisplay(envType)
-
-            if self._allLib.builder().masterProjectInternalEnvEntryContainers():
-                value = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-                value = value.format('Master Project Internal Packages ({})'.format(self._allLib.settingsOperator().masterProjectName()).ljust(Response.PADDING_2),
-                                     colorVariable,
-                                     ':',
-                                     colorColon,
-                                     len(self._allLib.builder().masterProjectInternalEnvEntryContainers()),
-                                     colorValue
-                                     )
-
-                display.append(value)
-                self._addNewLineDisplay(envType)
-
-            if self._allLib.builder().masterProjectExternalEnvEntryContainers():
-                value = 'Write-Host "{}" -NoNewline -ForegroundColor {};Write-Host "{} " -NoNewline -ForegroundColor {};Write-Host "{}" -NoNewline -ForegroundColor {};\n'
-                value = value.format('Master Project External Packages ({})'.format(self._allLib.settingsOperator().masterProjectName()).ljust(Response.PADDING_2),
-                                     colorVariable,
-                                     ':',
-                                     colorColon,
-                                     len(self._allLib.builder().masterProjectExternalEnvEntryContainers()),
-                                     colorValue
-                                     )
-
-                display.append(value)
-                self._addNewLineDisplay(envType)
-
-        else:
-
-            if self._allLib.builder().reservedEnvEntryContainers():
-                display.append('printf "{}{} {}"\n'.format(colorVariable.format('Reserved Packages ({})' \
-                                                                                .format(self._allLib.settingsOperator().projectNameInUse()).ljust(Response.PADDING_2)),
-                                                           colorColon.format(':'),
-                                                           colorValue.format(len(self._allLib.builder().reservedEnvEntryContainers())))
-                               )
-                self._addNewLineDisplay(envType)
-
-            if self._allLib.builder().developmentEnvEntryContainers():
-                display.append('printf "{}{} {}"\n'.format(colorVariable.format('Development Packages ({})' \
-                                                                                .format(self._allLib.settingsOperator().projectNameInUse()).ljust(Response.PADDING_2)),
-                                                           colorColon.format(':'),
-                                                           colorValue.format(len(self._allLib.builder().developmentEnvEntryContainers())))
-                               )
-                self._addNewLineDisplay(envType)
-
-            if self._allLib.builder().stageEnvEntryContainers():
-                display.append('printf "{}{} {}"\n'.format(colorVariable.format('Stage Packages ({})' \
-                                                                                .format(self._allLib.request().stage()).ljust(Response.PADDING_2)),
-                                                           colorColon.format(':'),
-                                                           colorValue.format(len(self._allLib.builder().stageEnvEntryContainers())))
-                               )
-                self._addNewLineDisplay(envType)
-
-            #
-
-            if self._allLib.builder().projectInternalEnvEntryContainers():
-                display.append('printf "{}{} {}"\n'.format(colorVariable.format('Project Internal Packages ({})' \
-                                                                                .format(self._allLib.settingsOperator().projectNameInUse()).ljust(Response.PADDING_2)),
-                                                           colorColon.format(':'),
-                                                           colorValue.format(len(self._allLib.builder().projectInternalEnvEntryContainers())))
-                               )
-                self._addNewLineDisplay(envType)
-
-            if self._allLib.builder().projectExternalEnvEntryContainers():
-                display.append('printf "{}{} {}"\n'.format(colorVariable.format('Project External Packages ({})' \
-                                                                                .format(self._allLib.settingsOperator().projectNameInUse()).ljust(Response.PADDING_2)),
-                                                           colorColon.format(':'),
-                                                           colorValue.format(len(self._allLib.builder().projectExternalEnvEntryContainers())))
-                               )
-                self._addNewLineDisplay(envType)
-            #
-
-            if self._allLib.builder().masterProjectInternalEnvEntryContainers():
-                display.append('printf "{}{} {}"\n'.format(colorVariable.format('Master Project Internal Packages ({})' \
-                                                                                .format(self._allLib.settingsOperator().masterProjectName()).ljust(Response.PADDING_2)),
-                                                           colorColon.format(':'),
-                                                           colorValue.format(len(self._allLib.builder().masterProjectInternalEnvEntryContainers()))
-                                                           )
-                               )
-                self._addNewLineDisplay(envType)
-
-            if self._allLib.builder().masterProjectExternalEnvEntryContainers():
-                display.append('printf "{}{} {}"\n'.format(colorVariable.format('Master Project External Packages ({})' \
-                                                                                .format(self._allLib.settingsOperator().masterProjectName()).ljust(Response.PADDING_2)),
-                                                           colorColon.format(':'),
-                                                           colorValue.format(len(self._allLib.builder().masterProjectExternalEnvEntryContainers()))
-                                                           )
-                               )
-                self._addNewLineDisplay(envType)
+            display.append(value)
+            self._addNewLineDisplay(envType)
 
     #
     ## @brief Add product info display.
@@ -987,46 +1205,48 @@ class Response(mMeco.abstract.responseAbs.Response):
         if not envEntryContainer.entries():
             return
 
+        displayOnly = self._renderContext.displayOnly()
+        setOnly     = self._renderContext.setOnly()
+
         if not envType in [mMeco.libs.enumLib.EnvType.kPreBuild, mMeco.libs.enumLib.EnvType.kPostBuild]:
-            if not self._allLib.request().setOnly():
+            if not setOnly:
                 self._addContainerDisplay(envEntryContainer, envType)
 
         for entry in envEntryContainer.entries():
 
             if entry.envEntryType() == mMeco.libs.enumLib.EnvEntryType.kMulti:
 
-                if not self._allLib.request().displayOnly():
+                if not displayOnly:
                     self._addMultiEnv(entry, envType)
 
-                if not self._allLib.request().setOnly():
+                if not setOnly:
                     self._addMultiDisplay(entry, envType)
 
             elif entry.envEntryType() == mMeco.libs.enumLib.EnvEntryType.kSingle:
 
-                if not self._allLib.request().displayOnly():
+                if not displayOnly:
                     self._addSingleEnv(entry, envType)
 
-                if not self._allLib.request().setOnly():
+                if not setOnly:
                     self._addSingleDisplay(entry, envType)
 
             elif entry.envEntryType() == mMeco.libs.enumLib.EnvEntryType.kCommand:
 
-                if not self._allLib.request().displayOnly():
+                if not displayOnly:
                     self._addCommandEnv(entry, envType)
 
-                if not self._allLib.request().setOnly():
+                if not setOnly:
                     self._addCommandDisplay(entry, envType)
 
             elif entry.envEntryType() == mMeco.libs.enumLib.EnvEntryType.kScript:
 
-                if not self._allLib.request().displayOnly():
+                if not displayOnly:
                     self._addScriptEnv(entry, envType)
 
-                if not self._allLib.request().setOnly():
+                if not setOnly:
                     self._addScriptDisplay(entry, envType)
 
-        if self._allLib.request().verbose() != 1 and \
-           not self._allLib.request().setOnly():
+        if self._renderContext.verbose() != 1 and not setOnly:
             self._addNewLineDisplay(envType)
 
     #
@@ -1037,10 +1257,28 @@ class Response(mMeco.abstract.responseAbs.Response):
     #  @return bool - Result.
     def _respond(self):
 
-        # print(self._name)
+        self._renderContext = RenderContext()
 
         self._addScriptFileStartEnv()
 
+        try:
+            self._openSpools()
+            self._render()
+            self._write()
+        finally:
+            self._closeSpools()
+
+        self._writeManifest()
+
+        return True
+
+    #
+    ## @brief Render display and env members, each of them is streamed into the temporary files once rendered.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _render(self):
 
         # Pre
         if self._allLib.builder().preBuildEnvEntryContainers():
@@ -1051,71 +1289,23 @@ class Response(mMeco.abstract.responseAbs.Response):
             for envEntryContainer in self._allLib.builder().preBuildEnvEntryContainers():
                 self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kPreBuild)
 
-
-        # Reserved
-        if self._allLib.builder().reservedEnvEntryContainers():
-
-            if not self._allLib.request().setOnly():
-                self._addHeaderDisplay(mMeco.libs.enumLib.EnvType.kReserved)
-
-            for envEntryContainer in self._allLib.builder().reservedEnvEntryContainers():
-                self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kReserved)
+        self._spool(mMeco.libs.enumLib.EnvType.kPreBuild)
 
 
-        # Development
-        if self._allLib.builder().developmentEnvEntryContainers():
+        # Layers
+        for name in self._allLib.layerStack().names():
 
-            if not self._allLib.request().setOnly():
-                self._addHeaderDisplay(mMeco.libs.enumLib.EnvType.kDevelopment)
-
-            for envEntryContainer in self._allLib.builder().developmentEnvEntryContainers():
-                self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kDevelopment)
-
-
-        # Stage
-        if self._allLib.builder().stageEnvEntryContainers():
+            envEntryContainers = self._allLib.builder().getEnvEntryContainers(name)
+            if not envEntryContainers:
+                continue
 
             if not self._allLib.request().setOnly():
-                self._addHeaderDisplay(mMeco.libs.enumLib.EnvType.kStage)
+                self._addHeaderDisplay(name)
 
-            for envEntryContainer in self._allLib.builder().stageEnvEntryContainers():
-                self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kStage)
-
-
-        # Project
-        if self._allLib.builder().projectInternalEnvEntryContainers():
-
-            if not self._allLib.request().setOnly():
-                self._addHeaderDisplay(mMeco.libs.enumLib.EnvType.kProjectInternal)
+            for envEntryContainer in envEntryContainers:
+                self._addEntries(envEntryContainer, name)
 
-            for envEntryContainer in self._allLib.builder().projectInternalEnvEntryContainers():
-                self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kProjectInternal)
-
-        if self._allLib.builder().projectExternalEnvEntryContainers():
-
-            if not self._allLib.request().setOnly():
-                self._addHeaderDisplay(mMeco.libs.enumLib.EnvType.kProjectExternal)
-
-            for envEntryContainer in self._allLib.builder().projectExternalEnvEntryContainers():
-                self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kProjectExternal)
-
-
-        # Master
-        if self._allLib.builder().masterProjectInternalEnvEntryContainers():
-
-            if not self._allLib.request().setOnly():
-                self._addHeaderDisplay(mMeco.libs.enumLib.EnvType.kMasterProjectInternal)
-
-            for envEntryContainer in self._allLib.builder().masterProjectInternalEnvEntryContainers():
-                self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kMasterProjectInternal)
-
-        if self._allLib.builder().masterProjectExternalEnvEntryContainers():
-
-            if not self._allLib.request().setOnly():
-                self._addHeaderDisplay(mMeco.libs.enumLib.EnvType.kMasterProjectExternal)
-
-            for envEntryContainer in self._allLib.builder().masterProjectExternalEnvEntryContainers():
-                self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kMasterProjectExternal)
+            self._spool(name)
 
 
         # Post
@@ -1127,6 +1317,12 @@ class Response(mMeco.abstract.responseAbs.Response):
             for envEntryContainer in self._allLib.builder().postBuildEnvEntryContainers():
                 self._addEntries(envEntryContainer, mMeco.libs.enumLib.EnvType.kPostBuild)
 
+        # Env buffers are written in the order they are built, pending multi envs of the layers are written into
+        # post build env so that app is executed in the final env
+        self._flushMultiEnvs(mMeco.libs.enumLib.EnvType.kPostBuild)
+
+        self._spool(mMeco.libs.enumLib.EnvType.kPostBuild)
+
 
         # App
         if self._allLib.settingsOperator().appFilePath():
@@ -1138,22 +1334,133 @@ class Response(mMeco.abstract.responseAbs.Response):
             if not self._allLib.request().displayOnly():
                 self._addAppEnv(mMeco.libs.enumLib.EnvType.kEnv)
 
+        self._spool(mMeco.libs.enumLib.EnvType.kEnv)
+
 
         # Info
         if not self._allLib.request().setOnly():
             self._addHeaderDisplay(mMeco.libs.enumLib.EnvType.kInfo)
             self._addInfoDisplay(mMeco.libs.enumLib.EnvType.kInfo)
 
+        self._spool(mMeco.libs.enumLib.EnvType.kInfo)
+
 
         # Product Info
         if not self._allLib.request().setOnly():
             self._addHeaderDisplay(mMeco.libs.enumLib.EnvType.kProductInfo)
             self._addProductInfoDisplay(mMeco.libs.enumLib.EnvType.kProductInfo)
 
+        self._spool(mMeco.libs.enumLib.EnvType.kProductInfo)
+
         #
 
         self._addScriptFileEndEnv()
 
-        self._write()
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether given value references a variable, such as `$PATH`, `$env:PATH` or `%PATH%`.
+    #
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def hasReference(value):
+
+        return '$' in value or '%' in value
 
-        return True
+    #
+    ## @brief Get hash of the content of given file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file.
+    #
+    #  @exception N/A
+    #
+    #  @return str - SHA1 hash.
+    @staticmethod
+    def getContentHash(path):
+
+        contentHash = hashlib.sha1()
+
+        with open(path, 'rb') as _file:
+            for chunk in iter(lambda: _file.read(65536), b''):
+                contentHash.update(chunk)
+
+        return contentHash.hexdigest()
+
+    #
+    ## @brief Remove the files in given script store, which haven't been modified for given number of seconds.
+    #
+    #  Script files linking to a removed stored script file are resolved again by their next invocation.
+    #
+    #  @param storePath [ str         | None | in  ] - Absolute path of the script store.
+    #  @param maxAge    [ float       | None | in  ] - Number of seconds.
+    #  @param exclude   [ list of str | None | in  ] - Absolute paths of the files to keep regardless of their age.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the removed files.
+    @staticmethod
+    def pruneStore(storePath, maxAge, exclude=None):
+
+        removed     = []
+        expiryTime  = time.time() - maxAge
+
+        for fileName in os.listdir(storePath):
+
+            path = os.path.join(storePath, fileName)
+            if exclude and path in exclude:
+                continue
+
+            try:
+                if os.path.isfile(path) and os.path.getmtime(path) < expiryTime:
+                    os.remove(path)
+                    removed.append(path)
+            except OSError:
+                # Removed by a concurrent invocation
+                continue
+
+        return removed
+
+    #
+    ## @brief Point given script file path to given stored script file atomically.
+    #
+    #  A symbolic link is created where it is supported, otherwise the script file sources the stored script file.
+    #
+    #  @param storeFilePath  [ str | None | in  ] - Absolute path of the stored script file.
+    #  @param scriptFilePath [ str | None | in  ] - Absolute path of the script file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def link(storeFilePath, scriptFilePath):
+
+        path = os.path.dirname(scriptFilePath)
+        if not os.path.isdir(path):
+            try:
+                os.makedirs(path)
+            except OSError:
+                if not os.path.isdir(path):
+                    raise
+
+        if hasattr(os, 'symlink') and not mMeco.core.platformLib.Platform.isWindows():
+
+            temporaryPath = os.path.join(path, '.{}.{}'.format(os.path.basename(scriptFilePath), uuid.uuid4().hex))
+
+            try:
+                os.symlink(storeFilePath, temporaryPath)
+                mMeco.fileSystem.fileLib.File.replace(temporaryPath, scriptFilePath)
+                return
+            except OSError:
+                if os.path.lexists(temporaryPath):
+                    os.remove(temporaryPath)
+
+        if mMeco.core.platformLib.Platform.isWindows():
+            mMeco.fileSystem.fileLib.File.writeAtomically(scriptFilePath, '. "{}";\n'.format(storeFilePath))
+        else:
+            mMeco.fileSystem.fileLib.File.writeAtomically(scriptFilePath, 'source "{}";\n'.format(storeFilePath))
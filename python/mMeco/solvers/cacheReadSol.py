@@ -25,8 +25,6 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
-from    sys import stdout
-
 import  mMeco.abstract.solverAbs
 
 
@@ -65,11 +63,17 @@ class Solver(mMeco.abstract.solverAbs.Solver):
     #
     ## @brief Solve.
     #
-    #  @exception N/A
+    #  Packages of the env paths are set from the cache file, env paths aren't listed.
+    #
+    #  @exception IOError    - If cache file doesn't exist.
+    #  @exception ValueError - If cache file is not compatible with this version of meco.
     #
     #  @return bool - Result.
     def _solve(self):
 
-        stdout.write('Solver: {}\n'.format(self.NAME))
+        cache = self._allLib.cache()
+
+        for envPath in self._envPaths:
+            envPath.setPackages(cache.getPackages(envPath.envType()) or [])
 
         return True
\ No newline at end of file
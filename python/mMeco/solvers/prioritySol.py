@@ -25,8 +25,14 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import mMeco.core.threadPoolLib
+
+import mMeco.fileSystem.versionLib
+
 import mMeco.abstract.solverAbs
 
+import mMeco.libs.enumLib
+
 
 #
 #-----------------------------------------------------------------------------------------------------
@@ -68,87 +74,28 @@ class Solver(mMeco.abstract.solverAbs.Solver):
     #  @return bool - Result.
     def _solve(self):
 
-        # List packages
-        if self._reservedEnvPath:
-            self._reservedEnvPath.listPackages(invokeShouldInitializePackageCallback=True)
-
-        if self._developmentEnvPath:
-            self._developmentEnvPath.listPackages(invokeShouldInitializePackageCallback=True)
-
-        if self._stageEnvPath:
-            self._stageEnvPath.listPackages(invokeShouldInitializePackageCallback=True)
-
-        if self._projectInternalEnvPath:
-            self._projectInternalEnvPath.listPackages(invokeShouldInitializePackageCallback=True)
-
-        if self._projectExternalEnvPath:
-            self._projectExternalEnvPath.listPackages(invokeShouldInitializePackageCallback=True)
-
-        if self._masterProjectInternalEnvPath:
-            self._masterProjectInternalEnvPath.listPackages(invokeShouldInitializePackageCallback=True)
-
-        if self._masterProjectExternalEnvPath:
-            self._masterProjectExternalEnvPath.listPackages(invokeShouldInitializePackageCallback=True)
-
-
-        # Remove Internal
-        if self._masterProjectInternalEnvPath and self._projectInternalEnvPath:
-            Solver.removeVersionedPackagesFromVersionedPackages(self._masterProjectInternalEnvPath.packages(),
-                                                                self._projectInternalEnvPath.packages())
-
-        #
-
-        if self._projectInternalEnvPath and self._developmentEnvPath:
-            Solver.removeNonVersionedPackagesFromVersionedPackages(self._projectInternalEnvPath.packages(),
-                                                                   self._developmentEnvPath.packages())
+        # List packages, env paths are independent directory trees, therefore they are listed concurrently.
+        # Only the last version of versioned packages is used, therefore versions can be probed from the newest
+        # downward, see mMeco.libs.envPathLib.EnvPath.listPackages
+        newestVersionOnly = self._allLib.settingsOperator().newestVersionOnly()
 
-        if self._masterProjectInternalEnvPath and self._developmentEnvPath:
-            Solver.removeNonVersionedPackagesFromVersionedPackages(self._masterProjectInternalEnvPath.packages(),
-                                                                   self._developmentEnvPath.packages())
+        mMeco.core.threadPoolLib.mapInOrder(lambda x: x.listPackages(invokeShouldInitializePackageCallback=True,
+                                                                     newestVersionOnly=newestVersionOnly),
+                                            self._envPaths,
+                                            self._allLib.settingsOperator().scanMaxWorkers())
 
-        #
-        
-        if self._projectInternalEnvPath and self._stageEnvPath:
-            Solver.removeNonVersionedPackagesFromVersionedPackages(self._projectInternalEnvPath.packages(),
-                                                                   self._stageEnvPath.packages())
 
-        if self._masterProjectInternalEnvPath and self._stageEnvPath:
-            Solver.removeNonVersionedPackagesFromVersionedPackages(self._masterProjectInternalEnvPath.packages(),
-                                                                   self._stageEnvPath.packages())
+        # Remove packages overridden by the layers with higher precedence, see mMeco.libs.layerLib.LayerStack.addDefaultLayers
+        # for the default layers
+        resolvedPackages = self._allLib.layerStack().resolve(dict([(x.envType(), x.packages()) for x in self._envPaths]))
 
-        # Remove External
-        if self._masterProjectExternalEnvPath and self._projectExternalEnvPath:
-            Solver.removeVersionedPackagesFromVersionedPackages(self._masterProjectExternalEnvPath.packages(),
-                                                                self._projectExternalEnvPath.packages())
+        for envPath in self._envPaths:
 
-        #
+            envPath.setPackages(resolvedPackages[envPath.envType()])
 
-        if self._projectExternalEnvPath and self._developmentEnvPath:
-            Solver.removeNonVersionedPackagesFromVersionedPackages(self._projectExternalEnvPath.packages(),
-                                                                   self._developmentEnvPath.packages())
-
-        if self._masterProjectExternalEnvPath and self._developmentEnvPath:
-            Solver.removeNonVersionedPackagesFromVersionedPackages(self._masterProjectExternalEnvPath.packages(),
-                                                                   self._developmentEnvPath.packages())
-
-        #
-        
-        if self._projectExternalEnvPath and self._stageEnvPath:
-            Solver.removeNonVersionedPackagesFromVersionedPackages(self._projectExternalEnvPath.packages(),
-                                                                   self._stageEnvPath.packages())
-
-        if self._masterProjectExternalEnvPath and self._stageEnvPath:
-            Solver.removeNonVersionedPackagesFromVersionedPackages(self._masterProjectExternalEnvPath.packages(),
-                                                                   self._stageEnvPath.packages())
-
-        if self._projectInternalEnvPath:
-            Solver.setLastVersionOfThePackageToBeUsed(self._projectInternalEnvPath.packages())
-
-        if self._projectExternalEnvPath:
-            Solver.setLastVersionOfThePackageToBeUsed(self._projectExternalEnvPath.packages())
-
-        Solver.setLastVersionOfThePackageToBeUsed(self._masterProjectInternalEnvPath.packages())
-        Solver.setLastVersionOfThePackageToBeUsed(self._masterProjectExternalEnvPath.packages())
+            if envPath.envPackageType() == mMeco.libs.enumLib.EnvPackageType.kVersioned:
+                Solver.setLastVersionOfThePackageToBeUsed(envPath.packages(),
+                                                          self._allLib.settingsOperator().getNewestVersionSortKey())
 
     #
     # ------------------------------------------------------------------------------------------------
@@ -157,13 +104,16 @@ class Solver(mMeco.abstract.solverAbs.Solver):
     #
     ## @brief Set latest version of the packages to be used by removing other versions from the version list.
     #
-    #  @param packages [ list | None | in  ] - Versioned package list.
+    #  Pre-release versions are used only if a package has no release version, unless `sortKey` is provided.
+    #
+    #  @param packages [ list     | None | in  ] - Versioned package list.
+    #  @param sortKey  [ function | None | in  ] - Sort key function, mMeco.fileSystem.versionLib.SemanticVersion.getReleaseSortKey is used if not provided.
     #
     #  @exception N/A
     #
     #  @return None - None.
     @staticmethod
-    def setLastVersionOfThePackageToBeUsed(packages):
+    def setLastVersionOfThePackageToBeUsed(packages, sortKey=None):
 
         if not packages:
             return
@@ -171,8 +121,12 @@ class Solver(mMeco.abstract.solverAbs.Solver):
         if not isinstance(packages[0], dict):
             return
 
+        if not sortKey:
+            sortKey = mMeco.fileSystem.versionLib.SemanticVersion.getReleaseSortKey
+
         for package in packages:
-            package['versions'] = package['versions'][-1:]
+            if package['versions']:
+                package['versions'] = [max(package['versions'], key=sortKey)]
 
     #
     ## @brief Remove `versionedPackagesB` from `versionedPackagesA`.
@@ -189,13 +143,9 @@ class Solver(mMeco.abstract.solverAbs.Solver):
         if not versionedPackagesA or not versionedPackagesB:
             return
 
-        for pa in versionedPackagesB:
-
-            for pb in versionedPackagesA:
+        packageNames = set([x['package'] for x in versionedPackagesB])
 
-                if pa['package'] == pb['package']:
-
-                    versionedPackagesA.pop(versionedPackagesA.index(pb))
+        versionedPackagesA[:] = [x for x in versionedPackagesA if x['package'] not in packageNames]
 
     #
     ## @brief Remove `nonVersionedPackages` from `versionedPackages`.
@@ -212,10 +162,6 @@ class Solver(mMeco.abstract.solverAbs.Solver):
         if not nonVersionedPackages or not versionedPackages:
             return
 
-        for nvp in nonVersionedPackages:
-
-            for vp in versionedPackages:
-
-                if nvp == vp['package']:
+        packageNames = set(nonVersionedPackages)
 
-                    versionedPackages.pop(versionedPackages.index(vp))
+        versionedPackages[:] = [x for x in versionedPackages if x['package'] not in packageNames]
@@ -0,0 +1,329 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/fixtureLib.py @brief [ FILE   ] - Test fixture.
+## @package tests.fixtureLib    @brief [ MODULE ] - Test fixture.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  shutil
+import  subprocess
+import  sys
+import  tempfile
+import  unittest
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Absolute path of the directory, which contains mMeco package.
+PYTHON_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+## [ str ] - Settings module written into the fixture, `{root}` is replaced with the root of the fixture.
+SETTINGS_MODULE = '''import os
+ROOT = {root!r}
+MASTER_PROJECT_NAME = 'master'
+def getLogFilePath(project, developer, development, stage, platform):
+    return os.path.join(ROOT, 'out', 'meco.log')
+def getReservedPackagesPath(developer, platform):
+    return os.path.join(ROOT, 'reserved')
+def getDevelopmentPackagesPath(project, developer, development, platform, create=False):
+    return os.path.join(ROOT, 'development', str(development))
+def getStagePackagesPath(project, developer, stage, platform):
+    return os.path.join(ROOT, 'stage', str(stage))
+def getProjectInternalPackagesPath(project, platform):
+    return os.path.join(ROOT, 'projects', project, 'internal')
+def getProjectExternalPackagesPath(project, platform):
+    return os.path.join(ROOT, 'projects', project, 'external')
+def getMasterProjectInternalPackagesPath(platform):
+    return os.path.join(ROOT, 'master', 'internal')
+def getMasterProjectExternalPackagesPath(platform):
+    return os.path.join(ROOT, 'master', 'external')
+def getAppFilePath(project, developer, development, stage, platform, app):
+    return os.path.join(ROOT, 'apps', app + '.json')
+def getScriptFilePath(project, developer, development, stage, platform, appFile):
+    return os.path.join(ROOT, 'out', '{{}}_{{}}_{{}}.sh'.format(project, development, stage))
+def getTerminalHeaderDisplayColors(platform):
+    return ['{{}}', '{{}}']
+def getTerminalDisplayColors(platform):
+    names = ['packageVariable', 'packageValue', 'multiVariable', 'multiValue', 'singleVariable', 'singleValue',
+             'script', 'command', 'colon', 'arrow']
+    envs  = ['pre-build', 'reserved', 'development', 'stage', 'project-internal', 'project-external',
+             'master-project-internal', 'master-project-external', 'env', 'info', 'product-info', 'post-build']
+    return dict([(x, dict([(y, '{{}}') for y in names])) for x in envs])
+'''
+
+## [ str ] - Callback module written into the fixture.
+CALLBACK_MODULE = '''def getPreBuild(allLib, envEntryContainer):
+    envEntryContainer.addSingle('MECO_ES_VERSION', '1')
+def getPostBuild(allLib, envEntryContainer):
+    pass
+def shouldInitializePackage(allLib, path):
+    return True
+def getAppExecutableFlags(allLib):
+    return ''
+'''
+
+## [ str ] - Package global env module written into the fixture.
+PACKAGE_GLOBAL_ENV_MODULE = '''class PackageLinux(object):
+    PATH = ['bin']
+    PYTHONPATH = ['python']
+class PackageDarwin(PackageLinux):
+    pass
+'''
+
+## [ str ] - Env variables module written into the fixture.
+ENV_VARIABLES_MODULE = '''MECO_PROJECT_NAME = 'MECO_PROJECT_NAME'
+MECO_DEVELOPMENT_ENV_NAME = 'MECO_DEVELOPMENT_ENV_NAME'
+MECO_DEVELOPER_NAME = 'MECO_DEVELOPER_NAME'
+'''
+
+## [ str ] - Code, which resolves the env in a new process, since mMeco.libs.allLib.All is a singleton.
+RUNNER = '''import sys
+import mMeco.mecoLib
+meco = mMeco.mecoLib.Meco(' '.join(sys.argv[1:]))
+sys.stdout.write('RESULT {}\\n'.format(meco.writeFile()))
+'''
+
+#
+## @brief [ CLASS ] - Test fixture, which contains settings modules and env paths in a temporary directory.
+class Fixture(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param settings [ str | '' | in  ] - Code appended to the settings module.
+    #  @param callback [ str | '' | in  ] - Code appended to the callback module.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, settings='', callback=''):
+
+        ## [ str ] - Root of the fixture.
+        self._root = os.path.realpath(tempfile.mkdtemp(prefix='mMecoTest'))
+
+        for path in ['out', 'apps', 'reserved', 'master/internal', 'master/external',
+                     'projects/p1/internal', 'projects/p1/external']:
+            os.makedirs(os.path.join(self._root, path))
+
+        self.write('settings/mMecoSettings/__init__.py', '')
+        self.write('settings/mMecoSettings/settingsLib.py', SETTINGS_MODULE.format(root=self._root) + settings)
+        self.write('settings/mMecoSettings/callbackLib.py', CALLBACK_MODULE + callback)
+        self.write('settings/mMecoSettings/packageGlobalEnvLib.py', PACKAGE_GLOBAL_ENV_MODULE)
+        self.write('settings/mMecoSettings/envVariablesLib.py', ENV_VARIABLES_MODULE)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value.
+    def root(self):
+
+        return self._root
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write a file in the fixture.
+    #
+    #  @param path    [ str | None | in  ] - Path relative to the root of the fixture.
+    #  @param content [ str | None | in  ] - Content.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the file.
+    def write(self, path, content):
+
+        path = os.path.join(self._root, path)
+
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+
+        with open(path, 'w') as _file:
+            _file.write(content)
+
+        return path
+
+    #
+    ## @brief Add a package.
+    #
+    #  @param envPath    [ str | None | in  ] - Env path relative to the root of the fixture.
+    #  @param name       [ str | None | in  ] - Name of the package.
+    #  @param version    [ str | None | in  ] - Version of the package, if the package is versioned.
+    #  @param packageEnv [ str | None | in  ] - Body of `setEnvironment` function of the package env module.
+    #  @param info       [ bool | True | in ] - Whether to write package info module.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the root of the package.
+    def addPackage(self, envPath, name, version=None, packageEnv=None, info=True):
+
+        path = os.path.join(envPath, name, version, name) if version else os.path.join(envPath, name)
+
+        os.makedirs(os.path.join(self._root, path, 'bin'))
+        self.write(os.path.join(path, 'python', name, '__init__.py'), '')
+
+        if info:
+            self.write(os.path.join(path, 'python', name, 'packageInfoLib.py'), '')
+
+        if packageEnv:
+            self.write(os.path.join(path, 'python', name, 'packageEnvLib.py'),
+                       'def setEnvironment(allLib, envEntryContainer):\n{}\n    return True\n'.format(packageEnv))
+
+        return os.path.join(self._root, path)
+
+    #
+    ## @brief Resolve the env in a new process.
+    #
+    #  @param arguments  [ str | None        | in  ] - Arguments of the request.
+    #  @param runner     [ str | RUNNER      | in  ] - Code, which resolves the env.
+    #  @param pythonPath [ str | PYTHON_PATH | in  ] - Absolute path of the directory, which contains mMeco package.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Return code and output of the process.
+    def run(self, arguments, runner=RUNNER, pythonPath=PYTHON_PATH):
+
+        env = os.environ.copy()
+        env['PYTHONPATH'] = os.pathsep.join([os.path.join(self._root, 'settings'), pythonPath])
+
+        process = subprocess.Popen([sys.executable, '-c', runner] + arguments.split(),
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT,
+                                   cwd=self._root,
+                                   env=env)
+
+        output = process.communicate()[0].decode('utf-8')
+
+        return process.returncode, output
+
+    #
+    ## @brief Read the log file.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Content of the log file.
+    def log(self):
+
+        return self.read('out/meco.log')
+
+    #
+    ## @brief Read a file in the fixture.
+    #
+    #  @param path [ str | None | in  ] - Path relative to the root of the fixture.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Content.
+    def read(self, path):
+
+        with open(os.path.join(self._root, path), 'r') as _file:
+            return _file.read()
+
+    #
+    ## @brief Source given script file in bash and get the resulting env.
+    #
+    #  @param path [ str | None | in  ] - Path of the script file relative to the root of the fixture.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Env.
+    def source(self, path):
+
+        output = subprocess.check_output(['bash', '-c', 'source "{}" >/dev/null 2>&1; env -0'.format(os.path.join(self._root, path))],
+                                         env={'PATH': '/usr/bin:/bin', 'HOME': self._root})
+
+        return dict([x.split('=', 1) for x in output.decode('utf-8').split('\0') if '=' in x])
+
+    #
+    ## @brief Remove the fixture.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def remove(self):
+
+        shutil.rmtree(self._root, ignore_errors=True)
+
+#
+## @brief [ CLASS ] - Test case, which resolves envs in a fixture.
+@unittest.skipIf(sys.platform.startswith('win'), 'Fixture writes bash script files.')
+class FixtureTestCase(unittest.TestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self.fixture = Fixture(**self.getFixtureArguments())
+
+    #
+    ## @brief Tear down.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        self.fixture.remove()
+
+    #
+    ## @brief Get arguments of tests.fixtureLib.Fixture class, override to customize the settings.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Arguments.
+    def getFixtureArguments(self):
+
+        return {}
+
+    #
+    ## @brief Resolve the env and assert that it succeeds.
+    #
+    #  @param arguments [ str | '-p p1' | in  ] - Arguments of the request.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Output of the process.
+    def resolve(self, arguments='-p p1'):
+
+        returnCode, output = self.fixture.run(arguments)
+
+        self.assertEqual(returnCode, 0, output)
+        self.assertIn('RESULT /', output, output)
+
+        return output
@@ -0,0 +1,136 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_cacheLib.py @brief [ FILE   ] - Tests of mMeco.libs.cacheLib module.
+## @package tests.test_cacheLib    @brief [ MODULE ] - Tests of mMeco.libs.cacheLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  json
+import  os
+import  shutil
+import  unittest
+
+import  mMeco.libs.cacheLib
+import  mMeco.libs.enumLib
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.libs.cacheLib.Cache class.
+class CacheTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        tests.fixtureLib.FixtureTestCase.setUp(self)
+
+        ## [ str ] - Absolute path of the file, which a character is appended into each time a package env module is invoked.
+        self.invocationFilePath = os.path.join(self.fixture.root(), 'out', 'invocations')
+
+        ## [ str ] - Absolute path of the cache file.
+        self.cacheFilePath      = os.path.join(self.fixture.root(), 'out', 'p1_None_None.cache')
+
+        self.fixture.addPackage('reserved', 'alpha',
+                                packageEnv='    open({!r}, \'a\').write(\'x\')\n'
+                                           '    envEntryContainer.addSingle(\'ALPHA\', \'1\')'.format(self.invocationFilePath))
+
+        self.fixture.addPackage('master/internal', 'zeta', '1.0.0',
+                                packageEnv='    open({!r}, \'a\').write(\'x\')\n'
+                                           '    envEntryContainer.addMulti(\'ZETA_PATH\', \'zeta\')'.format(self.invocationFilePath))
+
+    #
+    ## @brief Get number of the invocations of the package env modules.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of the invocations.
+    def getInvocationCount(self):
+
+        with open(self.invocationFilePath, 'r') as _file:
+            return len(_file.read())
+
+    #
+    ## @brief Test that `--cache-write` writes the solved packages and built env entry containers along with the same script file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testWrite(self):
+
+        self.resolve('-p p1 -ic')
+
+        script = self.fixture.read('out/p1_None_None.sh')
+
+        self.assertFalse(os.path.isfile(self.cacheFilePath))
+
+        self.resolve('-p p1 -ic -cw')
+
+        self.assertEqual(self.fixture.read('out/p1_None_None.sh'), script)
+
+        data = json.loads(self.fixture.read(self.cacheFilePath))
+
+        self.assertEqual(data['version'], mMeco.libs.cacheLib.Cache.VERSION)
+        self.assertEqual(data['packages'][mMeco.libs.enumLib.EnvType.kReserved], ['alpha'])
+        self.assertEqual([(x['package'], x['versions']) for x in data['packages'][mMeco.libs.enumLib.EnvType.kMasterProjectInternal]],
+                         [('zeta', ['1.0.0'])])
+        self.assertEqual([x['packageName'] for x in data['envEntryContainers'][mMeco.libs.enumLib.EnvType.kReserved]],
+                         ['alpha'])
+        self.assertEqual([x['packageName'] for x in data['envEntryContainers'][mMeco.libs.enumLib.EnvType.kMasterProjectInternal]],
+                         ['zeta'])
+
+    #
+    ## @brief Test that `--cache-read` writes the same script file from the cache file without the packages.
+    #
+    #  Packages are removed after the cache file is written, so that any access to them would change the env.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testRead(self):
+
+        self.resolve('-p p1 -ic -cw')
+
+        script = self.fixture.read('out/p1_None_None.sh')
+
+        os.remove(os.path.join(self.fixture.root(), 'out', 'p1_None_None.sh'))
+
+        for path in ['reserved/alpha', 'master/internal/zeta']:
+            shutil.rmtree(os.path.join(self.fixture.root(), path))
+
+        self.resolve('-p p1 -cr')
+
+        self.assertEqual(self.fixture.read('out/p1_None_None.sh'), script)
+        self.assertEqual(self.getInvocationCount(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_callbackOpt.py @brief [ FILE   ] - Tests of mMeco.operators.callbackOpt module.
+## @package tests.test_callbackOpt    @brief [ MODULE ] - Tests of mMeco.operators.callbackOpt module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  unittest
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of `shouldInitializePackages` function of the callback module.
+#
+#  Each invocation of the callback function is written into `out/calls` file in the fixture as the number of
+#  the paths it's invoked with.
+class ShouldInitializePackagesTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Get arguments of tests.fixtureLib.Fixture class.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Arguments.
+    def getFixtureArguments(self):
+
+        return {'callback':'def shouldInitializePackage(allLib, path):\n'
+                           '    raise RuntimeError(\'Batch function must be invoked instead.\')\n'
+                           'def shouldInitializePackages(allLib, paths):\n'
+                           '    open(\'out/calls\', \'a\').write(\'{}\\n\'.format(len(paths)))\n'
+                           '    return [x for x in paths if not x.endswith(\'beta\')]\n'}
+
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        tests.fixtureLib.FixtureTestCase.setUp(self)
+
+        for name in ['alpha', 'beta']:
+            self.fixture.addPackage('reserved', name,
+                                    packageEnv='    envEntryContainer.addSingle(\'{}\', \'1\')'.format(name.upper()))
+
+        for name in ['gamma', 'delta']:
+            self.fixture.addPackage('master/internal', name, '1.0.0',
+                                    packageEnv='    envEntryContainer.addSingle(\'{}\', \'1\')'.format(name.upper()))
+
+    #
+    ## @brief Test that packages are filtered by the callback module.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testFilter(self):
+
+        self.resolve('-p p1 -ic')
+
+        env = self.fixture.source('out/p1_None_None.sh')
+
+        for name in ['ALPHA', 'GAMMA', 'DELTA']:
+            self.assertEqual(env.get(name), '1', name)
+
+        self.assertNotIn('BETA', env)
+
+    #
+    ## @brief Test that the callback function is invoked once for each env path, which has packages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testCalls(self):
+
+        self.resolve('-p p1 -ic')
+
+        self.assertEqual(sorted(self.fixture.read('out/calls').split()), ['2', '2'])
+
+#
+## @brief [ CLASS ] - Tests of `shouldInitializePackage` function of the callback module, which is invoked for each path
+#  if the callback module doesn't have `shouldInitializePackages` function.
+class ShouldInitializePackageTest(ShouldInitializePackagesTest):
+    #
+    ## @brief Get arguments of tests.fixtureLib.Fixture class.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Arguments.
+    def getFixtureArguments(self):
+
+        return {'callback':'def shouldInitializePackage(allLib, path):\n'
+                           '    open(\'out/calls\', \'a\').write(\'1\\n\')\n'
+                           '    return not path.endswith(\'beta\')\n'}
+
+    #
+    ## @brief Test that the callback function is invoked for each package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testCalls(self):
+
+        self.resolve('-p p1 -ic')
+
+        self.assertEqual(self.fixture.read('out/calls').split(), ['1', '1', '1', '1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_dataRes.py @brief [ FILE   ] - Tests of mMeco.responses.dataRes module.
+## @package tests.test_dataRes    @brief [ MODULE ] - Tests of mMeco.responses.dataRes module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  json
+import  os
+import  unittest
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of data files.
+class DataFileTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Resolve the env in env data format and read the data file.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Env.
+    def resolveEnv(self):
+
+        self.resolve('-p p1 -df env')
+
+        return dict(x.split('=', 1) for x in self.fixture.read('out/p1_None_None.env').split('\0') if x)
+
+    #
+    ## @brief Test that references to variables are expanded in env data format.
+    #
+    #  Entries of a package are sorted by their variables, therefore `SAVED_PATH` is added after `MY_PATH`.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testEnvExpandsReferences(self):
+
+        self.fixture.addPackage('reserved', 'alpha', packageEnv='    envEntryContainer.addMulti(\'MY_PATH\', \'/a\')\n'
+                                                               '    envEntryContainer.addSingle(\'SAVED_PATH\', \'$MY_PATH\')\n'
+                                                               '    envEntryContainer.addSingle(\'VERSION_COPY\', \'${MECO_ES_VERSION}-$MY_UNSET\')\n'
+                                                               '    envEntryContainer.addSingle(\'HOME_COPY\', \'$HOME\')\n'
+                                                               '    envEntryContainer.addMulti(\'MY_PATH\', \'/b\')')
+
+        env = self.resolveEnv()
+
+        self.assertEqual(env['MY_PATH'], '/b:/a')
+        self.assertEqual(env['SAVED_PATH'], '/b:/a')
+        self.assertEqual(env['VERSION_COPY'], '1-')
+        self.assertEqual(env['HOME_COPY'], os.environ.get('HOME', ''))
+
+    #
+    ## @brief Test that a reference to a variable is expanded with the values added before it.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testEnvExpandsInEntryOrder(self):
+
+        self.fixture.addPackage('reserved', 'alpha', packageEnv='    envEntryContainer.addMulti(\'MY_A\', \'1\')')
+        self.fixture.addPackage('reserved', 'beta' , packageEnv='    envEntryContainer.addMulti(\'MY_B\', \'$MY_A\')')
+        self.fixture.addPackage('reserved', 'gamma', packageEnv='    envEntryContainer.addMulti(\'MY_A\', \'2\')')
+
+        env = self.resolveEnv()
+
+        self.assertEqual(env['MY_A'], '2:1')
+        self.assertEqual(env['MY_B'], '1')
+
+    #
+    ## @brief Test that values referencing variables are marked in JSON data format.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testJsonHasReference(self):
+
+        self.fixture.addPackage('reserved', 'alpha', packageEnv='    envEntryContainer.addMulti(\'MY_PATH\', \'/a\')\n'
+                                                               '    envEntryContainer.addSingle(\'SAVED_PATH\', \'$MY_PATH\')')
+
+        self.resolve('-p p1 -df json')
+
+        variables = dict((x['name'], x) for x in json.loads(self.fixture.read('out/p1_None_None.json'))['variables'])
+
+        self.assertEqual(variables['SAVED_PATH']['base']['value'], '$MY_PATH')
+        self.assertTrue(variables['SAVED_PATH']['base']['hasReference'])
+        self.assertFalse(variables['MY_PATH']['values'][0]['hasReference'])
+
+
+if __name__ == '__main__':
+    unittest.main()
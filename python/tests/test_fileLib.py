@@ -0,0 +1,150 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_fileLib.py @brief [ FILE   ] - Tests of mMeco.fileSystem.fileLib module.
+## @package tests.test_fileLib    @brief [ MODULE ] - Tests of mMeco.fileSystem.fileLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  shutil
+import  stat
+import  subprocess
+import  sys
+import  tempfile
+import  threading
+import  unittest
+
+import  mMeco.fileSystem.fileLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.fileSystem.fileLib.File class.
+class FileTest(unittest.TestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self.root = tempfile.mkdtemp(prefix='mMecoTest')
+
+    #
+    ## @brief Tear down.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    #
+    ## @brief Test that files are written atomically with default permissions from many threads.
+    #
+    #  Umask of the process is process wide, therefore the files must be written without setting it.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testWriteAtomicallyThreaded(self):
+
+        errors = []
+
+        def umask(mask):
+            raise AssertionError('Umask has been set to {:o}.'.format(mask))
+
+        def write(index):
+            try:
+                for count in range(25):
+                    mMeco.fileSystem.fileLib.File.writeAtomically(os.path.join(self.root, 'shared.txt'), 'content\n' * 100)
+                    mMeco.fileSystem.fileLib.File.writeAtomically(os.path.join(self.root, '{}_{}.txt'.format(index, count)),
+                                                                  '{} {}\n'.format(index, count))
+            except BaseException as error:
+                errors.append(error)
+
+        mMeco.fileSystem.fileLib.File.getUmask()
+
+        originalUmask = os.umask
+        os.umask = umask
+        try:
+            threads = [threading.Thread(target=write, args=(x,)) for x in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            os.umask = originalUmask
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(os.listdir(self.root)), 8 * 25 + 1)
+
+        for fileName in os.listdir(self.root):
+            path = os.path.join(self.root, fileName)
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o666 & ~mMeco.fileSystem.fileLib.File.getUmask())
+
+        with open(os.path.join(self.root, 'shared.txt')) as _file:
+            self.assertEqual(_file.read(), 'content\n' * 100)
+
+        with open(os.path.join(self.root, '7_24.txt')) as _file:
+            self.assertEqual(_file.read(), '7 24\n')
+
+    #
+    ## @brief Test that umask of the process is read once and it isn't set when the module is imported.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testGetUmask(self):
+
+        runner = ('import os\n'
+                  'def umask(mask):\n'
+                  '    raise AssertionError(\'Umask has been set.\')\n'
+                  'os.umask = umask\n'
+                  'import mMeco.fileSystem.fileLib\n')
+
+        process = subprocess.Popen([sys.executable, '-c', runner],
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT,
+                                   cwd=os.path.join(os.path.dirname(__file__), '..'))
+
+        output = process.communicate()[0].decode('utf-8')
+
+        self.assertEqual(process.returncode, 0, output)
+
+        umask = os.umask(0)
+        os.umask(umask)
+
+        mMeco.fileSystem.fileLib.File.UMASK = None
+
+        self.assertEqual(mMeco.fileSystem.fileLib.File.getUmask(), umask)
+        self.assertEqual(mMeco.fileSystem.fileLib.File.UMASK, umask)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_fingerprintLib.py @brief [ FILE   ] - Tests of mMeco.libs.fingerprintLib module.
+## @package tests.test_fingerprintLib    @brief [ MODULE ] - Tests of mMeco.libs.fingerprintLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  json
+import  os
+import  unittest
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.libs.fingerprintLib.Fingerprint class.
+class FingerprintTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        tests.fixtureLib.FixtureTestCase.setUp(self)
+
+        for version, info in [('1.0.1', True), ('2.0.0', False)]:
+            self.fixture.addPackage('master/internal', 'zeta', version, info=info,
+                                    packageEnv='    envEntryContainer.addSingle(\'ZETA_VERSION\', \'{}\')'.format(version))
+
+    #
+    ## @brief Test that the cache isn't reused after a version becomes valid.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testVersionBecomesValid(self):
+
+        self.resolve()
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '1.0.1')
+
+        self.fixture.write('master/internal/zeta/2.0.0/zeta/python/zeta/packageInfoLib.py', '')
+
+        self.resolve()
+        self.assertNotIn('Cache is up to date', self.fixture.log())
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '2.0.0')
+
+    #
+    ## @brief Test that the cache is reused if nothing changes.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testCacheIsReused(self):
+
+        self.resolve()
+        self.resolve()
+
+        self.assertIn('Cache is up to date', self.fixture.log())
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '1.0.1')
+
+    #
+    ## @brief Test that only package info modules of the used and the invalid versions are kept in the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testVersionModificationTimes(self):
+
+        self.fixture.addPackage('master/internal', 'zeta', '1.0.0')
+
+        self.resolve()
+
+        versionModificationTimes = json.loads(self.fixture.read('out/p1_None_None.cache'))['versionModificationTimes']
+
+        self.assertEqual(sorted(versionModificationTimes.keys()),
+                         [os.path.join(self.fixture.root(), 'master/internal/zeta/{}/zeta/python/zeta/packageInfoLib.py'.format(x)) for x in ['1.0.1', '2.0.0']])
+        self.assertIsNone(versionModificationTimes[os.path.join(self.fixture.root(), 'master/internal/zeta/2.0.0/zeta/python/zeta/packageInfoLib.py')])
+
+    #
+    ## @brief Test that the cache is reused if a version, which isn't used, becomes invalid.
+    #
+    #  Older versions aren't probed, therefore they don't invalidate the cache.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testUnusedVersionBecomesInvalid(self):
+
+        self.fixture.addPackage('master/internal', 'zeta', '1.0.0')
+
+        self.resolve()
+
+        os.remove(os.path.join(self.fixture.root(), 'master/internal/zeta/1.0.0/zeta/python/zeta/packageInfoLib.py'))
+
+        self.resolve()
+        self.assertIn('Cache is up to date', self.fixture.log())
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '1.0.1')
+
+    #
+    ## @brief Test that the script file isn't reused by `--last` flag after a version becomes valid.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testLastVersionBecomesValid(self):
+
+        self.resolve()
+
+        self.fixture.write('master/internal/zeta/2.0.0/zeta/python/zeta/packageInfoLib.py', '')
+
+        self.resolve('-p p1 --last')
+        self.assertIn('Script file is stale', self.fixture.log())
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '2.0.0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_loggerLib.py @brief [ FILE   ] - Tests of mMeco.core.loggerLib module.
+## @package tests.test_loggerLib    @brief [ MODULE ] - Tests of mMeco.core.loggerLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  shutil
+import  tempfile
+import  threading
+import  unittest
+
+import  mMeco.core.loggerLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.core.loggerLib.Logger class.
+class LoggerTest(unittest.TestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self.root = tempfile.mkdtemp(prefix='mMecoTest')
+
+    #
+    ## @brief Tear down.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    #
+    ## @brief Test that logs added from many threads are written once each.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testThreadedWrites(self):
+
+        logFile = os.path.join(self.root, 'meco.log')
+        with open(logFile, 'w') as _file:
+            _file.write('Previous invocation\n')
+
+        logger = mMeco.core.loggerLib.Logger()
+        logger.setFile(logFile)
+
+        def add(index):
+            for count in range(100):
+                logger.addInfo('Thread {} log {}'.format(index, count))
+
+        threads = [threading.Thread(target=add, args=(x,)) for x in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open(logFile) as _file:
+            lines = _file.read().splitlines()
+
+        self.assertEqual(len(lines), 8 * 100)
+        self.assertEqual(sorted(x.split(' - ')[-1] for x in lines),
+                         sorted('Thread {} log {}'.format(x, y) for x in range(8) for y in range(100)))
+
+
+if __name__ == '__main__':
+    unittest.main()
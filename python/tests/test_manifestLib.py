@@ -0,0 +1,89 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_manifestLib.py @brief [ FILE   ] - Tests of mMeco.libs.manifestLib module.
+## @package tests.test_manifestLib    @brief [ MODULE ] - Tests of mMeco.libs.manifestLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  unittest
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.libs.manifestLib.Manifest class.
+class ManifestTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        tests.fixtureLib.FixtureTestCase.setUp(self)
+
+        for version, info in [('1.0.1', True), ('2.0.0', False)]:
+            self.fixture.addPackage('master/internal', 'zeta', version, info=info,
+                                    packageEnv='    envEntryContainer.addSingle(\'ZETA_VERSION\', \'{}\')'.format(version))
+
+    #
+    ## @brief Test that the last script file is reused if nothing changes.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testLastIsReused(self):
+
+        self.resolve()
+        inode = os.stat(os.path.join(self.fixture.root(), 'out', 'p1_None_None.sh')).st_ino
+
+        self.resolve('-p p1 -l')
+        self.assertNotIn('Script file is stale', self.fixture.log())
+        self.assertEqual(os.stat(os.path.join(self.fixture.root(), 'out', 'p1_None_None.sh')).st_ino, inode)
+
+    #
+    ## @brief Test that the last script file isn't reused after a version becomes valid.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testLastVersionBecomesValid(self):
+
+        self.resolve()
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '1.0.1')
+
+        self.fixture.write('master/internal/zeta/2.0.0/zeta/python/zeta/packageInfoLib.py', '')
+
+        self.resolve('-p p1 -l')
+        self.assertIn('Script file is stale', self.fixture.log())
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '2.0.0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_moduleLib.py @brief [ FILE   ] - Tests of mMeco.core.moduleLib module.
+## @package tests.test_moduleLib    @brief [ MODULE ] - Tests of mMeco.core.moduleLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  shutil
+import  sys
+import  tempfile
+import  unittest
+
+import  mMeco.core.moduleLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.core.moduleLib.Module class.
+class ModuleTest(unittest.TestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self.root = tempfile.mkdtemp(prefix='mMecoTest')
+
+    #
+    ## @brief Tear down.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    #
+    ## @brief Write a module named `packageEnvLib.py` into a directory named after given package.
+    #
+    #  @param packageName [ str | None | in  ] - Name of the package.
+    #  @param content     [ str | None | in  ] - Content of the module.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the module file.
+    def write(self, packageName, content):
+
+        os.makedirs(os.path.join(self.root, packageName))
+
+        filePath = os.path.join(self.root, packageName, 'packageEnvLib.py')
+
+        with open(filePath, 'w') as _file:
+            _file.write(content)
+
+        return filePath
+
+    #
+    ## @brief Test that modules with the same file name are loaded and unloaded without changing `sys.path` and `sys.modules`.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testLoadFileAndUnload(self):
+
+        path    = list(sys.path)
+        modules = set(sys.modules.keys())
+
+        alpha   = mMeco.core.moduleLib.Module.loadFile(self.write('alpha', 'NAME = \'alpha\'\n'), 'mMecoTestAlpha')
+        beta    = mMeco.core.moduleLib.Module.loadFile(self.write('beta', 'NAME = \'beta\'\n'), 'mMecoTestBeta')
+
+        self.assertEqual(alpha.NAME, 'alpha')
+        self.assertEqual(beta.NAME, 'beta')
+        self.assertEqual(sys.path, path)
+        self.assertEqual(set(sys.modules.keys()) - modules, set(['mMecoTestAlpha', 'mMecoTestBeta']))
+
+        mMeco.core.moduleLib.Module.unload('mMecoTestAlpha')
+        mMeco.core.moduleLib.Module.unload('mMecoTestBeta')
+
+        self.assertEqual(sys.path, path)
+        self.assertEqual(set(sys.modules.keys()), modules)
+
+    #
+    ## @brief Test that a module, which raises an exception while it's executed, isn't left in `sys.modules`.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testLoadFileFailure(self):
+
+        modules = set(sys.modules.keys())
+
+        self.assertRaises(ZeroDivisionError,
+                          mMeco.core.moduleLib.Module.loadFile, self.write('alpha', '1 / 0\n'), 'mMecoTestAlpha')
+
+        self.assertRaises(IOError,
+                          mMeco.core.moduleLib.Module.loadFile, os.path.join(self.root, 'beta', 'packageEnvLib.py'), 'mMecoTestBeta')
+
+        self.assertEqual(set(sys.modules.keys()), modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_packageEnvCacheLib.py @brief [ FILE   ] - Tests of mMeco.libs.packageEnvCacheLib module.
+## @package tests.test_packageEnvCacheLib    @brief [ MODULE ] - Tests of mMeco.libs.packageEnvCacheLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  unittest
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.libs.packageEnvCacheLib.PackageEnvCache class.
+class PackageEnvCacheTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        tests.fixtureLib.FixtureTestCase.setUp(self)
+
+        for path in ['projects/p2/internal', 'projects/p2/external']:
+            os.makedirs(os.path.join(self.fixture.root(), path))
+
+        ## [ str ] - Absolute path of the file, which a character is appended into each time the package env module is invoked.
+        self.invocationFilePath = os.path.join(self.fixture.root(), 'out', 'invocations')
+
+        self.fixture.addPackage('master/internal', 'zeta', '1.0.0',
+                                packageEnv='    open({!r}, \'a\').write(\'x\')\n'
+                                           '    envEntryContainer.addSingle(\'ZETA_PROJECT\', allLib.request().project())'.format(self.invocationFilePath))
+
+    #
+    ## @brief Get number of the invocations of the package env module.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of the invocations.
+    def getInvocationCount(self):
+
+        with open(self.invocationFilePath, 'r') as _file:
+            return len(_file.read())
+
+    #
+    ## @brief Test that an env entry container is replayed for the same request.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testReplay(self):
+
+        self.resolve('-p p1')
+
+        # Change the env, so that the env is resolved again
+        self.fixture.addPackage('reserved', 'alpha')
+
+        self.resolve('-p p1')
+
+        self.assertNotIn('Cache is up to date', self.fixture.log())
+        self.assertEqual(self.getInvocationCount(), 1)
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_PROJECT'], 'p1')
+
+    #
+    ## @brief Test that an env entry container built for another project isn't replayed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testRequestFields(self):
+
+        self.resolve('-p p1')
+        self.resolve('-p p2')
+
+        self.assertEqual(self.getInvocationCount(), 2)
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_PROJECT'], 'p1')
+        self.assertEqual(self.fixture.source('out/p2_None_None.sh')['ZETA_PROJECT'], 'p2')
+
+    #
+    ## @brief Test that env entry containers built for alternating projects are both replayed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testAlternatingRequests(self):
+
+        self.resolve('-p p1')
+        self.resolve('-p p2')
+
+        # Change the env, so that the env is resolved again
+        self.fixture.addPackage('reserved', 'alpha')
+
+        self.resolve('-p p1')
+        self.resolve('-p p2')
+
+        self.assertEqual(self.getInvocationCount(), 2)
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_PROJECT'], 'p1')
+        self.assertEqual(self.fixture.source('out/p2_None_None.sh')['ZETA_PROJECT'], 'p2')
+
+
+if __name__ == '__main__':
+    unittest.main()
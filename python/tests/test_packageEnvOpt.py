@@ -0,0 +1,170 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_packageEnvOpt.py @brief [ FILE   ] - Tests of mMeco.operators.packageEnvOpt module.
+## @package tests.test_packageEnvOpt    @brief [ MODULE ] - Tests of mMeco.operators.packageEnvOpt module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  json
+import  os
+import  shutil
+import  unittest
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of timing out package env modules.
+class PackageEnvTimeoutTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        tests.fixtureLib.FixtureTestCase.setUp(self)
+
+        self.fixture.addPackage('reserved', 'slow', packageEnv='    import time\n    time.sleep(10)')
+
+    #
+    ## @brief Set timeout policy.
+    #
+    #  @param policy [ str | None | in  ] - Policy from mMeco.libs.enumLib.PackageEnvTimeoutPolicy enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setPolicy(self, policy):
+
+        self.fixture.write('settings/mMecoSettings/settingsLib.py',
+                           self.fixture.read('settings/mMecoSettings/settingsLib.py') +
+                           '\nPACKAGE_ENV_TIMEOUT = 0.2\nPACKAGE_ENV_TIMEOUT_POLICY = {!r}\n'.format(policy))
+
+    #
+    ## @brief Test that the timeout is logged once if the policy fails the execution.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testFail(self):
+
+        self.setPolicy('fail')
+
+        self.fixture.run('-p p1')
+
+        self.assertEqual(self.fixture.log().count('timed out'), 1, self.fixture.log())
+
+    #
+    ## @brief Test that the timeout is logged once if the policy skips the package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSkip(self):
+
+        self.setPolicy('skip')
+
+        self.resolve()
+
+        self.assertEqual(self.fixture.log().count('timed out'), 1, self.fixture.log())
+
+#
+## @brief [ CLASS ] - Tests of package env files.
+class PackageEnvFileTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Add a package, which has given package env file.
+    #
+    #  @param data [ object | None | in  ] - Content of the package env file.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the root of the package.
+    def addPackage(self, data):
+
+        packageRootPath = self.fixture.addPackage('master/internal', 'alpha', '1.0.0')
+
+        self.fixture.write(os.path.join(packageRootPath, 'python', 'alpha', 'packageEnv.json'), json.dumps(data))
+
+        return packageRootPath
+
+    #
+    ## @brief Test that sections and placeholders of a package env file are applied.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testLoad(self):
+
+        packageRootPath = self.addPackage({'multi'      : {'ALPHA_PATH'     : ['{root}/bin/{platformLower}', '{root}/bin'],
+                                                           'ALPHA_PYTHON'   : '{root}/python'},
+                                           'single'     : {'ALPHA_ROOT'     : '{root}',
+                                                           'ALPHA_NAME'     : '{packageName}-{version}-{platform}'},
+                                           'platforms'  : {'Linux'          : {'single': {'ALPHA_LINUX': 'yes'}},
+                                                           'Windows'        : {'single': {'ALPHA_WINDOWS': 'yes'}}}})
+
+        self.resolve()
+
+        env = self.fixture.source('out/p1_None_None.sh')
+
+        self.assertEqual(sorted(env['ALPHA_PATH'].split(os.pathsep)[:2]),
+                         ['{}/bin'.format(packageRootPath), '{}/bin/linux'.format(packageRootPath)])
+        self.assertEqual(env['ALPHA_PYTHON'].split(os.pathsep)[0], '{}/python'.format(packageRootPath))
+        self.assertEqual(env['ALPHA_ROOT'], packageRootPath)
+        self.assertEqual(env['ALPHA_NAME'], 'alpha-1.0.0-Linux')
+        self.assertEqual(env['ALPHA_LINUX'], 'yes')
+        self.assertNotIn('ALPHA_WINDOWS', env)
+
+    #
+    ## @brief Test that values of invalid types are logged as errors with the path of the package env file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testInvalidTypes(self):
+
+        for data in [{'multi': {'ALPHA_PATH': 1}},
+                     {'multi': {'ALPHA_PATH': ['{root}/bin', None]}},
+                     {'single': {'ALPHA_ROOT': ['{root}']}},
+                     {'single': []},
+                     {'scripts': '{root}/setup.sh'},
+                     {'platforms': {'Linux': []}}]:
+
+            packageRootPath = self.addPackage(data)
+
+            self.fixture.run('-p p1 -ic')
+
+            self.assertIn('must be', self.fixture.log(), data)
+            self.assertIn('{}/python/alpha/packageEnv.json'.format(packageRootPath), self.fixture.log(), data)
+
+            shutil.rmtree(os.path.join(self.fixture.root(), 'master', 'internal', 'alpha'))
+            os.remove(os.path.join(self.fixture.root(), 'out', 'meco.log'))
+
+
+if __name__ == '__main__':
+    unittest.main()
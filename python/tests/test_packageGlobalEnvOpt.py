@@ -0,0 +1,105 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_packageGlobalEnvOpt.py @brief [ FILE   ] - Tests of mMeco.operators.packageGlobalEnvOpt module.
+## @package tests.test_packageGlobalEnvOpt    @brief [ MODULE ] - Tests of mMeco.operators.packageGlobalEnvOpt module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  shutil
+import  tempfile
+import  unittest
+
+import  mMeco.libs.statCacheLib
+import  mMeco.operators.packageGlobalEnvOpt
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnvRules class.
+class PackageGlobalEnvRulesTest(unittest.TestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        self.root = tempfile.mkdtemp(prefix='mMecoTest')
+
+        for path in ['Bin', os.path.join('Python', 'Lib'), 'icons']:
+            os.makedirs(os.path.join(self.root, path))
+
+        ## [ mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnv ] - Package global env.
+        self.packageGlobalEnv = mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnv('Maya')
+        self.packageGlobalEnv.addAttribute('PATH', ['bin'])
+        self.packageGlobalEnv.addAttribute('PYTHONPATH', ['python/lib'])
+        self.packageGlobalEnv.addAttribute('XBMLANGPATH', ['icons'])
+
+    #
+    ## @brief Tear down.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def tearDown(self):
+
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    #
+    ## @brief Test that directories are matched by their exact names on case-sensitive file systems.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testCaseSensitive(self):
+
+        rules = mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnvRules(self.packageGlobalEnv, isCaseSensitive=True)
+
+        self.assertEqual(rules.match(self.root, mMeco.libs.statCacheLib.StatCache()),
+                         [('XBMLANGPATH', os.path.join(self.root, 'icons'))])
+
+    #
+    ## @brief Test that directories are matched regardless of the case of their names on case-insensitive file systems.
+    #
+    #  Nested relative paths are checked by stat, which is case-sensitive on this file system, therefore only
+    #  the first components are asserted to be matched case-insensitively.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testCaseInsensitive(self):
+
+        rules = mMeco.operators.packageGlobalEnvOpt.PackageGlobalEnvRules(self.packageGlobalEnv, isCaseSensitive=False)
+
+        self.assertEqual(rules.match(self.root, mMeco.libs.statCacheLib.StatCache()),
+                         [('PATH', os.path.join(self.root, 'bin')),
+                          ('XBMLANGPATH', os.path.join(self.root, 'icons'))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_packageIndexLib.py @brief [ FILE   ] - Tests of mMeco.libs.packageIndexLib module.
+## @package tests.test_packageIndexLib    @brief [ MODULE ] - Tests of mMeco.libs.packageIndexLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  unittest
+
+import  mMeco.libs.packageIndexLib
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.libs.packageIndexLib.PackageIndex class.
+class PackageIndexTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Test that a non-versioned package becomes invalid after its package info module is removed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testNonVersionedPackageBecomesInvalid(self):
+
+        self.fixture.addPackage('reserved', 'alpha', packageEnv='    envEntryContainer.addSingle(\'ALPHA\', \'1\')')
+
+        self.resolve()
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh').get('ALPHA'), '1')
+
+        os.remove(os.path.join(self.fixture.root(), 'reserved', 'alpha', 'python', 'alpha', 'packageInfoLib.py'))
+
+        self.resolve()
+        self.assertNotIn('ALPHA', self.fixture.source('out/p1_None_None.sh'))
+
+    #
+    ## @brief Test that a version becomes invalid after its package info module is removed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testVersionBecomesInvalid(self):
+
+        for version in ['1.0.1', '2.0.0']:
+            self.fixture.addPackage('master/internal', 'zeta', version,
+                                    packageEnv='    envEntryContainer.addSingle(\'ZETA_VERSION\', \'{}\')'.format(version))
+
+        self.resolve()
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '2.0.0')
+
+        os.remove(os.path.join(self.fixture.root(), 'master', 'internal', 'zeta', '2.0.0', 'zeta', 'python', 'zeta', 'packageInfoLib.py'))
+
+        self.resolve()
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '1.0.1')
+
+    #
+    ## @brief Test that results of the probes aren't written into the index file and entries, which are not directories, aren't probed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testProbesAreNotStored(self):
+
+        for version in ['1.0.0', '2.0.0']:
+            self.fixture.addPackage('master/internal', 'zeta', version)
+
+        self.fixture.write('master/internal/zeta/notes.txt', '')
+
+        path            = os.path.join(self.fixture.root(), 'master', 'internal')
+        indexFilePath   = os.path.join(self.fixture.root(), 'out', 'index.json')
+
+        packageIndex = mMeco.libs.packageIndexLib.PackageIndex(path, True, indexFilePath)
+        packageIndex.refresh()
+
+        index = self.fixture.read(indexFilePath)
+
+        self.assertTrue(packageIndex.hasPackageInfo('zeta', '1.0.0'))
+        self.assertTrue(packageIndex.hasPackageInfo('zeta', '2.0.0'))
+
+        statCount = packageIndex.scanner().counters()['stat']
+
+        self.assertFalse(packageIndex.hasPackageInfo('zeta', 'notes.txt'))
+        self.assertFalse(packageIndex.hasPackageInfo('zeta', '3.0.0'))
+        self.assertEqual(packageIndex.scanner().counters()['stat'], statCount)
+
+        packageIndex.flush()
+
+        self.assertEqual(self.fixture.read(indexFilePath), index)
+
+
+if __name__ == '__main__':
+    unittest.main()
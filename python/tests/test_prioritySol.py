@@ -0,0 +1,97 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_prioritySol.py @brief [ FILE   ] - Tests of mMeco.solvers.prioritySol module.
+## @package tests.test_prioritySol    @brief [ MODULE ] - Tests of mMeco.solvers.prioritySol module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  unittest
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.solvers.prioritySol.Solver class.
+class PrioritySolverTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Set up.
+    #
+    #  Each env path has more packages than mMeco.libs.packageIndexLib.PackageIndex.PARALLEL_SCAN_THRESHOLD,
+    #  so that package directories are scanned concurrently as well. Packages are shared between the env paths,
+    #  so that the result depends on the priority of the env paths.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        tests.fixtureLib.FixtureTestCase.setUp(self)
+
+        for index in range(24):
+
+            name = 'package{}'.format(index)
+
+            for envPath in ['reserved', 'development/d1']:
+                if index % 2:
+                    self.fixture.addPackage(envPath, name,
+                                            packageEnv='    envEntryContainer.addSingle(\'{}\', \'{}\')'.format(name.upper(), envPath))
+
+            for envPath in ['projects/p1/internal', 'projects/p1/external', 'master/internal', 'master/external']:
+                for version in sorted(set(['1.0.0', '1.{}.0'.format(index)])):
+                    self.fixture.addPackage(envPath, name, version,
+                                            packageEnv='    envEntryContainer.addMulti(\'{}_PATH\', \'{}/{}\')'.format(name.upper(),
+                                                                                                                 envPath,
+                                                                                                                 version))
+
+    #
+    ## @brief Test that env paths listed concurrently result in the same script file as they're listed one after another.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testConcurrentListing(self):
+
+        self.resolve('-p p1 -de d1 -ic')
+
+        script = self.fixture.read('out/p1_d1_None.sh')
+
+        self.fixture.write('settings/mMecoSettings/settingsLib.py',
+                           self.fixture.read('settings/mMecoSettings/settingsLib.py') + '\nSCAN_MAX_WORKERS = 1\n')
+
+        self.resolve('-p p1 -de d1 -ic')
+
+        self.assertEqual(self.fixture.read('out/p1_d1_None.sh'), script)
+        env = self.fixture.source('out/p1_d1_None.sh')
+
+        self.assertEqual([x for x in env['PACKAGE2_PATH'].split(':') if x],
+                         ['projects/p1/external/1.2.0', 'projects/p1/internal/1.2.0'])
+        self.assertEqual(env['PACKAGE1'], 'development/d1')
+        self.assertNotIn('PACKAGE1_PATH', env)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_standardBld.py @brief [ FILE   ] - Tests of mMeco.builders.standardBld module.
+## @package tests.test_standardBld    @brief [ MODULE ] - Tests of mMeco.builders.standardBld module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  unittest
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.builders.standardBld.Builder class.
+class StandardBuilderTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Set up.
+    #
+    #  Package env modules sleep for different durations, so that packages built in threads finish in another
+    #  order than they're started.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        tests.fixtureLib.FixtureTestCase.setUp(self)
+
+        for index in range(12):
+
+            name        = 'package{}'.format(index)
+            packageEnv  = '    import time\n' \
+                          '    time.sleep({})\n' \
+                          '    envEntryContainer.addMulti(\'SHARED_PATH\', \'{}\')\n' \
+                          '    envEntryContainer.addSingle(\'{}_ROOT\', envEntryContainer.getPackageRootPath())\n' \
+                          '    envEntryContainer.addCommand(\'true {}\')'.format((12 - index) * 0.01, name, name.upper(), name)
+
+            self.fixture.addPackage('reserved' if index % 2 else 'master/internal',
+                                    name,
+                                    None if index % 2 else '1.0.0',
+                                    packageEnv=packageEnv)
+
+    #
+    ## @brief Test that packages built in threads result in the same cache file and script file as they're built one after another.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testBuildWorkers(self):
+
+        self.resolve('-p p1 -ic -cw')
+
+        script  = self.fixture.read('out/p1_None_None.sh')
+        cache   = self.fixture.read('out/p1_None_None.cache')
+
+        self.resolve('-p p1 -ic -cw -bw 8')
+
+        self.assertEqual(self.fixture.read('out/p1_None_None.sh'), script)
+        self.assertEqual(self.fixture.read('out/p1_None_None.cache'), cache)
+        self.assertEqual(sorted([x for x in self.fixture.source('out/p1_None_None.sh')['SHARED_PATH'].split(':') if x]),
+                         sorted(['package{}'.format(x) for x in range(12)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
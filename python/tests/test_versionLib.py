@@ -0,0 +1,150 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_versionLib.py @brief [ FILE   ] - Tests of mMeco.fileSystem.versionLib module.
+## @package tests.test_versionLib    @brief [ MODULE ] - Tests of mMeco.fileSystem.versionLib module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  unittest
+
+import  mMeco.fileSystem.versionLib
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of mMeco.fileSystem.versionLib.SemanticVersion class.
+class SemanticVersionTest(unittest.TestCase):
+    #
+    ## @brief Test sorting.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSort(self):
+
+        versions = ['1.10.0', 'dev', '1.2.0', '1.10.0-rc.1', '1.2', '1.10.0+build.1', '1.10.0-alpha', '1.10.0-1', 'v1.3.0']
+
+        self.assertEqual(mMeco.fileSystem.versionLib.SemanticVersion.sort(versions),
+                         ['dev', '1.2', '1.2.0', 'v1.3.0', '1.10.0-1', '1.10.0-alpha', '1.10.0-rc.1', '1.10.0', '1.10.0+build.1'])
+
+    #
+    ## @brief Test that release numbers are sorted like the list of ints.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSortReleases(self):
+
+        versions = ['{}.{}.{}'.format(x % 3, x % 11, x % 7) for x in range(200)] + ['1.2', '1', '1.2.3.4']
+
+        self.assertEqual(mMeco.fileSystem.versionLib.SemanticVersion.sort(versions),
+                         sorted(versions, key=lambda x: [int(y) for y in x.split('.')]))
+
+    #
+    ## @brief Test that pre-release versions are selected only if there is no release version.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testReleaseSortKey(self):
+
+        getReleaseSortKey = mMeco.fileSystem.versionLib.SemanticVersion.getReleaseSortKey
+
+        self.assertEqual(max(['1.0.10', '1.1.0-rc.1', 'dev'], key=getReleaseSortKey), '1.0.10')
+        self.assertEqual(max(['1.1.0-rc.1', '1.1.0-rc.2', 'dev'], key=getReleaseSortKey), '1.1.0-rc.2')
+        self.assertEqual(max(['dev'], key=getReleaseSortKey), 'dev')
+
+    #
+    ## @brief Test instances.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testInstance(self):
+
+        version = mMeco.fileSystem.versionLib.SemanticVersion.get('1.2.3-rc.1+build.5')
+
+        self.assertIs(version, mMeco.fileSystem.versionLib.SemanticVersion.get('1.2.3-rc.1+build.5'))
+        self.assertEqual(version.release(), (1, 2, 3))
+        self.assertEqual(version.preRelease(), ('rc', '1'))
+        self.assertEqual(version.build(), 'build.5')
+        self.assertTrue(version.isPreRelease())
+        self.assertFalse(mMeco.fileSystem.versionLib.SemanticVersion.get('dev').isValid())
+        self.assertLess(version, mMeco.fileSystem.versionLib.SemanticVersion.get('1.2.3'))
+
+#
+## @brief [ CLASS ] - Tests of selecting the newest version of a package.
+class NewestVersionTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Set up.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setUp(self):
+
+        tests.fixtureLib.FixtureTestCase.setUp(self)
+
+        for version in ['1.0.9', '1.0.10', '1.1.0-rc.1']:
+            self.fixture.addPackage('master/internal', 'zeta', version,
+                                    packageEnv='    envEntryContainer.addSingle(\'ZETA_VERSION\', \'{}\')'.format(version))
+
+    #
+    ## @brief Test that the newest release version is selected.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testNewestRelease(self):
+
+        for newestVersionOnly in [True, False]:
+            self.fixture.write('settings/mMecoSettings/settingsLib.py',
+                               self.fixture.read('settings/mMecoSettings/settingsLib.py') +
+                               '\nNEWEST_VERSION_ONLY = {}\n'.format(newestVersionOnly))
+
+            self.resolve('-p p1 -ic')
+            self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '1.0.10')
+
+    #
+    ## @brief Test that a pre-release version is selected if pre-release versions are included.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testNewestPreRelease(self):
+
+        self.fixture.write('settings/mMecoSettings/settingsLib.py',
+                           self.fixture.read('settings/mMecoSettings/settingsLib.py') +
+                           '\nNEWEST_VERSION_INCLUDES_PRE_RELEASES = True\n')
+
+        self.resolve('-p p1 -ic')
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['ZETA_VERSION'], '1.1.0-rc.1')
+
+
+if __name__ == '__main__':
+    unittest.main()
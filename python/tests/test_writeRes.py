@@ -0,0 +1,286 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    tests/test_writeRes.py @brief [ FILE   ] - Tests of mMeco.responses.writeRes module.
+## @package tests.test_writeRes    @brief [ MODULE ] - Tests of mMeco.responses.writeRes module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  re
+import  threading
+import  time
+import  unittest
+
+import  tests.fixtureLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Tests of writing multi envs.
+class MultiEnvTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Test that a single env sees the multi envs added before it.
+    #
+    #  Entries of a package are sorted by their variables, therefore `SAVED_PATH` is added after `MY_PATH`.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSingleReferencesMulti(self):
+
+        self.fixture.addPackage('reserved', 'alpha', packageEnv='    envEntryContainer.addMulti(\'MY_PATH\', \'/a\')\n'
+                                                               '    envEntryContainer.addSingle(\'SAVED_PATH\', \'$MY_PATH\')\n'
+                                                               '    envEntryContainer.addMulti(\'MY_PATH\', \'/b\')')
+
+        self.resolve()
+
+        env = self.fixture.source('out/p1_None_None.sh')
+
+        self.assertEqual(env['MY_PATH'], '/b:/a:')
+        self.assertEqual(env['SAVED_PATH'], '/b:/a:')
+
+    #
+    ## @brief Test that a multi env, which references a variable, sees only the multi envs added before it.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testMultiReferencesMulti(self):
+
+        self.fixture.addPackage('reserved', 'alpha', packageEnv='    envEntryContainer.addMulti(\'MY_A\', \'1\')')
+        self.fixture.addPackage('reserved', 'beta' , packageEnv='    envEntryContainer.addMulti(\'MY_B\', \'$MY_A\')')
+        self.fixture.addPackage('reserved', 'gamma', packageEnv='    envEntryContainer.addMulti(\'MY_A\', \'2\')')
+
+        self.resolve()
+
+        env = self.fixture.source('out/p1_None_None.sh')
+
+        self.assertEqual(env['MY_A'], '2:1:')
+        self.assertEqual(env['MY_B'], '1::')
+
+    #
+    ## @brief Test that a single env of another variable doesn't write the pending multi envs.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSingleKeepsMultiPending(self):
+
+        self.fixture.addPackage('reserved', 'alpha', packageEnv='    envEntryContainer.addMulti(\'MY_PATH\', \'/a\')\n'
+                                                               '    envEntryContainer.addSingle(\'ALPHA_ROOT\', \'/alpha\')')
+        self.fixture.addPackage('reserved', 'beta' , packageEnv='    envEntryContainer.addMulti(\'MY_PATH\', \'/b\')\n'
+                                                               '    envEntryContainer.addSingle(\'BETA_ROOT\', \'/beta\')')
+
+        self.resolve()
+
+        self.assertEqual(self.fixture.read('out/p1_None_None.sh').count('export MY_PATH='), 1)
+
+        env = self.fixture.source('out/p1_None_None.sh')
+
+        self.assertEqual(env['MY_PATH'], '/b:/a:')
+        self.assertEqual(env['BETA_ROOT'], '/beta')
+
+    #
+    ## @brief Test that a single env overrides the pending multi envs of its variable.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testSingleOverridesMulti(self):
+
+        self.fixture.addPackage('reserved', 'alpha', packageEnv='    envEntryContainer.addMulti(\'MY_PATH\', \'/a\')')
+        self.fixture.addPackage('reserved', 'beta' , packageEnv='    envEntryContainer.addSingle(\'MY_PATH\', \'/s\')')
+
+        self.resolve()
+
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['MY_PATH'], '/s')
+
+
+#
+## @brief [ CLASS ] - Tests of writing script files.
+class ScriptFileTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Get arguments of tests.fixtureLib.Fixture class.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Arguments.
+    def getFixtureArguments(self):
+
+        return {'settings':'SCRIPT_STORE_MAX_AGE = 3600\n'
+                           'def getScriptStorePath(platform):\n    return os.path.join(ROOT, \'store\')\n'}
+
+    #
+    ## @brief Test that the temporary script file is removed if storing the script file fails.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testStoreFails(self):
+
+        runner = ('import mMeco.responses.writeRes\n'
+                  'def getContentHash(path):\n'
+                  '    raise IOError(\'Hash failed\')\n'
+                  'mMeco.responses.writeRes.Response.getContentHash = staticmethod(getContentHash)\n') + tests.fixtureLib.RUNNER
+
+        self.fixture.run('-p p1', runner)
+
+        self.assertEqual([x for x in os.listdir(os.path.join(self.fixture.root(), 'store')) if x.startswith('.')], [])
+
+    #
+    ## @brief Test that the temporary script file is removed if rendering fails.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testRenderFails(self):
+
+        runner = ('import mMeco.responses.writeRes\n'
+                  'def render(self):\n'
+                  '    raise OSError(\'Render failed\')\n'
+                  'mMeco.responses.writeRes.Response._render = render\n') + tests.fixtureLib.RUNNER
+
+        self.fixture.run('-p p1', runner)
+
+        self.assertEqual([x for x in os.listdir(os.path.join(self.fixture.root(), 'store')) if x.startswith('.')], [])
+
+    #
+    ## @brief Test that the script file links to the stored script file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testStore(self):
+
+        self.resolve()
+
+        self.assertEqual(os.path.dirname(os.path.realpath(os.path.join(self.fixture.root(), 'out', 'p1_None_None.sh'))),
+                         os.path.join(self.fixture.root(), 'store'))
+        self.assertEqual(self.fixture.source('out/p1_None_None.sh')['MECO_ES_VERSION'], '1')
+
+    #
+    ## @brief Test that a stored script file, which doesn't match the new script file, is replaced.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testStoreTruncated(self):
+
+        self.resolve()
+
+        storeFilePath = os.path.realpath(os.path.join(self.fixture.root(), 'out', 'p1_None_None.sh'))
+        content       = self.fixture.read(storeFilePath)
+
+        with open(storeFilePath, 'w') as _file:
+            _file.write(content[:len(content) // 2])
+
+        self.resolve('-p p1 -ic')
+
+        self.assertEqual(os.path.realpath(os.path.join(self.fixture.root(), 'out', 'p1_None_None.sh')), storeFilePath)
+        self.assertEqual(self.fixture.read(storeFilePath), content)
+
+    #
+    ## @brief Test that stored script files, which haven't been used for the maximum age, are removed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testPruneStore(self):
+
+        self.resolve()
+
+        storeFilePath    = os.path.realpath(os.path.join(self.fixture.root(), 'out', 'p1_None_None.sh'))
+        oldStoreFilePath = os.path.join(self.fixture.root(), 'store', 'old.sh')
+        newStoreFilePath = os.path.join(self.fixture.root(), 'store', 'new.sh')
+
+        self.fixture.write('store/old.sh', 'export OLD=1\n')
+        self.fixture.write('store/new.sh', 'export NEW=1\n')
+
+        os.utime(oldStoreFilePath, (os.path.getatime(oldStoreFilePath), os.path.getmtime(oldStoreFilePath) - 7200))
+        os.utime(storeFilePath, (os.path.getatime(storeFilePath), os.path.getmtime(storeFilePath) - 1800))
+
+        self.resolve('-p p1 -ic')
+
+        self.assertFalse(os.path.exists(oldStoreFilePath))
+        self.assertTrue(os.path.isfile(newStoreFilePath))
+        self.assertTrue(os.path.isfile(storeFilePath))
+        self.assertGreater(os.path.getmtime(storeFilePath), time.time() - 60)
+
+#
+## @brief [ CLASS ] - Tests of concurrent invocations.
+class ConcurrencyTest(tests.fixtureLib.FixtureTestCase):
+    #
+    ## @brief Test that concurrent invocations with the same settings write complete script and log files.
+    #
+    #  Each invocation discards the log file of the previous invocations and adds logs to it.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def testConcurrentWrites(self):
+
+        self.fixture.addPackage('reserved', 'alpha', packageEnv='    envEntryContainer.addMulti(\'MY_PATH\', \'/a\')\n'
+                                                               '    envEntryContainer.addSingle(\'MY_NAME\', \'alpha\')')
+
+        runner = ('import mMeco.core.loggerLib\n'
+                  'setFile = mMeco.core.loggerLib.Logger.setFile\n'
+                  'def loggingSetFile(self, logFile, discardExisting=True):\n'
+                  '    setFile(self, logFile, discardExisting)\n'
+                  '    for index in range(20):\n'
+                  '        self.addInfo(\'Log {}\'.format(index))\n'
+                  'mMeco.core.loggerLib.Logger.setFile = loggingSetFile\n') + tests.fixtureLib.RUNNER
+
+        results = [None] * 50
+
+        def run(index):
+            results[index] = self.fixture.run('-p p1 -ic', runner)
+
+        threads = [threading.Thread(target=run, args=(x,)) for x in range(len(results))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for returnCode, output in results:
+            self.assertEqual(returnCode, 0, output)
+            self.assertIn('RESULT /', output, output)
+
+        self.assertEqual([x for x in os.listdir(os.path.join(self.fixture.root(), 'out')) if x.startswith('.')], [])
+
+        env = self.fixture.source('out/p1_None_None.sh')
+
+        self.assertEqual(env['MY_PATH'], '/a:')
+        self.assertEqual(env['MY_NAME'], 'alpha')
+
+        lines = self.fixture.log().splitlines()
+
+        self.assertTrue(lines)
+        for line in lines:
+            self.assertIsNotNone(re.match(r'^INFO - .* - INFO - Log \d+$', line), line)
+
+
+if __name__ == '__main__':
+    unittest.main()
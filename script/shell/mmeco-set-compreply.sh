@@ -326,6 +326,9 @@ function _mMecoSetCompreplyMain()
 
     parameters="$parameters -cw     --cache-write";
     parameters="$parameters -cr     --cache-read";
+    parameters="$parameters -ic     --ignore-cache";
+    parameters="$parameters -bw     --build-workers";
+    parameters="$parameters -df     --data-format";
 
     COMPREPLY=()
     previous="${COMP_WORDS[COMP_CWORD-1]}"
@@ -375,6 +378,11 @@ function _mMecoSetCompreplyMain()
 
         COMPREPLY=( $(compgen -W "$appNames" -- "$current") )
 
+    # DATA FORMAT
+    elif [[ "$previous" == "-df" ]] || [[ "$previous" == "--data-format" ]]; then
+
+        COMPREPLY=( $(compgen -W "json env" -- "$current") )
+
     else
 
         case "$current" in